@@ -7,5 +7,9 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 # 프로젝트 루트의 .env 로드 (backend/app/__init__.py -> 루트는 parent.parent.parent)
-_root_dir = Path(__file__).resolve().parent.parent.parent
-load_dotenv(_root_dir / ".env")
+# __file__은 이미 절대 경로이므로 resolve()의 심볼릭 링크 탐색 없이 계산하고,
+# .env가 없으면 load_dotenv 호출 자체를 건너뛴다.
+_root_dir = Path(__file__).parent.parent.parent
+_env_file = _root_dir / ".env"
+if _env_file.is_file():
+    load_dotenv(_env_file)
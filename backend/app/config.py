@@ -3,7 +3,9 @@ Application configuration management
 """
 import os
 import json
-from typing import Dict, Any, Optional, List
+import functools
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List, Tuple
 from pathlib import Path
 import logging
 
@@ -70,15 +72,21 @@ class Config:
         str(Path(__file__).parent.parent / "config" / "stocks.json")
     )
     
-    _stock_config_cache: Optional[Dict[str, Any]] = None
+    # 로드된 설정은 종목별 항목까지 읽기 전용 뷰(MappingProxyType, 리스트는 tuple)로 보관해
+    # 호출자가 캐시를 오염시키지 못하게 한다.
+    # 수정이 필요하면 stocks_manager.load_stocks()가 돌려주는 복사본을 사용한다.
+    _stock_config_cache: Optional[Mapping[str, Any]] = None
+    # 마지막으로 파싱한 stocks.json의 (경로, mtime_ns, size) 서명.
+    # reload_stock_config() 시 파일이 그대로면 json.load를 건너뛰고 stat() 한 번으로 끝낸다.
+    _stock_config_signature: Optional[Tuple[str, int, int]] = None
     
     @classmethod
-    def get_stock_config(cls) -> Dict[str, Any]:
+    def get_stock_config(cls) -> Mapping[str, Any]:
         """
         Get stock configuration from JSON file
         
         Returns:
-            Dict[str, Any]: Stock configuration with ticker as key
+            Mapping[str, Any]: Read-only stock configuration with ticker as key
             
         Example:
             {
@@ -102,12 +110,15 @@ class Config:
                 logger.error(f"Stock config file not found: {config_path}")
                 return cls._get_fallback_config()
             
+            stat = config_path.stat()
             with open(config_path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
             
             logger.debug(f"Loaded {len(config)} stocks from {config_path}")
-            cls._stock_config_cache = config
-            return config
+            cls._stock_config_cache = _freeze_stock_config(config)
+            cls._stock_config_signature = (str(config_path), stat.st_mtime_ns, stat.st_size)
+            _clear_stock_accessor_caches()
+            return cls._stock_config_cache
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse stock config JSON: {e}")
@@ -117,13 +128,13 @@ class Config:
             return cls._get_fallback_config()
     
     @classmethod
-    def _get_fallback_config(cls) -> Dict[str, Any]:
+    def _get_fallback_config(cls) -> Mapping[str, Any]:
         """
         Fallback default configuration
         Used when stock config file is not available
         """
         logger.warning("Using fallback stock configuration")
-        return {
+        return _freeze_stock_config({
             "487240": {
                 "name": "삼성 KODEX AI전력핵심설비 ETF",
                 "type": "ETF",
@@ -178,10 +189,10 @@ class Config:
                 "search_keyword": "두산에너빌리티",
                 "relevance_keywords": ["두산에너빌리티", "원자력", "에너지"]
             }
-        }
+        })
     
     @classmethod
-    def get_stock_info(cls, ticker: str) -> Optional[Dict[str, Any]]:
+    def get_stock_info(cls, ticker: str) -> Optional[Mapping[str, Any]]:
         """
         Get specific stock information
         
@@ -189,10 +200,12 @@ class Config:
             ticker: Stock ticker code (e.g., "487240")
             
         Returns:
-            Dict with stock info or None if not found
+            Read-only mapping with stock info or None if not found
         """
-        config = cls.get_stock_config()
-        return config.get(ticker)
+        if cls._stock_config_cache is None:
+            # 캐시가 비워졌으면 다시 로드 (새로 파싱되면 파생 캐시도 함께 무효화됨)
+            cls.get_stock_config()
+        return _stock_info_cached(ticker)
     
     @classmethod
     def get_all_tickers(cls) -> List[str]:
@@ -202,14 +215,60 @@ class Config:
         Returns:
             List of ticker codes
         """
-        config = cls.get_stock_config()
-        return list(config.keys())
+        if cls._stock_config_cache is None:
+            cls.get_stock_config()
+        return list(_all_tickers_tuple())
     
     @classmethod
     def reload_stock_config(cls):
         """
         Reload stock configuration from file
         Useful when config file is updated
+
+        파일의 mtime/size가 마지막 로드 시점과 같으면 재파싱 없이 캐시를 그대로 반환한다.
+        mtime 비교는 외부에서 파일을 직접 수정한 경우를 감지하는 용도이며,
+        프로세스 내 저장(stocks_manager.save_stocks)은 시그니처를 비워 항상 재파싱되게 한다.
         """
+        if cls._stock_config_cache is not None and cls._stock_config_signature is not None:
+            try:
+                config_path = Path(cls.STOCK_CONFIG_PATH)
+                stat = config_path.stat()
+                if cls._stock_config_signature == (str(config_path), stat.st_mtime_ns, stat.st_size):
+                    logger.debug(f"Stock config unchanged, skipping reload: {config_path}")
+                    return cls._stock_config_cache
+            except OSError:
+                pass
+
         cls._stock_config_cache = None
+        cls._stock_config_signature = None
+        _clear_stock_accessor_caches()
         return cls.get_stock_config()
+
+
+@functools.cache
+def _all_tickers_tuple() -> Tuple[str, ...]:
+    """설정된 종목 코드 튜플 (stocks.json이 다시 로드될 때까지 캐시)"""
+    return tuple(Config.get_stock_config().keys())
+
+
+@functools.lru_cache(maxsize=1024)
+def _stock_info_cached(ticker: str) -> Optional[Mapping[str, Any]]:
+    """종목별 설정 조회 결과 캐시 (임의 ticker 요청으로 무한히 커지지 않도록 크기 제한)"""
+    return Config.get_stock_config().get(ticker)
+
+
+def _freeze_stock_config(config: Dict[str, Any]) -> Mapping[str, Any]:
+    """종목 설정을 종목별 항목까지 읽기 전용으로 변환 (dict → MappingProxyType, list → tuple)"""
+    return MappingProxyType({
+        ticker: MappingProxyType({
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in info.items()
+        })
+        for ticker, info in config.items()
+    })
+
+
+def _clear_stock_accessor_caches() -> None:
+    """stocks.json이 새로 로드되면 get_all_tickers/get_stock_info 캐시를 비운다"""
+    _all_tickers_tuple.cache_clear()
+    _stock_info_cached.cache_clear()
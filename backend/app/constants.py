@@ -14,6 +14,8 @@ and improve code maintainability.
 - 버그 감소: 같은 값을 여러 곳에 입력하다 실수하는 것을 방지
 """
 
+from types import MappingProxyType
+
 # =============================================================================
 # 날짜 및 시간 관련 상수
 # =============================================================================
@@ -313,6 +315,7 @@ CACHE_TTL_FAST_CHANGING = 30  # 30초
 - GET /api/etfs/{ticker}/prices (가격 데이터)
 - GET /api/etfs/{ticker}/trading-flow (매매동향)
 - POST /api/etfs/batch-summary (배치 요약)
+- /api/data/stats의 SQLite 파일 크기 (db_size)
 
 왜 30초인가?
 - 실시간 가격 데이터는 자주 변경됨
@@ -340,7 +343,6 @@ CACHE_TTL_STATUS = 10  # 10초
 상태 정보 캐시 TTL (10초)
 
 적용 대상:
-- GET /api/data/status (수집 상태)
 - GET /api/data/scheduler-status (스케줄러 상태)
 
 왜 10초인가?
@@ -349,15 +351,74 @@ CACHE_TTL_STATUS = 10  # 10초
 - 짧은 TTL로 최신 상태 반영
 """
 
-CACHE_TTL_STATS = 60  # 1분
+CACHE_TTL_INVALIDATION = 24 * 3600  # 24시간
 """
-통계 정보 캐시 TTL (1분 = 60초)
+쓰기 시점 무효화 전용 캐시 TTL (24시간)
 
 적용 대상:
+- GET /api/data/status (수집 상태)
 - GET /api/data/stats (전체 통계)
 
-왜 1분인가?
-- 통계는 즉시 변경되지 않음
-- 복잡한 집계 쿼리이므로 긴 TTL로 성능 향상
-- 1분마다 갱신되어도 충분
+왜 24시간인가?
+- 데이터가 바뀌는 경로(수집/백필/초기화, 조회 시 자동 수집, 스케줄러 수집, 종목 추가/삭제)에서
+  invalidate_data_summary_cache()로 즉시 무효화하므로 TTL은 안전망 역할만 함
+- 짧은 TTL로 10초/1분마다 만료되어 집계 쿼리가 다시 몰리는 것을 방지
+
+스케줄러 상태(scheduler_status)는 실행 여부/다음 실행 시각이 시간에 따라 바뀌므로 CACHE_TTL_STATUS 유지
+"""
+
+CACHE_TTL_BY_ENDPOINT = MappingProxyType({
+    "etfs": CACHE_TTL_STATIC,
+    "etf": CACHE_TTL_STATIC,
+    "prices": CACHE_TTL_FAST_CHANGING,
+    "trading_flow": CACHE_TTL_FAST_CHANGING,
+    "batch_summary": CACHE_TTL_FAST_CHANGING,
+    "intraday": CACHE_TTL_FAST_CHANGING,
+    "alert_rules": CACHE_TTL_FAST_CHANGING,
+    "db_size": CACHE_TTL_FAST_CHANGING,
+    "news": CACHE_TTL_SLOW_CHANGING,
+    "metrics": CACHE_TTL_SLOW_CHANGING,
+    "insights": CACHE_TTL_SLOW_CHANGING,
+    "compare": CACHE_TTL_SLOW_CHANGING,
+    "status": CACHE_TTL_INVALIDATION,
+    "scheduler_status": CACHE_TTL_STATUS,
+    "stats": CACHE_TTL_INVALIDATION,
+})
+"""
+캐시 키 엔드포인트 태그(make_cache_key의 첫 인자) → TTL(초) 매핑
+
+용도:
+- 라우터는 개별 TTL 상수 대신 태그로 조회: CACHE_TTL_BY_ENDPOINT["prices"]
+- 엔드포인트별 TTL 정책을 한 곳에서 확인/변경
+- MappingProxyType으로 읽기 전용 (런타임에 실수로 TTL을 바꾸는 것 방지)
+"""
+
+RESPONSE_CACHE_TTL_BY_PREFIX = MappingProxyType({
+    "/api/etfs": CACHE_TTL_FAST_CHANGING,
+    "/api/news": CACHE_TTL_SLOW_CHANGING,
+    "/api/data": CACHE_TTL_STATUS,
+})
+"""
+GET 응답 캐시 미들웨어의 경로 prefix → TTL(초) 매핑
+
+용도:
+- 직렬화가 끝난 응답 바디를 그대로 재사용 (라우팅/검증/JSON 직렬화 생략)
+- 라우터 캐시(CACHE_TTL_BY_ENDPOINT)보다 길지 않게 잡아 최신성 손실을 늘리지 않음
+- 여기에 없는 prefix(settings, alerts 등)는 캐시하지 않음
+"""
+
+RESPONSE_CACHE_EXCLUDED_PATHS = frozenset({
+    "/api/data/collect-progress",
+    "/api/data/cache/stats",
+})
+"""
+응답 캐시에서 제외할 경로 (진행률 폴링, 캐시 통계 등 매 요청 최신 값이 필요한 엔드포인트)
+"""
+
+RESPONSE_CACHE_STALE_SECONDS = 300  # 5분
+"""
+응답 캐시 stale 보관 시간 (5분 = 300초)
+
+TTL이 지난 응답을 이 시간 동안 더 보관했다가, 핸들러가 예외로 실패하면
+마지막 정상 응답을 대신 반환 (stale-if-error). 정상 처리되면 새 응답으로 교체.
 """
@@ -1,11 +1,16 @@
+import functools
 import sqlite3
 from pathlib import Path
 import logging
 import os
 from contextlib import contextmanager
-from threading import Lock
-from queue import Queue, Empty
+from collections import deque
+from datetime import datetime
+from itertools import groupby, islice
+from threading import Condition, local
+from typing import Optional
 from app.config import Config
+from app.exceptions import DatabaseException
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
@@ -64,75 +69,196 @@ else:
     DB_PATH = Path(__file__).parent.parent / "data" / "etf_data.db"
     logger.info(f"Using default SQLite database path: {DB_PATH}")
 
+# 바인딩 파라미터 placeholder (USE_POSTGRES는 import 시 확정되므로 한 번만 계산)
+_PH = "%s" if USE_POSTGRES else "?"
+
+# 드라이버 예외 타입 (app.main에서 공통 500 핸들러 등록에 사용)
+DB_ERRORS = (sqlite3.Error, psycopg2.Error) if USE_POSTGRES else (sqlite3.Error,)
+
+# 새로 생성한 SQLite 연결에 한 번만 적용하는 PRAGMA (풀에서 재사용될 때는 다시 실행하지 않음)
+# - WAL: 스케줄러 쓰기 중에도 대시보드 읽기가 막히지 않음
+# - mmap_size: read() 시스템 콜 대신 mmap으로 페이지 제공
+# - cache_size: 연결당 최대 64MB 페이지 캐시 (필요할 때만 할당됨)
+_SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+# 읽기 전용 연결은 journal_mode를 바꿀 수 없으므로 WAL/synchronous 설정을 제외하고,
+# query_only로 실수로 쓰기 문을 실행해도 연결 수준에서 거부되도록 한다
+_SQLITE_READONLY_PRAGMAS = tuple(
+    pragma for pragma in _SQLITE_CONNECTION_PRAGMAS
+    if not pragma.startswith(("PRAGMA journal_mode", "PRAGMA synchronous"))
+) + ("PRAGMA query_only=1",)
+
+
+# 풀이 가득 찼을 때 단계별 대기 시간(초), 모두 소진하면 PoolExhaustedException (합계 30초)
+_POOL_WAIT_STEPS = (1.0, 4.0, 25.0)
+
+# 풀 연결의 sqlite3 statement cache 크기 (조회 SQL 종류가 많아 기본 128개를 넘지 않도록)
+_SQLITE_CACHED_STATEMENTS = 256
+
+# init_db 시드 INSERT 한 문장에 담는 최대 행 수 (9컬럼 x 100행 = 900 바인딩 < 999)
+_SEED_ROWS_PER_INSERT = 100
+
+# 쓰기 풀에서 연결이 이만큼 반환될 때마다 PRAGMA optimize 실행
+_SQLITE_OPTIMIZE_EVERY = 256
+
+
+def _pg_connect_kwargs() -> dict:
+    """
+    PostgreSQL 풀 연결 옵션
+
+    - keepalives: 유휴 연결이 중간 장비(로드밸런서 등)에서 끊기는 것을 감지
+    - statement_timeout: 요청 경로의 폭주 쿼리가 풀 연결을 무한정 점유하지 않도록 제한
+      (DB_STATEMENT_TIMEOUT_MS, 0이면 제한 없음)
+    """
+    timeout_ms = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+    return {
+        "keepalives": 1,
+        "keepalives_idle": 30,
+        "keepalives_interval": 10,
+        "keepalives_count": 3,
+        "options": f"-c statement_timeout={timeout_ms}",
+    }
+
+
+def _configure_sqlite_connection(conn: sqlite3.Connection, readonly: bool = False) -> None:
+    """SQLite 연결 생성 직후 성능 PRAGMA 적용"""
+    for pragma in (_SQLITE_READONLY_PRAGMAS if readonly else _SQLITE_CONNECTION_PRAGMAS):
+        conn.execute(pragma)
+
+
+class PoolExhaustedException(DatabaseException, TimeoutError):
+    """커넥션 풀에서 제한 시간 내에 연결을 얻지 못함 (기존 TimeoutError 처리와 호환)"""
+    pass
+
+
 class ConnectionPool:
     """
     Connection pool for SQLite and PostgreSQL
     """
-    def __init__(self, max_connections: int = 10):
+    def __init__(self, max_connections: int = 10, readonly: bool = False):
         self.max_connections = max_connections
         self.use_postgres = USE_POSTGRES
+        # SQLite 전용: mode=ro 연결은 쓰기 잠금/저널 검사를 하지 않아 스케줄러 쓰기와 덜 경합한다
+        self.readonly = readonly
         
         if self.use_postgres:
             # PostgreSQL connection pool
             try:
                 import psycopg2
                 from psycopg2.pool import ThreadedConnectionPool
-                self.pg_pool = ThreadedConnectionPool(1, max_connections, DATABASE_URL)
+                self.pg_pool = ThreadedConnectionPool(
+                    1, max_connections, DATABASE_URL, **_pg_connect_kwargs()
+                )
                 logger.info(f"PostgreSQL connection pool initialized with max_connections={max_connections}")
             except Exception as e:
                 logger.error(f"Failed to initialize PostgreSQL connection pool: {e}")
                 raise
         else:
             # SQLite connection pool
-            self.pool = Queue(maxsize=max_connections)
-            self.lock = Lock()
+            # deque + Condition: 풀 히트 경로는 락 1회, 대기가 필요할 때만 wait/notify 사용
+            self.pool: deque = deque()
+            self.cv = Condition()
             self.current_connections = 0
-            logger.info(f"SQLite connection pool initialized with max_connections={max_connections}")
+            self._returns = 0
+            logger.info(
+                f"SQLite {'read-only ' if readonly else ''}connection pool initialized "
+                f"with max_connections={max_connections}"
+            )
 
     def get_connection(self):
         """Get a connection from the pool or create a new one"""
         if self.use_postgres:
             return self.pg_pool.getconn()
         else:
-            try:
-                # Try to get an existing connection from the pool (non-blocking)
-                conn = self.pool.get_nowait()
-                logger.debug("Reusing connection from pool")
-                return conn
-            except Empty:
-                # Pool is empty, create a new connection if below max
-                with self.lock:
-                    if self.current_connections < self.max_connections:
-                        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
-                        conn.row_factory = sqlite3.Row
-                        self.current_connections += 1
-                        logger.debug(f"Created new connection ({self.current_connections}/{self.max_connections})")
-                        return conn
-                    else:
-                        # Wait for a connection to become available (with timeout)
-                        logger.debug("Pool full, waiting for connection...")
-                        try:
-                            conn = self.pool.get(block=True, timeout=30)
+            with self.cv:
+                if not self._has_capacity():
+                    # 단계적으로 대기하며 매 단계 경고를 남긴다 (풀 고갈 상황 관측용)
+                    logger.debug("Pool full, waiting for connection...")
+                    for attempt, wait_seconds in enumerate(_POOL_WAIT_STEPS, start=1):
+                        if self.cv.wait_for(self._has_capacity, timeout=wait_seconds):
                             logger.debug("Got connection after waiting")
-                            return conn
-                        except Empty:
-                            logger.error("Connection pool timeout: no connection available after 30s")
-                            raise TimeoutError("Database connection pool exhausted. Please try again later.")
+                            break
+                        logger.warning(
+                            f"Connection pool busy: no connection after {wait_seconds}s "
+                            f"(attempt {attempt}/{len(_POOL_WAIT_STEPS)}, "
+                            f"{self.current_connections}/{self.max_connections} in use)"
+                        )
+                    else:
+                        total = sum(_POOL_WAIT_STEPS)
+                        logger.error(f"Connection pool timeout: no connection available after {total:.0f}s")
+                        raise PoolExhaustedException(
+                            "Database connection pool exhausted. Please try again later."
+                        )
+
+                if self.pool:
+                    logger.debug("Reusing connection from pool")
+                    return self.pool.popleft()
+
+                # Pool is empty, create a new connection (below max)
+                conn = self._connect_sqlite()
+                self.current_connections += 1
+                logger.debug(f"Created new connection ({self.current_connections}/{self.max_connections})")
+                return conn
+
+    def _has_capacity(self) -> bool:
+        """재사용할 유휴 연결이 있거나 새 연결을 만들 여유가 있는지 (cv 보유 상태에서 호출)"""
+        return bool(self.pool) or self.current_connections < self.max_connections
+
+    def _connect_sqlite(self) -> sqlite3.Connection:
+        """새 SQLite 연결 생성 (읽기 전용 풀이면 mode=ro URI로 연결)"""
+        # cached_statements: 연결별 prepared statement LRU (기본 128) 확대
+        if self.readonly:
+            uri = f"{Path(DB_PATH).resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(
+                uri, uri=True, check_same_thread=False,
+                cached_statements=_SQLITE_CACHED_STATEMENTS,
+            )
+        else:
+            conn = sqlite3.connect(
+                DB_PATH, check_same_thread=False,
+                cached_statements=_SQLITE_CACHED_STATEMENTS,
+            )
+        conn.row_factory = sqlite3.Row
+        _configure_sqlite_connection(conn, readonly=self.readonly)
+        return conn
+
+    def _optimize(self, conn):
+        """PRAGMA optimize로 플래너 통계 갱신 (쓰기 풀 전용, 실패해도 연결은 계속 사용)"""
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.warning(f"PRAGMA optimize failed: {e}")
 
     def return_connection(self, conn):
         """Return a connection to the pool"""
         if self.use_postgres:
             self.pg_pool.putconn(conn)
         else:
-            try:
-                self.pool.put_nowait(conn)
-                logger.debug("Returned connection to pool")
-            except Exception:
+            if not self.readonly:
+                # N번 반환마다 한 번 ANALYZE 통계를 갱신해 prices(ticker, date) 범위 조회 플랜을 유지
+                with self.cv:
+                    self._returns += 1
+                    run_optimize = self._returns % _SQLITE_OPTIMIZE_EVERY == 0
+                if run_optimize:
+                    self._optimize(conn)
+            with self.cv:
+                if len(self.pool) < self.max_connections:
+                    self.pool.append(conn)
+                    self.cv.notify()
+                    logger.debug("Returned connection to pool")
+                    return
                 # Pool is full, close the connection
-                conn.close()
-                with self.lock:
-                    self.current_connections -= 1
-                logger.debug("Pool full, closed connection")
+                self.current_connections -= 1
+            conn.close()
+            logger.debug("Pool full, closed connection")
 
     def close_all(self):
         """Close all connections in the pool"""
@@ -141,36 +267,43 @@ class ConnectionPool:
                 self.pg_pool.closeall()
             logger.info("All PostgreSQL connections closed")
         else:
-            while not self.pool.empty():
-                try:
-                    conn = self.pool.get_nowait()
+            with self.cv:
+                while self.pool:
+                    conn = self.pool.popleft()
+                    if not self.readonly:
+                        self._optimize(conn)
                     conn.close()
-                except Empty:
-                    break
-            self.current_connections = 0
+                self.current_connections = 0
             logger.info("All SQLite connections closed")
 
 # Global connection pool instance
-_connection_pool = None
-_pool_lock = Lock()
-
+# functools.cache: 첫 호출 이후에는 dict 조회 한 번으로 싱글톤을 반환 (global/Lock/이중 None 검사 제거)
+@functools.cache
 def get_connection_pool() -> ConnectionPool:
     """Get the global connection pool instance (singleton)"""
-    global _connection_pool
-    if _connection_pool is None:
-        with _pool_lock:
-            if _connection_pool is None:
-                max_conn = int(os.getenv("DB_POOL_SIZE", "10"))
-                _connection_pool = ConnectionPool(max_connections=max_conn)
-    return _connection_pool
+    return ConnectionPool(max_connections=int(os.getenv("DB_POOL_SIZE", "10")))
+
+
+# Global read-only connection pool instance (SQLite 전용)
+@functools.cache
+def get_ro_connection_pool() -> ConnectionPool:
+    """Get the global read-only SQLite connection pool instance (singleton)"""
+    max_conn = int(os.getenv("DB_RO_POOL_SIZE", os.getenv("DB_POOL_SIZE", "10")))
+    return ConnectionPool(max_connections=max_conn, readonly=True)
+
 
 @contextmanager
-def get_db_connection():
+def get_db_connection(readonly: bool = False):
     """
     Get database connection as a context manager.
     Uses connection pooling for improved performance.
     Ensures connection is properly closed even if an exception occurs.
 
+    Args:
+        readonly: True면 SQLite 읽기 전용 풀(mode=ro, query_only)에서 연결을 가져온다.
+            WAL에서는 읽기 연결이 쓰기 연결과 슬롯을 다투지 않고 병렬로 조회한다.
+            PostgreSQL은 값과 무관하게 같은 풀을 사용한다.
+
     Usage:
         with get_db_connection() as conn_or_cursor:
             # PostgreSQL: get_db_connection()이 이미 cursor를 반환
@@ -182,12 +315,24 @@ def get_db_connection():
             cursor.execute("SELECT * FROM etfs")
             rows = cursor.fetchall()
     """
+    if readonly and not USE_POSTGRES:
+        pool = get_ro_connection_pool()
+        conn = pool.get_connection()
+        try:
+            yield conn
+        finally:
+            # 열린 트랜잭션이 남아 있으면 오래된 스냅샷을 계속 읽게 되므로 반환 전에 정리
+            if conn.in_transaction:
+                conn.rollback()
+            pool.return_connection(conn)
+        return
+
     pool = get_connection_pool()
     conn = pool.get_connection()
     try:
         if USE_POSTGRES:
             # PostgreSQL: Use RealDictCursor for dict-like row access
-            from psycopg2.extras import RealDictCursor
+            # (RealDictCursor는 USE_POSTGRES 판정 시 모듈 상단에서 import됨)
             yield conn.cursor(cursor_factory=RealDictCursor)
         else:
             # SQLite: Already has row_factory set to sqlite3.Row
@@ -195,6 +340,18 @@ def get_db_connection():
     finally:
         pool.return_connection(conn)
 
+@contextmanager
+def get_ro_db_connection():
+    """
+    읽기 전용 DB 연결 context manager (get_db_connection(readonly=True)와 동일)
+
+    SELECT만 수행하는 조회 경로에서 사용한다.
+    yield하는 객체의 형태는 get_db_connection()과 같다.
+    """
+    with get_db_connection(readonly=True) as conn_or_cursor:
+        yield conn_or_cursor
+
+
 def get_cursor(conn_or_cursor):
     """
     Get cursor from connection or return cursor if already a cursor.
@@ -256,17 +413,101 @@ def _safe_alter_table(cursor, table: str, col_name: str, col_type: str,
     cursor.execute(f"ALTER TABLE {table} ADD COLUMN {col_name} {col_type}")
 
 
+def _get_existing_columns(cursor, table: str) -> set:
+    """테이블의 현재 컬럼명 집합 조회 (PostgreSQL: information_schema, SQLite: PRAGMA table_info)"""
+    if USE_POSTGRES:
+        cursor.execute("""
+            SELECT column_name
+            FROM information_schema.columns
+            WHERE table_name = %s
+        """, (table,))
+        return {row[0] for row in cursor.fetchall()}
+    cursor.execute(f"PRAGMA table_info({table})")
+    return {row[1] for row in cursor.fetchall()}
+
+
+def _add_missing_columns(cursor, conn, table: str, columns_to_add: list) -> None:
+    """
+    누락된 컬럼만 ALTER TABLE로 추가 (기존 DB 마이그레이션)
+
+    컬럼 존재 여부를 먼저 한 번 조회하므로 ALTER 실패를 예외로 감지할 필요가 없다.
+    """
+    allowed_cols = {col for col, _ in columns_to_add}
+    existing_cols = _get_existing_columns(cursor, table)
+    for col_name, col_type in columns_to_add:
+        if col_name in existing_cols:
+            continue
+        try:
+            _safe_alter_table(cursor, table, col_name, col_type, allowed_cols)
+            logger.info(f"Added {col_name} column to {table} table")
+        except Exception as e:
+            logger.warning(f"Could not add {col_name} column to {table}: {e}")
+            if USE_POSTGRES:
+                conn.rollback()
+
+
+# init_db()의 컬럼 추가 마이그레이션 버전
+# (SQLite는 PRAGMA user_version, PostgreSQL은 한 행짜리 schema_version 테이블에 기록)
+# *_columns_to_add 목록에 컬럼을 추가하면 이 값을 올려야 기존 DB에 반영된다.
+_SCHEMA_VERSION = 1
+
+
+def _get_schema_version(cursor) -> int:
+    """
+    DB에 기록된 스키마 버전 조회
+
+    SQLite는 PRAGMA user_version을 사용한다. PostgreSQL은 schema_version 테이블을 읽고,
+    테이블이 없으면(기존 배포) 0을 반환해 information_schema 확인을 한 번 수행한다.
+    """
+    if USE_POSTGRES:
+        cursor.execute("SELECT to_regclass('schema_version')")
+        if cursor.fetchone()[0] is None:
+            return 0
+        cursor.execute("SELECT version FROM schema_version WHERE id = 1")
+        row = cursor.fetchone()
+        return row[0] if row else 0
+    cursor.execute("PRAGMA user_version")
+    return cursor.fetchone()[0]
+
+
+def _set_schema_version(cursor, version: int) -> None:
+    """스키마 버전 기록 (SQLite PRAGMA는 바인딩 파라미터를 받지 않음)"""
+    if USE_POSTGRES:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                version INTEGER NOT NULL
+            )
+        """)
+        cursor.execute("""
+            INSERT INTO schema_version (id, version) VALUES (1, %s)
+            ON CONFLICT (id) DO UPDATE SET version = EXCLUDED.version
+        """, (int(version),))
+        return
+    cursor.execute(f"PRAGMA user_version = {int(version)}")
+
+
+def _supports_partial_index() -> bool:
+    """부분 인덱스(CREATE INDEX ... WHERE) 지원 여부 (SQLite 3.8.0+, PostgreSQL은 항상 지원)"""
+    return USE_POSTGRES or sqlite3.sqlite_version_info >= (3, 8, 0)
+
+
 def init_db():
     """Initialize database with schema"""
     if USE_POSTGRES:
-        import psycopg2
-        from psycopg2.extras import RealDictCursor
         conn = psycopg2.connect(DATABASE_URL)
         cursor = conn.cursor()
     else:
         DB_PATH.parent.mkdir(exist_ok=True)
         conn = sqlite3.connect(DB_PATH)
+        _configure_sqlite_connection(conn)
         cursor = conn.cursor()
+        # DDL은 암묵적 트랜잭션 없이 문장마다 자동 커밋(fsync)되므로 전체 스키마 작업을
+        # 한 트랜잭션으로 묶어 마지막 commit() 한 번에 반영한다 (PRAGMA 적용 후에 시작)
+        conn.execute("BEGIN IMMEDIATE")
+
+    # 컬럼 추가 마이그레이션은 스키마 버전이 낮을 때만 실행 (매 시작마다 컬럼 조회를 하지 않음)
+    needs_migration = _get_schema_version(cursor) < _SCHEMA_VERSION
     
     # SQL 문법 차이 처리
     if USE_POSTGRES:
@@ -277,7 +518,8 @@ def init_db():
         timestamp_default = "DEFAULT CURRENT_TIMESTAMP"
         auto_increment = ""  # SERIAL already handles this
         insert_ignore = "ON CONFLICT (ticker) DO NOTHING"
-        param_placeholder = "%s"
+        param_placeholder = _PH
+        without_rowid = ""
     else:
         id_type = "INTEGER PRIMARY KEY AUTOINCREMENT"
         text_type = "TEXT"
@@ -286,7 +528,10 @@ def init_db():
         timestamp_default = "DEFAULT CURRENT_TIMESTAMP"
         auto_increment = "AUTOINCREMENT"
         insert_ignore = "OR IGNORE"
-        param_placeholder = "?"
+        param_placeholder = _PH
+        # ticker TEXT PK 테이블은 rowid B-tree + PK 인덱스 두 개 대신 PK B-tree 하나에 행을 저장
+        # (CREATE TABLE IF NOT EXISTS이므로 새 DB에만 적용되고 기존 테이블 구조는 유지됨)
+        without_rowid = " WITHOUT ROWID"
     
     # Create tables
     cursor.execute(f"""
@@ -300,7 +545,7 @@ def init_db():
             quantity {integer_type},
             search_keyword {text_type},
             relevance_keywords {text_type}
-        )
+        ){without_rowid}
     """)
     
     # quantity, purchase_price 등 컬럼이 없으면 추가 (마이그레이션)
@@ -311,30 +556,8 @@ def init_db():
         ("search_keyword", text_type),
         ("relevance_keywords", text_type),
     ]
-    _etfs_allowed = {col for col, _ in columns_to_add}
-    if USE_POSTGRES:
-        for col_name, col_type in columns_to_add:
-            try:
-                cursor.execute("""
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_name='etfs' AND column_name=%s
-                """, (col_name,))
-                if not cursor.fetchone():
-                    _safe_alter_table(cursor, "etfs", col_name, col_type, _etfs_allowed)
-                    logger.info(f"Added {col_name} column to etfs table")
-            except Exception as e:
-                logger.warning(f"Could not check/add {col_name} column: {e}")
-                conn.rollback()
-    else:
-        # SQLite: ALTER ADD COLUMN 후 중복 시 무시
-        for col_name, col_type in columns_to_add:
-            try:
-                _safe_alter_table(cursor, "etfs", col_name, col_type, _etfs_allowed)
-                logger.info(f"Added {col_name} column to etfs table")
-            except Exception as e:
-                if "duplicate column" not in str(e).lower() and "already exists" not in str(e).lower():
-                    logger.warning(f"Could not add {col_name} column: {e}")
+    if needs_migration:
+        _add_missing_columns(cursor, conn, "etfs", columns_to_add)
     
     cursor.execute(f"""
         CREATE TABLE IF NOT EXISTS prices (
@@ -381,29 +604,8 @@ def init_db():
 
     # news 테이블에 published_at 컬럼 추가 (기존 DB 마이그레이션)
     news_columns_to_add = [("published_at", "TIMESTAMP")]
-    _news_allowed = {col for col, _ in news_columns_to_add}
-    if USE_POSTGRES:
-        for col_name, col_type in news_columns_to_add:
-            try:
-                cursor.execute("""
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_name='news' AND column_name=%s
-                """, (col_name,))
-                if not cursor.fetchone():
-                    _safe_alter_table(cursor, "news", col_name, col_type, _news_allowed)
-                    logger.info(f"Added {col_name} column to news table")
-            except Exception as e:
-                logger.warning(f"Could not check/add {col_name} column: {e}")
-                conn.rollback()
-    else:
-        for col_name, col_type in news_columns_to_add:
-            try:
-                _safe_alter_table(cursor, "news", col_name, col_type, _news_allowed)
-                logger.info(f"Added {col_name} column to news table")
-            except Exception as e:
-                if "duplicate column" not in str(e).lower() and "already exists" not in str(e).lower():
-                    logger.warning(f"Could not add {col_name} column to news: {e}")
+    if needs_migration:
+        _add_missing_columns(cursor, conn, "news", news_columns_to_add)
     
     # Create stock_catalog table for ticker catalog
     if USE_POSTGRES:
@@ -421,7 +623,7 @@ def init_db():
             listed_date DATE,
             last_updated TIMESTAMP {timestamp_default},
             is_active {is_active_type}
-        )
+        ){without_rowid}
     """)
 
     # Create collection_status table for tracking data collection
@@ -440,20 +642,26 @@ def init_db():
             created_at TIMESTAMP {timestamp_default},
             updated_at TIMESTAMP {timestamp_default},
             FOREIGN KEY (ticker) REFERENCES etfs(ticker)
-        )
+        ){without_rowid}
     """)
 
     # Create indexes for improved query performance on date-based queries
     logger.info("Creating database indexes for performance optimization")
 
+    # 커버링 인덱스: (ticker, date DESC) 범위 조회가 본 테이블 재조회 없이 인덱스만으로 처리된다.
+    # - prices: 지표/비교 조회(date, close_price, volume, daily_change_pct)
+    # - trading_flow: 매매동향 조회 컬럼 전체
+    # 선두 컬럼이 같은 기존 (ticker, date DESC) 인덱스는 중복이므로 제거한다.
+    cursor.execute("DROP INDEX IF EXISTS idx_prices_ticker_date")
     cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_prices_ticker_date
-        ON prices(ticker, date DESC)
+        CREATE INDEX IF NOT EXISTS idx_prices_cover
+        ON prices(ticker, date DESC, close_price, volume, daily_change_pct)
     """)
 
+    cursor.execute("DROP INDEX IF EXISTS idx_trading_flow_ticker_date")
     cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_trading_flow_ticker_date
-        ON trading_flow(ticker, date DESC)
+        CREATE INDEX IF NOT EXISTS idx_trading_flow_cover
+        ON trading_flow(ticker, date DESC, individual_net, institutional_net, foreign_net)
     """)
 
     cursor.execute("""
@@ -478,10 +686,31 @@ def init_db():
         ON stock_catalog(type)
     """)
     
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_stock_catalog_active
-        ON stock_catalog(is_active)
-    """)
+    # 부분 인덱스: 조회는 활성 종목만 대상으로 하므로 비활성 행은 인덱스에 넣지 않는다.
+    # (WHERE 절은 쿼리의 is_active 비교식과 같아야 사용됨)
+    # 이름은 idx_stock_catalog_active 그대로 두고, 기존 전체 is_active 인덱스일 때만 다시 만든다.
+    cursor.execute("DROP INDEX IF EXISTS idx_stock_catalog_active_tickers")
+    if _supports_partial_index():
+        if USE_POSTGRES:
+            cursor.execute(
+                "SELECT indexdef FROM pg_indexes WHERE indexname = 'idx_stock_catalog_active'"
+            )
+        else:
+            cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'index' AND name = 'idx_stock_catalog_active'"
+            )
+        row = cursor.fetchone()
+        if row is not None and "WHERE" not in (row[0] or "").upper():
+            cursor.execute("DROP INDEX idx_stock_catalog_active")
+        cursor.execute(f"""
+            CREATE INDEX IF NOT EXISTS idx_stock_catalog_active
+            ON stock_catalog(ticker) WHERE is_active = {"TRUE" if USE_POSTGRES else "1"}
+        """)
+    else:
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_stock_catalog_active
+            ON stock_catalog(is_active)
+        """)
 
     # stock_catalog 스크리닝용 컬럼 마이그레이션
     screening_columns = [
@@ -499,29 +728,8 @@ def init_db():
         ("ytd_base_date", "TEXT"),
         ("ytd_base_price", real_type),
     ]
-    _catalog_allowed = {col for col, _ in screening_columns}
-    if USE_POSTGRES:
-        for col_name, col_type in screening_columns:
-            try:
-                cursor.execute("""
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_name='stock_catalog' AND column_name=%s
-                """, (col_name,))
-                if not cursor.fetchone():
-                    _safe_alter_table(cursor, "stock_catalog", col_name, col_type, _catalog_allowed)
-                    logger.info(f"Added {col_name} column to stock_catalog table")
-            except Exception as e:
-                logger.warning(f"Could not check/add {col_name} column to stock_catalog: {e}")
-                conn.rollback()
-    else:
-        for col_name, col_type in screening_columns:
-            try:
-                _safe_alter_table(cursor, "stock_catalog", col_name, col_type, _catalog_allowed)
-                logger.info(f"Added {col_name} column to stock_catalog table")
-            except Exception as e:
-                if "duplicate column" not in str(e).lower() and "already exists" not in str(e).lower():
-                    logger.warning(f"Could not add {col_name} column to stock_catalog: {e}")
+    if needs_migration:
+        _add_missing_columns(cursor, conn, "stock_catalog", screening_columns)
 
     # stock_catalog 스크리닝용 인덱스
     cursor.execute("""
@@ -537,11 +745,17 @@ def init_db():
         ON stock_catalog(catalog_updated_at)
     """)
 
-    # Create indexes for collection_status
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_collection_status_last_dates
-        ON collection_status(last_price_date, last_trading_flow_date)
-    """)
+    # collection_status 조회는 모두 ticker(PK) 기준이라 날짜 선두 인덱스를 쓰는 쿼리가 없다.
+    # (ticker, ...) 보조 인덱스를 더해도 플래너는 ticker = ? 조회에 UNIQUE PK 인덱스를 고르므로
+    # 쓰기 비용만 늘리는 인덱스는 두지 않는다.
+    cursor.execute("DROP INDEX IF EXISTS idx_collection_status_last_dates")
+
+    # 수집 실패 종목만 담는 부분 인덱스 (재시도 대상 조회용, 정상 종목은 인덱스에 없음)
+    if _supports_partial_index():
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_collection_status_failures
+            ON collection_status(ticker, consecutive_failures) WHERE consecutive_failures > 0
+        """)
 
     # Create intraday_prices table for minute-level price data (분봉)
     cursor.execute(f"""
@@ -581,9 +795,12 @@ def init_db():
         )
     """)
 
+    # 활성 규칙 목록(WHERE ticker AND is_active ORDER BY created_at DESC)을 정렬 없이 조회
+    # 선두 컬럼이 같은 기존 (ticker, is_active) 인덱스는 중복이므로 제거한다.
+    cursor.execute("DROP INDEX IF EXISTS idx_alert_rules_ticker")
     cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_alert_rules_ticker
-        ON alert_rules(ticker, is_active)
+        CREATE INDEX IF NOT EXISTS idx_alert_rules_ticker_active_created
+        ON alert_rules(ticker, is_active, created_at DESC)
     """)
 
     # Create alert_history table for alert logs
@@ -604,6 +821,12 @@ def init_db():
         ON alert_history(ticker, triggered_at DESC)
     """)
 
+    # 규칙 삭제 시 DELETE FROM alert_history WHERE rule_id = ? (FK 컬럼)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_alert_history_rule_id
+        ON alert_history(rule_id)
+    """)
+
     # Create etf_fundamentals table for NAV, AUM tracking
     cursor.execute(f"""
         CREATE TABLE IF NOT EXISTS etf_fundamentals (
@@ -689,29 +912,8 @@ def init_db():
 
     # daily_change_pct 컬럼이 없으면 추가 (기존 DB 마이그레이션)
     etf_holdings_columns_to_add = [("daily_change_pct", real_type)]
-    _etf_holdings_allowed = {col for col, _ in etf_holdings_columns_to_add}
-    if USE_POSTGRES:
-        for col_name, col_type in etf_holdings_columns_to_add:
-            try:
-                cursor.execute("""
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_name='etf_holdings' AND column_name=%s
-                """, (col_name,))
-                if not cursor.fetchone():
-                    _safe_alter_table(cursor, "etf_holdings", col_name, col_type, _etf_holdings_allowed)
-                    logger.info(f"Added {col_name} column to etf_holdings table")
-            except Exception as e:
-                logger.warning(f"Could not check/add {col_name} column to etf_holdings: {e}")
-                conn.rollback()
-    else:
-        for col_name, col_type in etf_holdings_columns_to_add:
-            try:
-                _safe_alter_table(cursor, "etf_holdings", col_name, col_type, _etf_holdings_allowed)
-                logger.info(f"Added {col_name} column to etf_holdings table")
-            except Exception as e:
-                if "duplicate column" not in str(e).lower() and "already exists" not in str(e).lower():
-                    logger.warning(f"Could not add {col_name} column to etf_holdings: {e}")
+    if needs_migration:
+        _add_missing_columns(cursor, conn, "etf_holdings", etf_holdings_columns_to_add)
 
     cursor.execute("""
         CREATE INDEX IF NOT EXISTS idx_etf_holdings_ticker_date
@@ -777,15 +979,14 @@ def init_db():
     """)
 
     # Insert initial stock data from config (ETF 4개 + 주식 2개)
-    stock_config = Config.get_stock_config()
-    etfs_data = []
+    # app.utils 패키지가 stocks_manager를 통해 app.database를 import하므로 지연 import
+    from app.utils import json_utils
 
-    for ticker, info in stock_config.items():
-        # relevance_keywords를 JSON 문자열로 변환
-        import json
-        relevance_keywords_json = json.dumps(info.get("relevance_keywords", []), ensure_ascii=False) if info.get("relevance_keywords") else None
-
-        etfs_data.append((
+    stock_config = Config.get_stock_config()
+    # relevance_keywords는 JSON 문자열로 변환 (비어 있으면 NULL)
+    # 제너레이터로 만들고 청크 단위로만 꺼내 전체 중간 리스트를 만들지 않는다
+    etfs_data = (
+        (
             ticker,
             info.get("name"),
             info.get("type"),
@@ -794,24 +995,42 @@ def init_db():
             info.get("purchase_price"),
             info.get("quantity"),
             info.get("search_keyword"),
-            relevance_keywords_json
-        ))
-
-    logger.info(f"Loading {len(etfs_data)} stocks from configuration")
-
-    if USE_POSTGRES:
-        cursor.executemany(f"""
-            INSERT INTO etfs (ticker, name, type, theme, purchase_date, purchase_price, quantity, search_keyword, relevance_keywords)
-            VALUES ({param_placeholder}, {param_placeholder}, {param_placeholder}, {param_placeholder}, {param_placeholder}, {param_placeholder}, {param_placeholder}, {param_placeholder}, {param_placeholder})
-            {insert_ignore}
-        """, etfs_data)
-    else:
-        cursor.executemany(f"""
-            INSERT {insert_ignore} INTO etfs (ticker, name, type, theme, purchase_date, purchase_price, quantity, search_keyword, relevance_keywords)
-            VALUES ({param_placeholder}, {param_placeholder}, {param_placeholder}, {param_placeholder}, {param_placeholder}, {param_placeholder}, {param_placeholder}, {param_placeholder}, {param_placeholder})
-        """, etfs_data)
+            json_utils.dumps(info["relevance_keywords"])
+            if info.get("relevance_keywords") else None,
+        )
+        for ticker, info in stock_config.items()
+    )
+
+    logger.info(f"Loading {len(stock_config)} stocks from configuration")
+
+    # 여러 행을 VALUES (...), (...) 한 문장으로 넣어 행마다 문장을 다시 실행하지 않는다.
+    # 구버전 SQLite의 바인딩 변수 한도(999)를 넘지 않도록 청크 단위로 나눈다.
+    row_placeholders = f"({', '.join([param_placeholder] * 9)})"
+    while True:
+        chunk = list(islice(etfs_data, _SEED_ROWS_PER_INSERT))
+        if not chunk:
+            break
+        values = ", ".join([row_placeholders] * len(chunk))
+        params = [value for row in chunk for value in row]
+        if USE_POSTGRES:
+            cursor.execute(f"""
+                INSERT INTO etfs (ticker, name, type, theme, purchase_date, purchase_price, quantity, search_keyword, relevance_keywords)
+                VALUES {values}
+                {insert_ignore}
+            """, params)
+        else:
+            cursor.execute(f"""
+                INSERT {insert_ignore} INTO etfs (ticker, name, type, theme, purchase_date, purchase_price, quantity, search_keyword, relevance_keywords)
+                VALUES {values}
+            """, params)
     
+    if needs_migration:
+        _set_schema_version(cursor, _SCHEMA_VERSION)
+
     conn.commit()
+    if not USE_POSTGRES:
+        # 새 인덱스/시드 데이터 기준으로 플래너 통계 갱신 (통계가 최신이면 거의 비용 없음)
+        conn.execute("PRAGMA optimize")
     conn.close()
     
     logger.info("Database initialized successfully")
@@ -861,11 +1080,65 @@ def run_migrations():
         logger.error(f"run_migrations() failed: {e}")
 
 
+# collection_status SQL은 모듈 로드 시 한 번만 만든다.
+# 매 호출마다 문자열을 새로 조립하지 않으므로 sqlite3 statement cache가 그대로 재사용된다.
+
+# 단일 UPSERT 문 (SELECT 후 UPDATE/INSERT 분기 대신 한 번에 처리)
+_SQL_UPSERT_STATUS = f"""
+    INSERT INTO collection_status
+    (ticker, last_price_date, last_trading_flow_date,
+     last_news_collected_at, last_collection_attempt,
+     last_successful_collection, consecutive_failures, updated_at)
+    VALUES ({", ".join([_PH] * 8)})
+    ON CONFLICT (ticker) DO UPDATE SET
+        last_price_date = COALESCE(excluded.last_price_date,
+                                   collection_status.last_price_date),
+        last_trading_flow_date = COALESCE(excluded.last_trading_flow_date,
+                                          collection_status.last_trading_flow_date),
+        last_news_collected_at = COALESCE(excluded.last_news_collected_at,
+                                          collection_status.last_news_collected_at),
+        last_collection_attempt = excluded.last_collection_attempt,
+        last_successful_collection = COALESCE(excluded.last_successful_collection,
+                                              collection_status.last_successful_collection),
+        consecutive_failures = CASE WHEN excluded.consecutive_failures = 0 THEN 0
+                                    ELSE collection_status.consecutive_failures + 1 END,
+        updated_at = excluded.updated_at
+"""
+
+_SQL_SELECT_STATUS = f"SELECT * FROM collection_status WHERE ticker = {_PH}"
+
+_SQL_SELECT_STATUS_ALL = "SELECT * FROM collection_status ORDER BY ticker"
+
+
+def _collection_status_params(ticker: str,
+                              price_date: str = None,
+                              trading_flow_date: str = None,
+                              news_collected: bool = False,
+                              success: bool = True,
+                              now: str = None) -> tuple:
+    """UPSERT 바인딩 파라미터 생성 (None 값은 기존 컬럼 값을 유지)"""
+    return (
+        ticker,
+        price_date or None,
+        trading_flow_date or None,
+        now if news_collected else None,
+        now,
+        now if success else None,
+        0 if success else 1,
+        now,
+    )
+
+
+# defer_collection_status_updates() 블록 동안 스레드별로 모아 두는 수집 상태 쓰기
+_status_write_buffer = local()
+
+
 def update_collection_status(ticker: str,
                             price_date: str = None,
                             trading_flow_date: str = None,
                             news_collected: bool = False,
-                            success: bool = True):
+                            success: bool = True,
+                            now: Optional[str] = None):
     """
     종목의 데이터 수집 상태 업데이트
 
@@ -875,82 +1148,64 @@ def update_collection_status(ticker: str,
         trading_flow_date: 마지막 수집한 매매동향 데이터 날짜
         news_collected: 뉴스 수집 여부
         success: 수집 성공 여부
-    """
-    from datetime import datetime
-
-    param_placeholder = "%s" if USE_POSTGRES else "?"
-
-    with get_db_connection() as cursor_or_conn:
-        if USE_POSTGRES:
-            cursor = cursor_or_conn
-            conn = cursor.connection
-        else:
-            conn = cursor_or_conn
-            cursor = conn.cursor()
-
-        # 현재 상태 조회
-        cursor.execute(f"""
-            SELECT * FROM collection_status WHERE ticker = {param_placeholder}
-        """, (ticker,))
-        current = cursor.fetchone()
+        now: 기록할 시각 (ISO 문자열, None이면 현재 시각)
 
-        now = datetime.now().isoformat()
-
-        if current:
-            # 기존 레코드 업데이트
-            updates = []
-            params = []
+    defer_collection_status_updates() 블록 안에서는 즉시 쓰지 않고 버퍼에 모았다가
+    블록이 끝날 때 한 번에 기록한다.
+    """
+    row = (ticker, price_date, trading_flow_date, news_collected, success)
+    buffered = getattr(_status_write_buffer, "rows", None)
+    if buffered is not None:
+        buffered.append((row, now or datetime.now().isoformat()))
+        return
+    update_collection_status_many([row], now=now)
 
-            if price_date:
-                updates.append(f"last_price_date = {param_placeholder}")
-                params.append(price_date)
 
-            if trading_flow_date:
-                updates.append(f"last_trading_flow_date = {param_placeholder}")
-                params.append(trading_flow_date)
+@contextmanager
+def defer_collection_status_updates():
+    """
+    현재 스레드의 update_collection_status() 호출을 모아 블록 종료 시 일괄 기록 (write-behind)
 
-            if news_collected:
-                updates.append(f"last_news_collected_at = {param_placeholder}")
-                params.append(now)
+    종목마다 UPSERT + commit(fsync)을 하는 대신 블록이 끝날 때 executemany 한 번과
+    commit 한 번으로 처리한다. 스케줄러 수집 주기처럼 블록 안에서 수집 상태를
+    다시 읽지 않는 경로에서만 사용한다. 예외가 나도 모아 둔 상태는 기록된다.
 
-            updates.append(f"last_collection_attempt = {param_placeholder}")
-            params.append(now)
+    Usage:
+        with defer_collection_status_updates():
+            for ticker in tickers:
+                update_collection_status(ticker, price_date=...)
+    """
+    if getattr(_status_write_buffer, "rows", None) is not None:
+        # 중첩 호출은 바깥 블록이 한 번에 기록
+        yield
+        return
 
-            if success:
-                updates.append(f"last_successful_collection = {param_placeholder}")
-                updates.append("consecutive_failures = 0")
-                params.append(now)
-            else:
-                updates.append("consecutive_failures = consecutive_failures + 1")
+    _status_write_buffer.rows = []
+    try:
+        yield
+    finally:
+        buffered, _status_write_buffer.rows = _status_write_buffer.rows, None
+        # 같은 시각으로 기록된 연속 구간마다 한 번씩 기록 (스케줄러는 주기당 한 구간)
+        for now, group in groupby(buffered, key=lambda item: item[1]):
+            update_collection_status_many([row for row, _ in group], now=now)
 
-            updates.append(f"updated_at = {param_placeholder}")
-            params.append(now)
 
-            params.append(ticker)
+def update_collection_status_many(rows, now: Optional[str] = None):
+    """
+    여러 종목의 데이터 수집 상태를 한 번에 업데이트 (executemany)
 
-            cursor.execute(f"""
-                UPDATE collection_status
-                SET {', '.join(updates)}
-                WHERE ticker = {param_placeholder}
-            """, params)
-        else:
-            # 새 레코드 삽입
-            cursor.execute(f"""
-                INSERT INTO collection_status
-                (ticker, last_price_date, last_trading_flow_date,
-                 last_news_collected_at, last_collection_attempt,
-                 last_successful_collection, consecutive_failures)
-                VALUES ({param_placeholder}, {param_placeholder}, {param_placeholder}, {param_placeholder}, {param_placeholder}, {param_placeholder}, {param_placeholder})
-            """, (
-                ticker,
-                price_date,
-                trading_flow_date,
-                now if news_collected else None,
-                now,
-                now if success else None,
-                0 if success else 1
-            ))
+    Args:
+        rows: (ticker, price_date, trading_flow_date, news_collected, success) 튜플 목록
+        now: 배치 전체에 기록할 시각 (ISO 문자열, None이면 현재 시각을 한 번만 계산)
+    """
+    now = now or datetime.now().isoformat()
+    params = [_collection_status_params(*row, now=now) for row in rows]
+    if not params:
+        return
 
+    with get_db_connection() as cursor_or_conn:
+        conn, cursor = get_conn_and_cursor(cursor_or_conn)
+        cursor.executemany(_SQL_UPSERT_STATUS, params)
         conn.commit()
 
 def get_collection_status(ticker: str = None):
@@ -963,9 +1218,7 @@ def get_collection_status(ticker: str = None):
     Returns:
         dict or list: 수집 상태 정보
     """
-    param_placeholder = "%s" if USE_POSTGRES else "?"
-    
-    with get_db_connection() as cursor_or_conn:
+    with get_ro_db_connection() as cursor_or_conn:
         if USE_POSTGRES:
             cursor = cursor_or_conn
         else:
@@ -973,16 +1226,38 @@ def get_collection_status(ticker: str = None):
             cursor = conn.cursor()
 
         if ticker:
-            cursor.execute(f"""
-                SELECT * FROM collection_status WHERE ticker = {param_placeholder}
-            """, (ticker,))
+            cursor.execute(_SQL_SELECT_STATUS, (ticker,))
             result = cursor.fetchone()
             return dict(result) if result else None
         else:
-            cursor.execute("""
-                SELECT * FROM collection_status ORDER BY ticker
-            """)
-            return [dict(row) for row in cursor.fetchall()]
+            # fetchall() 중간 리스트 없이 커서를 순회하며 바로 dict로 변환
+            cursor.execute(_SQL_SELECT_STATUS_ALL)
+            return list(map(dict, cursor))
+
+
+def get_collection_status_many(tickers) -> dict:
+    """
+    여러 종목의 데이터 수집 상태를 한 번의 IN 쿼리로 조회 (종목별 N+1 조회 방지)
+
+    Args:
+        tickers: 종목 코드 목록
+
+    Returns:
+        dict: {ticker: 수집 상태 dict} (수집 이력이 없는 종목은 키가 없음)
+    """
+    tickers = list(tickers)
+    if not tickers:
+        return {}
+
+    placeholders = ", ".join([_PH] * len(tickers))
+    with get_ro_db_connection() as cursor_or_conn:
+        cursor = get_cursor(cursor_or_conn)
+        cursor.execute(
+            f"SELECT * FROM collection_status WHERE ticker IN ({placeholders})",
+            tickers,
+        )
+        return {row["ticker"]: dict(row) for row in cursor}
+
 
 if __name__ == "__main__":
     init_db()
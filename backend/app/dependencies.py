@@ -5,6 +5,8 @@ from fastapi import HTTPException, Depends
 from app.models import ETF
 from app.services.data_collector import ETFDataCollector
 from app.middleware.auth import verify_api_key_dependency
+from app.constants import CACHE_TTL_BY_ENDPOINT
+from app.utils.cache import get_cache, make_cache_key
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,11 +14,17 @@ logger = logging.getLogger(__name__)
 # Global collector instance for dependency injection
 _collector = ETFDataCollector()
 
+# 전역 캐시 (종목 정보는 "etf:{ticker}" 키 → 설정 변경 시 invalidate_pattern으로 무효화)
+_cache = get_cache()
 
-def get_collector() -> ETFDataCollector:
+
+async def get_collector() -> ETFDataCollector:
     """
     Get ETFDataCollector instance
 
+    async로 선언: FastAPI는 sync 의존성을 요청마다 threadpool에서 실행하므로,
+    I/O 없이 싱글톤만 반환하는 provider는 이벤트 루프에서 바로 await되게 한다.
+
     Returns:
         ETFDataCollector instance
     """
@@ -27,6 +35,9 @@ def get_etf_or_404(ticker: str, collector: ETFDataCollector = Depends(get_collec
     """
     ETF 존재 확인 의존성
 
+    종목 정보는 거의 바뀌지 않으므로 CACHE_TTL_BY_ENDPOINT["etf"] 동안 캐시해
+    같은 종목의 반복 요청은 DB를 조회하지 않는다 (존재하지 않는 종목은 캐시하지 않음).
+
     Args:
         ticker: Stock/ETF ticker code
         collector: ETFDataCollector instance (injected)
@@ -45,11 +56,17 @@ def get_etf_or_404(ticker: str, collector: ETFDataCollector = Depends(get_collec
             return {"name": etf.name}
         ```
     """
+    cache_key = make_cache_key("etf", ticker=ticker)
+    etf = _cache.get(cache_key)
+    if etf is not None:
+        return etf
+
     try:
         etf = collector.get_etf_info(ticker)
         if not etf:
             logger.warning(f"Stock/ETF {ticker} not found")
             raise HTTPException(status_code=404, detail=f"Stock/ETF {ticker} not found")
+        _cache.set(cache_key, etf, ttl_seconds=CACHE_TTL_BY_ENDPOINT["etf"])
         return etf
     except HTTPException:
         raise
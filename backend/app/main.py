@@ -1,39 +1,57 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from starlette.background import BackgroundTask, BackgroundTasks
 from app.routers import etfs, news, data, settings, alerts, scanner, simulation, market
-from app.database import init_db, run_migrations
+from app.routers.settings import load_api_keys_to_env
+from app.database import init_db, run_migrations, DB_ERRORS, PoolExhaustedException
 from app.services.scheduler import get_scheduler
+from app.services.alert_trigger_writer import get_alert_trigger_writer
 from app.config import Config
-from app.utils import stocks_manager
+from app.utils import stocks_manager, json_utils
 from app.middleware.rate_limit import limiter, rate_limit_exceeded_handler
+from app.middleware.db_errors import database_error_handler, pool_exhausted_handler
+from app.exceptions import DatabaseException
+from app.middleware.response_cache import response_cache_middleware
+from app.utils.cache import get_cache
 from slowapi.errors import RateLimitExceeded
 from app.utils.structured_logging import (
     setup_structured_logging,
     get_logger,
     log_error,
+    log_response,
 )
-from pathlib import Path
-from dotenv import load_dotenv
 import logging
 import os
 import time
 
+# uvicorn access 로그에서 제외할 폴링 경로 (쿼리 스트링 제외한 정확한 경로)
+_SUPPRESSED_ACCESS_LOG_PATHS = frozenset({
+    "/api/data/collect-progress",
+    "/api/scanner/collect-progress",
+    "/api/settings/ticker-catalog/collect-progress",
+})
+
+
 # uvicorn access 로그에서 폴링 경로(collect-progress 등) 제외
 class SuppressPollingAccessLog(logging.Filter):
     """OPTIONS/GET to collect-progress 등 반복 폴링 요청 로그를 출력하지 않음."""
 
     def filter(self, record: logging.LogRecord) -> bool:
         # uvicorn access: record.args = (client_addr, method, full_path, http_version, status_code)
-        if getattr(record, "args", None) and len(record.args) >= 3:
-            full_path = record.args[2]
-            if "collect-progress" in str(full_path):
-                return False
+        args = record.args
+        if args and len(args) >= 3:
+            full_path = args[2]
+            if isinstance(full_path, str):
+                # 부분 문자열 검색 대신 "?" 앞 경로만 잘라 set 조회
+                i = full_path.find("?")
+                path = full_path if i < 0 else full_path[:i]
+                return path not in _SUPPRESSED_ACCESS_LOG_PATHS
         return True
 
 
-# 프로젝트 루트의 .env 로드
-_root_dir = Path(__file__).resolve().parent.parent.parent
-load_dotenv(_root_dir / ".env")
+# 프로젝트 루트의 .env는 app/__init__.py에서 이미 로드됨
 
 # 구조화된 로깅 설정
 # JSON 형식으로 출력 (프로덕션), 개발 환경에서는 콘솔 형식
@@ -54,14 +72,32 @@ logger = get_logger(__name__)
 app = FastAPI(
     title="ETF Weekly Report API",
     description="API for Korean ETF analysis and reporting",
-    version="1.0.0"
+    version="1.0.0",
+    # 응답 JSON 인코딩을 orjson으로 (미설치 시 표준 JSONResponse)
+    default_response_class=ORJSONResponse if json_utils.orjson is not None else JSONResponse,
 )
 
 # Rate Limiter 설정
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
 
+# 라우터에서 처리하지 않은 DB 드라이버 예외/DatabaseException → 500 JSON (로깅 포함)
+for _db_error in (*DB_ERRORS, DatabaseException):
+    app.add_exception_handler(_db_error, database_error_handler)
+# 커넥션 풀 고갈은 일시적이므로 503 (DatabaseException 하위 클래스 → 더 구체적인 핸들러가 우선)
+app.add_exception_handler(PoolExhaustedException, pool_exhausted_handler)
+
+# 응답 압축 (1KB 이상 JSON). 응답 캐시보다 먼저 등록 → 안쪽에서 실행되어 압축된 바디가 캐시됨
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# GET 응답 캐시 (CORS보다 먼저 등록 → 안쪽에서 실행되어 캐시 HIT에도 요청 Origin 기준 CORS 헤더 적용)
+app.middleware("http")(response_cache_middleware)
+
 # CORS configuration
+# preflight 응답 헤더는 CORSMiddleware가 생성 시 미리 계산해 둠 → 비용은 preflight 횟수
+# max_age를 길게 잡아 브라우저가 preflight 결과를 재사용하도록 함 (Chromium은 2시간으로 상한 적용)
+_CORS_PREFLIGHT_MAX_AGE = 86400  # 24시간
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=Config.CORS_ORIGINS,
@@ -69,44 +105,75 @@ app.add_middleware(
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["Content-Type", "X-API-Key", "Authorization", "X-No-Cache"],
     expose_headers=["X-Total-Count"],
-    max_age=3600,
+    max_age=_CORS_PREFLIGHT_MAX_AGE,
 )
 
-# HTTP 미들웨어 (요청/응답 매 요청 로깅은 제거, 에러 시에만 로깅)
+# 응답 로그는 5xx와 느린 요청만 기록 (전체 접근 로그는 uvicorn access log)
+_SLOW_REQUEST_SECONDS = 0.5
+
+# 전역 캐시 싱글톤 (라우터와 동일하게 모듈 로드 시 한 번 바인딩)
+_cache = get_cache()
+
+
+# HTTP 미들웨어 (매 요청 로깅 없이 에러/느린 요청만 로깅)
 @app.middleware("http")
 async def http_middleware(request: Request, call_next):
-    start_time = time.time()
-    client_host = request.client.host if request.client else "unknown"
+    start_time = time.perf_counter()
+    # request.url은 전체 URL을 조립하고 request.client는 접근마다 Address를 만듦 → scope에서 직접 읽음
+    scope = request.scope
+    method = scope["method"]
+    path = scope["path"]
+    client = scope.get("client")
+    client_host = client[0] if client else "unknown"
 
     # X-No-Cache 헤더가 있으면 백엔드 캐시 클리어 (프론트엔드 새로고침 용도)
-    if request.headers.get("X-No-Cache") == "true":
-        from app.utils.cache import get_cache
-        cache = get_cache()
-        cache.clear()
+    # ASGI scope 헤더는 소문자 bytes → Headers 객체를 만들지 않고 바로 비교
+    if any(k == b"x-no-cache" and v == b"true" for k, v in scope["headers"]):
+        _cache.clear()
         logger.info("Cache cleared via X-No-Cache header")
 
     try:
         response = await call_next(request)
-        return response
     except Exception as e:
-        process_time = time.time() - start_time
+        process_time = time.perf_counter() - start_time
         log_error(
             logger,
             error=e,
             context={
-                "method": request.method,
-                "path": str(request.url.path),
+                "method": method,
+                "path": path,
                 "client_host": client_host,
                 "duration_ms": process_time,
             },
         )
         raise
 
+    process_time = time.perf_counter() - start_time
+    if response.status_code >= 500 or process_time > _SLOW_REQUEST_SECONDS:
+        # 응답 전송 후 로깅 (로그 직렬화/출력 비용이 클라이언트 응답 시간에 포함되지 않도록)
+        log_task = BackgroundTask(
+            log_response,
+            logger,
+            method=method,
+            path=path,
+            status_code=response.status_code,
+            duration_ms=process_time,
+            client_host=client_host,
+        )
+        if response.background is None:
+            response.background = log_task
+        else:
+            # 기존 백그라운드 작업이 있으면 덮어쓰지 않고 뒤에 이어서 실행
+            tasks = BackgroundTasks()
+            tasks.add_task(response.background)
+            tasks.add_task(log_task)
+            response.background = tasks
+    return response
+
 # Initialize database and scheduler on startup
 @app.on_event("startup")
 async def startup_event():
     # 저장된 API 키 로드 (api-keys.json → os.environ)
-    from app.routers.settings import load_api_keys_to_env
     load_api_keys_to_env()
 
     logger.info(message="initializing_database", phase="app_startup")
@@ -134,6 +201,8 @@ async def startup_event():
 async def shutdown_event():
     scheduler = get_scheduler()
     scheduler.stop()
+    # 큐에 남은 알림 트리거 기록
+    get_alert_trigger_writer().stop()
 
 # Include routers
 app.include_router(etfs.router, prefix="/api/etfs", tags=["ETFs"])
@@ -9,6 +9,8 @@ API Key 기반 인증 시스템:
 from fastapi import Request, HTTPException, status, Depends
 from fastapi.security import APIKeyHeader
 from typing import Optional
+import functools
+import hmac
 import logging
 
 from app.config import Config
@@ -19,6 +21,18 @@ logger = logging.getLogger(__name__)
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
+@functools.lru_cache(maxsize=4)
+def _encode_api_key(api_key: str) -> bytes:
+    """설정된 API Key의 bytes (값이 바뀌지 않는 한 요청마다 다시 인코딩하지 않음)"""
+    return api_key.encode("utf-8")
+
+
+@functools.cache
+def _log_missing_api_key() -> None:
+    """API_KEY 미설정 에러는 프로세스당 한 번만 로깅"""
+    logger.error("API_KEY가 환경 변수에 설정되지 않았습니다. 보안을 위해 모든 요청을 거부합니다.")
+
+
 class APIKeyAuth:
     """API Key 인증 클래스
 
@@ -44,10 +58,11 @@ class APIKeyAuth:
         valid_api_key = Config.API_KEY
 
         if not valid_api_key:
-            logger.error("API_KEY가 환경 변수에 설정되지 않았습니다. 보안을 위해 모든 요청을 거부합니다.")
+            _log_missing_api_key()
             return False  # API Key 미설정 시 모든 요청 거부 (보안 강화)
 
-        return api_key == valid_api_key
+        # 상수 시간 비교 (응답 시간 차이로 키를 추측하는 타이밍 공격 방지)
+        return hmac.compare_digest(api_key.encode("utf-8"), _encode_api_key(valid_api_key))
 
 
 async def verify_api_key_dependency(api_key: Optional[str] = Depends(api_key_header)) -> str:
@@ -73,8 +88,6 @@ async def verify_api_key_dependency(api_key: Optional[str] = Depends(api_key_hea
             return {"status": "ok"}
         ```
     """
-    logger.info(f"[인증] API Key 검증 시작 - 제공된 API Key: {'있음' if api_key else '없음'}")
-
     # 개발 모드: API_KEY가 설정되지 않은 경우 경고와 함께 허용
     if not Config.API_KEY:
         import os
@@ -104,5 +117,4 @@ async def verify_api_key_dependency(api_key: Optional[str] = Depends(api_key_hea
             headers={"WWW-Authenticate": "ApiKey"},
         )
 
-    logger.info("[인증] API Key 검증 성공")
     return api_key
@@ -0,0 +1,53 @@
+"""
+DB 오류 공통 핸들러
+
+라우터마다 try/except로 감싸지 않고, 처리되지 않은 드라이버 예외(sqlite3.Error / psycopg2.Error)와
+앱 DatabaseException을 여기서 한 번에 로깅하고 JSON 응답으로 변환한다.
+(등록하지 않으면 Starlette 기본 text/plain 500이 CORS 헤더 없이 나간다)
+- 커넥션 풀 고갈(PoolExhaustedException): 503 (일시적, 재시도 가능)
+- 그 외 DB 오류: 500
+"""
+from fastapi import Request
+from fastapi.responses import JSONResponse
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def database_error_handler(request: Request, exc: Exception) -> JSONResponse:
+    """
+    DB 예외 → 500 응답
+
+    Args:
+        request: FastAPI Request 객체
+        exc: sqlite3.Error, psycopg2.Error 또는 DatabaseException
+
+    Returns:
+        JSONResponse: 500 상태 코드와 에러 메시지
+    """
+    # 메시지 포맷은 로그가 실제로 기록될 때만 수행 (exc_info로 traceback 포함)
+    logger.error("Database error on %s %s", request.scope["method"], request.scope["path"], exc_info=exc)
+
+    return JSONResponse(
+        status_code=500,
+        content={"detail": "데이터베이스 처리 중 오류가 발생했습니다"},
+    )
+
+
+def pool_exhausted_handler(request: Request, exc: Exception) -> JSONResponse:
+    """
+    커넥션 풀 고갈 → 503 응답
+
+    Args:
+        request: FastAPI Request 객체
+        exc: PoolExhaustedException
+
+    Returns:
+        JSONResponse: 503 상태 코드와 에러 메시지
+    """
+    logger.warning("Connection pool exhausted on %s %s: %s", request.scope["method"], request.scope["path"], exc)
+
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "데이터베이스 연결이 일시적으로 부족합니다. 잠시 후 다시 시도해주세요"},
+    )
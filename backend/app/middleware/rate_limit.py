@@ -8,7 +8,6 @@ slowapi를 사용한 요청 빈도 제한:
 - Rate Limit 헤더 자동 추가
 """
 from slowapi import Limiter
-from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
@@ -16,9 +15,21 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+
+def get_client_ip(request: Request) -> str:
+    """
+    Rate Limit 키: 클라이언트 IP
+
+    slowapi의 get_remote_address와 같은 값(없으면 127.0.0.1)을 반환하되,
+    request.client(접근마다 Address 생성) 대신 ASGI scope의 client 튜플을 직접 읽는다.
+    """
+    client = request.scope.get("client")
+    return client[0] if client and client[0] else "127.0.0.1"
+
+
 # Limiter 인스턴스 생성
 # key_func: 클라이언트 식별 방법 (IP 주소 기반)
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(key_func=get_client_ip)
 
 
 def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> JSONResponse:
@@ -33,7 +44,7 @@ def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> JSO
         JSONResponse: 429 상태 코드와 에러 메시지
     """
     # 클라이언트 IP 로깅
-    client_ip = get_remote_address(request)
+    client_ip = get_client_ip(request)
     logger.warning(f"Rate limit exceeded for IP: {client_ip} on {request.url.path}")
 
     return JSONResponse(
@@ -0,0 +1,136 @@
+"""
+GET 응답 캐시 미들웨어
+
+직렬화가 끝난 응답(바디/상태/헤더)을 MemoryCache에 보관해 동일 요청을 바로 반환:
+- 경로 prefix별 TTL (RESPONSE_CACHE_TTL_BY_PREFIX), 200 응답만 저장
+- 캐시 키에 라우터 캐시와 같은 태그(prices:{ticker} 등)를 포함해
+  기존 invalidate_pattern / clear 호출로 함께 무효화됨
+- 저장된 응답에 ETag가 있으면 HIT 시에도 If-None-Match를 확인해 304 반환
+- 핸들러 예외/5xx 시 TTL이 지난 응답이라도 stale 보관 기간 내면 대신 반환 (stale-if-error)
+"""
+import hashlib
+import logging
+import time
+from typing import Optional
+
+from fastapi import Request, Response
+
+from app.constants import (
+    RESPONSE_CACHE_EXCLUDED_PATHS,
+    RESPONSE_CACHE_STALE_SECONDS,
+    RESPONSE_CACHE_TTL_BY_PREFIX,
+)
+from app.utils.cache import get_cache
+from app.utils.http_cache import etag_matches
+
+logger = logging.getLogger(__name__)
+
+# /api/etfs/{ticker}/{sub} 의 sub → 라우터 캐시 태그 (etfs.py의 invalidate_pattern과 동일)
+_ETF_SUBRESOURCE_TAGS = {
+    "prices": "prices",
+    "trading-flow": "trading_flow",
+    "metrics": "metrics",
+    "intraday": "intraday",
+}
+
+
+def _get_ttl(path: str) -> Optional[int]:
+    """캐시 대상 경로면 TTL(초), 아니면 None"""
+    if path in RESPONSE_CACHE_EXCLUDED_PATHS:
+        return None
+    for prefix, ttl in RESPONSE_CACHE_TTL_BY_PREFIX.items():
+        if path == prefix or path.startswith(prefix + "/"):
+            return ttl
+    return None
+
+
+def _invalidation_tag(path: str) -> str:
+    """
+    경로 → 라우터 캐시와 같은 무효화 태그
+
+    예: /api/etfs/487240/prices → "prices:487240", /api/news/487240 → "news:487240"
+    """
+    parts = [p for p in path.split("/") if p]
+    if len(parts) >= 3 and parts[1] == "etfs" and parts[2] != "compare":
+        ticker = parts[2]
+        sub = parts[3] if len(parts) > 3 else ""
+        return f"{_ETF_SUBRESOURCE_TAGS.get(sub, 'etf')}:{ticker}"
+    if len(parts) >= 3 and parts[1] == "news":
+        return f"news:{parts[2]}"
+    return ""
+
+
+def make_response_cache_key(request: Request) -> str:
+    """
+    응답 캐시 키 생성
+
+    경로(/api/etfs 포함 → invalidate_pattern("etfs")에 매칭) + 무효화 태그 + 쿼리 +
+    API 키 해시 (인증 여부가 다른 요청끼리 응답을 공유하지 않도록) +
+    gzip 수용 여부 (GZipMiddleware가 안쪽에 있어 압축된 바디가 그대로 저장되므로)
+    """
+    scope = request.scope
+    headers = request.headers
+    api_key = headers.get("X-API-Key", "")
+    key_hash = hashlib.sha256(api_key.encode()).hexdigest()[:16] if api_key else "-"
+    encoding = "gzip" if "gzip" in headers.get("Accept-Encoding", "") else "identity"
+    path = scope["path"]
+    query = scope.get("query_string", b"").decode("latin-1")
+    return f"http|{_invalidation_tag(path)}|{path}?{query}|{key_hash}|{encoding}"
+
+
+def _build_response(entry: dict, cache_status: str) -> Response:
+    response = Response(
+        content=entry["body"],
+        status_code=entry["status_code"],
+        headers=entry["headers"],
+    )
+    response.headers["X-Cache"] = cache_status
+    return response
+
+
+async def response_cache_middleware(request: Request, call_next):
+    """GET 요청 응답 캐시 (캐시 대상이 아니면 그대로 통과)"""
+    scope = request.scope
+    if scope["method"] != "GET":
+        return await call_next(request)
+    path = scope["path"]
+    ttl = _get_ttl(path)
+    if ttl is None:
+        return await call_next(request)
+
+    cache = get_cache()
+    key = make_response_cache_key(request)
+    entry = cache.get(key)
+    if entry is not None and time.monotonic() < entry["fresh_until"]:
+        # 핸들러가 붙인 ETag가 클라이언트 것과 같으면 본문 없이 304 (저장된 헤더 키는 소문자)
+        etag = entry["headers"].get("etag")
+        if etag and etag_matches(request.headers.get("if-none-match"), etag):
+            headers = {"ETag": etag}
+            if "cache-control" in entry["headers"]:
+                headers["Cache-Control"] = entry["headers"]["cache-control"]
+            return Response(status_code=304, headers={**headers, "X-Cache": "HIT"})
+        return _build_response(entry, "HIT")
+
+    try:
+        response = await call_next(request)
+    except Exception:
+        if entry is None:
+            raise
+        logger.warning(f"Serving stale cached response for {path}")
+        return _build_response(entry, "STALE")
+
+    if response.status_code >= 500 and entry is not None:
+        logger.warning(f"Serving stale cached response for {path}")
+        return _build_response(entry, "STALE")
+    if response.status_code != 200:
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    new_entry = {
+        "body": body,
+        "status_code": response.status_code,
+        "headers": dict(response.headers),
+        "fresh_until": time.monotonic() + ttl,
+    }
+    cache.set(key, new_entry, ttl_seconds=ttl + RESPONSE_CACHE_STALE_SECONDS)
+    return _build_response(new_entry, "MISS")
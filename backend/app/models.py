@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List, Dict
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+from typing import Optional, List, Dict, Literal
 from datetime import date, datetime
 
 class ETF(BaseModel):
@@ -14,6 +14,8 @@ class ETF(BaseModel):
     relevance_keywords: Optional[List[str]] = None
 
 class PriceData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")  # 조회 전용: 생성 후 변경 없음
+
     date: date
     open_price: Optional[float] = None
     high_price: Optional[float] = None
@@ -23,12 +25,16 @@ class PriceData(BaseModel):
     daily_change_pct: Optional[float] = None
 
 class TradingFlow(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")  # 조회 전용: 생성 후 변경 없음
+
     date: date
     individual_net: int
     institutional_net: int
     foreign_net: int
 
 class News(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")  # 조회 전용: 생성 후 변경 없음
+
     date: date
     published_at: Optional[datetime] = None  # 뉴스 발행 시각 (표시용)
     title: str
@@ -46,10 +52,18 @@ class NewsListResponse(BaseModel):
     news: List[NewsWithAnalysis]
     analysis: Optional[Dict] = None  # 전체 분석 결과 (sentiment, topics, summary)
 
+class ReturnsBreakdown(BaseModel):
+    """기간별 수익률 (%) - JSON 키는 "1w"/"1m"/"ytd" 유지 (필드명으로도 생성 가능)"""
+    model_config = ConfigDict(populate_by_name=True)
+
+    one_w: Optional[float] = Field(default=None, alias="1w")
+    one_m: Optional[float] = Field(default=None, alias="1m")
+    ytd: Optional[float] = None
+
 class ETFMetrics(BaseModel):
     ticker: str
     aum: Optional[float] = None  # in billions KRW
-    returns: dict  # {"1w": 0.023, "1m": 0.085, "ytd": 0.153}
+    returns: ReturnsBreakdown  # {"1w": 2.3, "1m": 8.5, "ytd": 15.3}
     volatility: Optional[float] = None
     max_drawdown: Optional[float] = None  # 최대 낙폭 (%)
     sharpe_ratio: Optional[float] = None  # 샤프 비율
@@ -88,7 +102,7 @@ class StockUpdate(BaseModel):
 class StockDeleteResponse(BaseModel):
     """종목 삭제 응답"""
     ticker: str
-    deleted: dict  # {"prices": 150, "news": 20, "trading_flow": 30}
+    deleted: Dict[str, int]  # {"prices": 150, "news": 20, "trading_flow": 30}
 
 # Batch API Models
 class ETFCardSummary(BaseModel):
@@ -117,7 +131,7 @@ class BatchSummaryRequest(BaseModel):
 
 class BatchSummaryResponse(BaseModel):
     """배치 요약 응답"""
-    data: dict  # {ticker: ETFCardSummary}
+    data: Dict[str, ETFCardSummary]  # {ticker: ETFCardSummary}
 
 # Insights API Models
 class StrategyInsights(BaseModel):
@@ -136,18 +150,32 @@ class ETFInsights(BaseModel):
 
 
 # Alert Models
+AlertType = Literal["buy", "sell", "price_change", "trading_signal"]
+AlertDirection = Literal["above", "below", "both"]
+
 class AlertRuleCreate(BaseModel):
     """알림 규칙 생성 요청"""
     ticker: str
-    alert_type: str  # "buy", "sell", "price_change", "trading_signal"
-    direction: str  # "above", "below", "both"
+    alert_type: AlertType
+    direction: AlertDirection
     target_price: float  # 목표가(buy/sell) 또는 임계%(price_change) 또는 0(trading_signal)
     memo: Optional[str] = None
 
+    @field_validator('target_price')
+    @classmethod
+    def validate_target_price(cls, v, info: ValidationInfo):
+        # alert_type이 먼저 선언되어 있어 info.data에서 조회 가능 (검증 실패 시 키 없음)
+        alert_type = info.data.get('alert_type')
+        if alert_type in ("buy", "sell") and v <= 0:
+            raise ValueError('목표가는 0보다 커야 합니다')
+        if alert_type == "price_change" and (v <= 0 or v > 100):
+            raise ValueError('등락률 임계값은 0~100 사이여야 합니다')
+        return v
+
 class AlertRuleUpdate(BaseModel):
     """알림 규칙 수정 요청"""
-    alert_type: Optional[str] = None
-    direction: Optional[str] = None
+    alert_type: Optional[AlertType] = None
+    direction: Optional[AlertDirection] = None
     target_price: Optional[float] = None
     memo: Optional[str] = None
     is_active: Optional[int] = None
@@ -168,6 +196,8 @@ class AlertRuleResponse(BaseModel):
 # Screening Models
 class ScreeningItem(BaseModel):
     """스크리닝 결과 항목"""
+    model_config = ConfigDict(frozen=True, extra="ignore")  # 조회 전용: 생성 후 변경 없음
+
     ticker: str
     name: str
     type: str
@@ -4,12 +4,18 @@
 - price_change: 급등/급락 알림 (target_price = 임계 %)
 - trading_signal: 외국인·기관 동시 매수/매도 시그널
 """
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Request
 from typing import List
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from app.models import AlertRuleCreate, AlertRuleUpdate, AlertRuleResponse
 from app.database import get_db_connection, get_cursor, USE_POSTGRES
 from app.dependencies import verify_api_key_dependency
+from app.services.alert_trigger_writer import get_alert_trigger_writer
+from app.utils import json_utils
+from app.utils.cache import get_cache, make_cache_key
+from app.utils.http_cache import etag_json_response
+from app.constants import CACHE_TTL_BY_ENDPOINT
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,27 +24,35 @@ router = APIRouter()
 
 PP = "%s" if USE_POSTGRES else "?"
 
-# 허용되는 alert_type / direction 조합
-VALID_ALERT_TYPES = {"buy", "sell", "price_change", "trading_signal"}
-VALID_DIRECTIONS = {"above", "below", "both"}
-
-
-def _validate_rule(alert_type: str, direction: str, target_price: float):
-    """공통 유효성 검사"""
-    if alert_type not in VALID_ALERT_TYPES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"alert_type은 {VALID_ALERT_TYPES} 중 하나여야 합니다",
-        )
-    if direction not in VALID_DIRECTIONS:
-        raise HTTPException(
-            status_code=400,
-            detail=f"direction은 {VALID_DIRECTIONS} 중 하나여야 합니다",
-        )
-    if alert_type in ("buy", "sell") and target_price <= 0:
-        raise HTTPException(status_code=400, detail="목표가는 0보다 커야 합니다")
-    if alert_type == "price_change" and (target_price <= 0 or target_price > 100):
-        raise HTTPException(status_code=400, detail="등락률 임계값은 0~100 사이여야 합니다")
+# 핸들러에서 쓰는 고정 SQL을 모듈 상단에 모아 둔다 (쿼리를 한 곳에서 확인/수정).
+_SQL_SELECT_RULE = f"SELECT * FROM alert_rules WHERE id = {PP}"
+
+_SQL_SELECT_RULES_ACTIVE = (
+    f"SELECT * FROM alert_rules WHERE ticker = {PP} "
+    f"AND {'is_active = true' if USE_POSTGRES else 'is_active = 1'} ORDER BY created_at DESC"
+)
+
+_SQL_SELECT_RULES_ALL = f"SELECT * FROM alert_rules WHERE ticker = {PP} ORDER BY created_at DESC"
+
+_SQL_INSERT_RULE = f"""INSERT INTO alert_rules (ticker, alert_type, direction, target_price, memo)
+    VALUES ({PP}, {PP}, {PP}, {PP}, {PP})"""
+
+_SQL_SELECT_HISTORY = (
+    f"SELECT * FROM alert_history WHERE ticker = {PP} ORDER BY triggered_at DESC LIMIT {PP}"
+)
+
+_SQL_DELETE_HISTORY_BY_RULE = f"DELETE FROM alert_history WHERE rule_id = {PP}"
+
+_SQL_DELETE_RULE = f"DELETE FROM alert_rules WHERE id = {PP}"
+
+# 목록 응답: 한 번 검증 후 바로 JSON bytes로 직렬화
+# (dict 반환 시 FastAPI가 response_model로 재검증 → jsonable_encoder → json.dumps 세 단계를 거침)
+_ALERT_RULES_ADAPTER = TypeAdapter(List[AlertRuleResponse])
+
+
+def _invalidate_rules_cache(ticker: str):
+    """종목의 알림 규칙 목록 캐시 삭제 (active_only 두 경우 모두)"""
+    get_cache().invalidate_pattern(f"alert_rules:{ticker}:")
 
 
 # ──────────────────────── 알림 트리거 기록 ────────────────────────
@@ -55,211 +69,187 @@ class AlertTriggerRequest(BaseModel):
 
 @router.post("/trigger")
 async def record_alert_trigger(req: AlertTriggerRequest, api_key: str = Depends(verify_api_key_dependency)):
-    """프론트엔드에서 감지한 알림 트리거를 히스토리에 기록"""
-    try:
-        with get_db_connection() as conn_or_cursor:
-            if USE_POSTGRES:
-                cursor = conn_or_cursor
-                conn = cursor.connection
-            else:
-                conn = conn_or_cursor
-                cursor = conn.cursor()
-
-            cursor.execute(
-                f"""INSERT INTO alert_history (rule_id, ticker, alert_type, message)
-                    VALUES ({PP}, {PP}, {PP}, {PP})""",
-                (req.rule_id, req.ticker, req.alert_type, req.message),
-            )
-
-            # alert_rules의 last_triggered_at 업데이트
-            cursor.execute(
-                f"UPDATE alert_rules SET last_triggered_at = CURRENT_TIMESTAMP WHERE id = {PP}",
-                (req.rule_id,),
-            )
-            conn.commit()
-
-            return {"recorded": True}
-    except Exception as e:
-        logger.error(f"Failed to record alert trigger: {e}")
-        raise HTTPException(status_code=500, detail="알림 기록 실패")
+    """
+    프론트엔드에서 감지한 알림 트리거를 히스토리에 기록
+
+    기록은 AlertTriggerWriter가 배치로 처리하므로 큐에 넣고 바로 반환 (프론트엔드는 fire-and-forget)
+    """
+    get_alert_trigger_writer().enqueue(req.rule_id, req.ticker, req.alert_type, req.message)
+    return {"recorded": True}
+
+
+def _select_alert_history(ticker: str, limit: int) -> str:
+    """알림 이력 조회 후 JSON 직렬화 (스레드에서 실행)"""
+    with get_db_connection() as conn_or_cursor:
+        cursor = get_cursor(conn_or_cursor)
+        cursor.execute(_SQL_SELECT_HISTORY, (ticker, limit))
+        return json_utils.dumps([dict(row) for row in cursor], default=str)
 
 
 @router.get("/history/{ticker}")
 async def get_alert_history(
+    request: Request,
     ticker: str,
     limit: int = Query(20, ge=1, le=100),
 ):
     """종목별 알림 이력 조회"""
-    try:
-        with get_db_connection() as conn_or_cursor:
-            cursor = get_cursor(conn_or_cursor)
-            cursor.execute(
-                f"SELECT * FROM alert_history WHERE ticker = {PP} ORDER BY triggered_at DESC LIMIT {PP}",
-                (ticker, limit),
-            )
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
-    except Exception as e:
-        logger.error(f"Failed to fetch alert history for {ticker}: {e}")
-        raise HTTPException(status_code=500, detail="알림 이력 조회 실패")
+    content = await asyncio.to_thread(_select_alert_history, ticker, limit)
+    return etag_json_response(request, content.encode())
 
 
 # ──────────────────────────── CRUD ────────────────────────────
 
 
+def _insert_alert_rule(rule: AlertRuleCreate) -> dict:
+    """알림 규칙 INSERT 후 생성된 행 반환 (스레드에서 실행)"""
+    with get_db_connection() as conn_or_cursor:
+        if USE_POSTGRES:
+            cursor = conn_or_cursor
+            conn = cursor.connection
+        else:
+            conn = conn_or_cursor
+            cursor = conn.cursor()
+
+        params = (rule.ticker, rule.alert_type, rule.direction, rule.target_price, rule.memo)
+
+        # PostgreSQL: RETURNING으로 생성된 행을 INSERT와 함께 조회
+        # SQLite: lastrowid로 한 번만 재조회
+        if USE_POSTGRES:
+            cursor.execute(_SQL_INSERT_RULE + " RETURNING *", params)
+            row = cursor.fetchone()
+        else:
+            cursor.execute(_SQL_INSERT_RULE, params)
+            cursor.execute(_SQL_SELECT_RULE, (cursor.lastrowid,))
+            row = cursor.fetchone()
+        conn.commit()
+        _invalidate_rules_cache(rule.ticker)
+
+        return dict(row)
+
+
 @router.post("/", response_model=AlertRuleResponse)
 async def create_alert_rule(rule: AlertRuleCreate, api_key: str = Depends(verify_api_key_dependency)):
     """알림 규칙 생성"""
-    _validate_rule(rule.alert_type, rule.direction, rule.target_price)
-
-    try:
-        with get_db_connection() as conn_or_cursor:
-            if USE_POSTGRES:
-                cursor = conn_or_cursor
-                conn = cursor.connection
-            else:
-                conn = conn_or_cursor
-                cursor = conn.cursor()
-
-            cursor.execute(
-                f"""INSERT INTO alert_rules (ticker, alert_type, direction, target_price, memo)
-                    VALUES ({PP}, {PP}, {PP}, {PP}, {PP})""",
-                (rule.ticker, rule.alert_type, rule.direction, rule.target_price, rule.memo),
-            )
-            conn.commit()
-
-            if USE_POSTGRES:
-                cursor.execute("SELECT lastval()")
-                new_id = cursor.fetchone()["lastval"]
-            else:
-                new_id = cursor.lastrowid
-
-            cursor.execute(f"SELECT * FROM alert_rules WHERE id = {PP}", (new_id,))
-            row = cursor.fetchone()
-            return dict(row)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to create alert rule: {e}")
-        raise HTTPException(status_code=500, detail="알림 규칙 생성 실패")
+    return await asyncio.to_thread(_insert_alert_rule, rule)
+
+
+def _select_alert_rules(ticker: str, active_only: bool) -> bytes:
+    """알림 규칙 목록 조회 후 JSON bytes로 직렬화 (스레드에서 실행)"""
+    with get_db_connection() as conn_or_cursor:
+        cursor = get_cursor(conn_or_cursor)
+
+        cursor.execute(_SQL_SELECT_RULES_ACTIVE if active_only else _SQL_SELECT_RULES_ALL, (ticker,))
+
+        rules = _ALERT_RULES_ADAPTER.validate_python([dict(row) for row in cursor])
+        return _ALERT_RULES_ADAPTER.dump_json(rules)
 
 
 @router.get("/{ticker}", response_model=List[AlertRuleResponse])
 async def get_alert_rules(
+    request: Request,
     ticker: str,
     active_only: bool = Query(True, description="활성 규칙만 조회"),
 ):
     """종목별 알림 규칙 목록 조회"""
-    try:
-        with get_db_connection() as conn_or_cursor:
-            cursor = get_cursor(conn_or_cursor)
-
-            if active_only:
-                is_active_cmp = "is_active = true" if USE_POSTGRES else "is_active = 1"
-                cursor.execute(
-                    f"SELECT * FROM alert_rules WHERE ticker = {PP} AND {is_active_cmp} ORDER BY created_at DESC",
-                    (ticker,),
-                )
-            else:
-                cursor.execute(
-                    f"SELECT * FROM alert_rules WHERE ticker = {PP} ORDER BY created_at DESC",
-                    (ticker,),
-                )
-
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
-    except Exception as e:
-        logger.error(f"Failed to fetch alert rules for {ticker}: {e}")
-        raise HTTPException(status_code=500, detail="알림 규칙 조회 실패")
+    cache = get_cache()
+    cache_key = make_cache_key("alert_rules", ticker=ticker, active_only=active_only)
+    content = cache.get(cache_key)
+    if content is None:
+        content = await asyncio.to_thread(_select_alert_rules, ticker, active_only)
+        # 직렬화된 bytes를 캐싱 (생성/수정/삭제/트리거 시 무효화)
+        cache.set(cache_key, content, ttl_seconds=CACHE_TTL_BY_ENDPOINT["alert_rules"])
+    return etag_json_response(request, content)
+
+
+def _update_alert_rule(rule_id: int, sql: str, params: list) -> dict:
+    """알림 규칙 UPDATE 후 수정된 행 반환 (스레드에서 실행)"""
+    with get_db_connection() as conn_or_cursor:
+        if USE_POSTGRES:
+            cursor = conn_or_cursor
+            conn = cursor.connection
+        else:
+            conn = conn_or_cursor
+            cursor = conn.cursor()
+
+        # 존재 확인 SELECT 없이 UPDATE 결과로 404 판단
+        # (PostgreSQL: RETURNING으로 수정된 행까지 한 번에, SQLite: rowcount 확인 후 재조회)
+        if USE_POSTGRES:
+            cursor.execute(sql + " RETURNING *", params)
+            row = cursor.fetchone()
+            updated = row is not None
+        else:
+            cursor.execute(sql, params)
+            updated = cursor.rowcount > 0
+        if not updated:
+            conn.rollback()
+            raise HTTPException(status_code=404, detail="알림 규칙을 찾을 수 없습니다")
+        if not USE_POSTGRES:
+            cursor.execute(_SQL_SELECT_RULE, (rule_id,))
+            row = cursor.fetchone()
+        conn.commit()
+        _invalidate_rules_cache(row["ticker"])
+
+        return dict(row)
 
 
 @router.put("/{rule_id}", response_model=AlertRuleResponse)
 async def update_alert_rule(rule_id: int, rule: AlertRuleUpdate, api_key: str = Depends(verify_api_key_dependency)):
     """알림 규칙 수정"""
-    try:
-        with get_db_connection() as conn_or_cursor:
-            if USE_POSTGRES:
-                cursor = conn_or_cursor
-                conn = cursor.connection
-            else:
-                conn = conn_or_cursor
-                cursor = conn.cursor()
-
-            cursor.execute(f"SELECT * FROM alert_rules WHERE id = {PP}", (rule_id,))
-            existing = cursor.fetchone()
-            if not existing:
-                raise HTTPException(status_code=404, detail="알림 규칙을 찾을 수 없습니다")
-
-            updates = []
-            params = []
-
-            if rule.alert_type is not None:
-                if rule.alert_type not in VALID_ALERT_TYPES:
-                    raise HTTPException(status_code=400, detail=f"alert_type은 {VALID_ALERT_TYPES} 중 하나여야 합니다")
-                updates.append(f"alert_type = {PP}")
-                params.append(rule.alert_type)
-
-            if rule.direction is not None:
-                if rule.direction not in VALID_DIRECTIONS:
-                    raise HTTPException(status_code=400, detail=f"direction은 {VALID_DIRECTIONS} 중 하나여야 합니다")
-                updates.append(f"direction = {PP}")
-                params.append(rule.direction)
-
-            if rule.target_price is not None:
-                updates.append(f"target_price = {PP}")
-                params.append(rule.target_price)
-
-            if rule.memo is not None:
-                updates.append(f"memo = {PP}")
-                params.append(rule.memo)
-
-            if rule.is_active is not None:
-                updates.append(f"is_active = {PP}")
-                params.append(rule.is_active)
-
-            if not updates:
-                raise HTTPException(status_code=400, detail="수정할 필드가 없습니다")
-
-            params.append(rule_id)
-            cursor.execute(
-                f"UPDATE alert_rules SET {', '.join(updates)} WHERE id = {PP}",
-                params,
-            )
-            conn.commit()
-
-            cursor.execute(f"SELECT * FROM alert_rules WHERE id = {PP}", (rule_id,))
-            row = cursor.fetchone()
-            return dict(row)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to update alert rule {rule_id}: {e}")
-        raise HTTPException(status_code=500, detail="알림 규칙 수정 실패")
+    updates = []
+    params = []
+
+    if rule.alert_type is not None:
+        updates.append(f"alert_type = {PP}")
+        params.append(rule.alert_type)
+
+    if rule.direction is not None:
+        updates.append(f"direction = {PP}")
+        params.append(rule.direction)
+
+    if rule.target_price is not None:
+        updates.append(f"target_price = {PP}")
+        params.append(rule.target_price)
+
+    if rule.memo is not None:
+        updates.append(f"memo = {PP}")
+        params.append(rule.memo)
+
+    if rule.is_active is not None:
+        updates.append(f"is_active = {PP}")
+        params.append(rule.is_active)
+
+    if not updates:
+        raise HTTPException(status_code=400, detail="수정할 필드가 없습니다")
+
+    params.append(rule_id)
+    sql = f"UPDATE alert_rules SET {', '.join(updates)} WHERE id = {PP}"
+    return await asyncio.to_thread(_update_alert_rule, rule_id, sql, params)
+
+
+def _delete_alert_rule(rule_id: int) -> dict:
+    """알림 규칙과 이력 삭제 (스레드에서 실행)"""
+    with get_db_connection() as conn_or_cursor:
+        if USE_POSTGRES:
+            cursor = conn_or_cursor
+            conn = cursor.connection
+        else:
+            conn = conn_or_cursor
+            cursor = conn.cursor()
+
+        # 존재 확인 SELECT 없이 삭제된 행 수로 404 판단 (이력은 FK 때문에 먼저 삭제)
+        cursor.execute(_SQL_DELETE_HISTORY_BY_RULE, (rule_id,))
+        cursor.execute(_SQL_DELETE_RULE, (rule_id,))
+        if cursor.rowcount == 0:
+            conn.rollback()
+            raise HTTPException(status_code=404, detail="알림 규칙을 찾을 수 없습니다")
+        conn.commit()
+        # 삭제된 규칙의 ticker를 따로 조회하지 않으므로 전체 규칙 목록 캐시 삭제 (삭제는 드묾)
+        get_cache().invalidate_pattern("alert_rules:")
+
+        return {"deleted": True, "id": rule_id}
 
 
 @router.delete("/{rule_id}")
 async def delete_alert_rule(rule_id: int, api_key: str = Depends(verify_api_key_dependency)):
     """알림 규칙 삭제"""
-    try:
-        with get_db_connection() as conn_or_cursor:
-            if USE_POSTGRES:
-                cursor = conn_or_cursor
-                conn = cursor.connection
-            else:
-                conn = conn_or_cursor
-                cursor = conn.cursor()
-
-            cursor.execute(f"SELECT id FROM alert_rules WHERE id = {PP}", (rule_id,))
-            if not cursor.fetchone():
-                raise HTTPException(status_code=404, detail="알림 규칙을 찾을 수 없습니다")
-
-            cursor.execute(f"DELETE FROM alert_history WHERE rule_id = {PP}", (rule_id,))
-            cursor.execute(f"DELETE FROM alert_rules WHERE id = {PP}", (rule_id,))
-            conn.commit()
-
-            return {"deleted": True, "id": rule_id}
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to delete alert rule {rule_id}: {e}")
-        raise HTTPException(status_code=500, detail="알림 규칙 삭제 실패")
+    return await asyncio.to_thread(_delete_alert_rule, rule_id)
@@ -2,13 +2,19 @@
 데이터 수집 관련 API 라우터
 """
 
-from fastapi import APIRouter, HTTPException, Query, Depends, Request
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Depends, Request
+from app.database import get_db_connection, DB_PATH, USE_POSTGRES
 from app.services.data_collector import ETFDataCollector
+from app.services.etf_fundamentals_collector import ETFFundamentalsCollector
+from app.services.progress import get_progress
+from app.services.stock_fundamentals_collector import collect_stock_fundamentals
 from app.services.scheduler import get_scheduler
 from app.exceptions import DatabaseException, ValidationException, ScraperException
-from app.dependencies import verify_api_key_dependency
+from app.dependencies import verify_api_key_dependency, get_collector
 from app.middleware.rate_limit import limiter, RateLimitConfig
+from app.utils import json_utils
 from app.utils.cache import get_cache, make_cache_key
+from app.utils.http_cache import etag_json_response
 from app.constants import (
     MAX_COLLECTION_DAYS,
     DEFAULT_COLLECTION_DAYS,
@@ -26,13 +32,16 @@ from app.constants import (
     ERROR_INTERNAL_GET_SCHEDULER_STATUS,
     ERROR_INTERNAL_GET_STATS,
     ERROR_INTERNAL_RESET,
-    CACHE_TTL_STATUS,
-    CACHE_TTL_STATS,
+    CACHE_TTL_BY_ENDPOINT,
 )
+from datetime import date, datetime, timedelta
+import asyncio
 import sqlite3
 import logging
 import os
 
+import pytz
+
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
@@ -40,9 +49,51 @@ logger = logging.getLogger(__name__)
 CACHE_TTL_SECONDS = int(float(os.getenv("CACHE_TTL_MINUTES", "0.5")) * 60)
 cache = get_cache(ttl_seconds=CACHE_TTL_SECONDS)
 
+# 한국 시간대 (스케줄러 수집 시간 갱신용)
+KST = pytz.timezone('Asia/Seoul')
+
 # 펀더멘털 병렬 수집 동시성 (가격 수집 ThreadPoolExecutor와 동일하게 5)
 FUNDAMENTALS_MAX_WORKERS = 5
 
+# /stats에서 PostgreSQL 통계 기반 근사 건수를 쓰는 대용량 테이블
+_APPROX_COUNT_TABLES = ("prices", "news", "trading_flow")
+
+
+def _get_sqlite_file_size() -> int:
+    """
+    SQLite DB 파일 크기(바이트) - stat 1회, 짧게 캐싱
+
+    파일 크기는 자주 바뀌지 않으므로 CACHE_TTL_BY_ENDPOINT["db_size"] 동안 재사용
+    (수집/초기화의 cache.clear()로 함께 무효화)
+    """
+    cache_key = make_cache_key("db_size")
+    size = cache.get(cache_key)
+    if size is not None:
+        return size
+    try:
+        size = os.stat(DB_PATH).st_size if DB_PATH else 0
+    except FileNotFoundError:
+        size = 0
+    cache.set(cache_key, size, ttl_seconds=CACHE_TTL_BY_ENDPOINT["db_size"])
+    return size
+
+
+def _stats_count_sql(table: str, use_postgres: bool) -> str:
+    """
+    /stats 테이블 건수 스칼라 서브쿼리
+
+    PostgreSQL 대용량 테이블은 COUNT(*) 전체 스캔 대신 pg_class.reltuples(ANALYZE 통계, O(1)) 사용.
+    ANALYZE 전이거나 TRUNCATE 직후(reltuples = -1)에는 정확한 COUNT(*)로 대체.
+    """
+    exact = f"(SELECT COUNT(*) FROM {table})"
+    if not (use_postgres and table in _APPROX_COUNT_TABLES):
+        return exact
+    return (
+        f"COALESCE((SELECT reltuples::bigint FROM pg_class "
+        f"WHERE oid = '{table}'::regclass AND reltuples >= 0), {exact})"
+    )
+
+
 @router.get("/collect-progress")
 async def get_collect_progress(request: Request):
     """
@@ -51,7 +102,6 @@ async def get_collect_progress(request: Request):
     Returns:
         현재 수집 진행 상태 (idle, in_progress, completed)
     """
-    from app.services.progress import get_progress
     progress = get_progress("collect-all")
     return progress or {"status": "idle"}
 
@@ -61,7 +111,8 @@ async def get_collect_progress(request: Request):
 async def collect_all_data(
     request: Request,
     days: int = Query(DEFAULT_COLLECTION_DAYS, ge=1, le=MAX_COLLECTION_DAYS, description=f"수집할 일수 (기본: {DEFAULT_COLLECTION_DAYS}일)"),
-    api_key: str = Depends(verify_api_key_dependency)
+    api_key: str = Depends(verify_api_key_dependency),
+    collector: ETFDataCollector = Depends(get_collector)
 ):
     """
     전체 종목 데이터 일괄 수집
@@ -116,22 +167,14 @@ async def collect_all_data(
     - 대량 수집 시 시간이 오래 걸릴 수 있음 (약 6초/종목)
     """
     try:
-        from datetime import datetime
-        import pytz
-        import asyncio
-        from app.services.progress import clear_progress
-        from app.services.etf_fundamentals_collector import ETFFundamentalsCollector
-        from app.services.stock_fundamentals_collector import collect_stock_fundamentals
-
-        collector = ETFDataCollector()
         result = await asyncio.to_thread(collector.collect_all_tickers, days=days)
 
         # 수집 완료 후 스케줄러의 마지막 수집 시간 업데이트
         try:
             scheduler = get_scheduler()
-            KST = pytz.timezone('Asia/Seoul')
             scheduler.last_collection_time = datetime.now(KST)
             logger.debug(f"스케줄러 마지막 수집 시간 업데이트: {scheduler.last_collection_time}")
+            cache.delete(make_cache_key("scheduler_status"))
         except Exception as e:
             logger.warning(f"스케줄러 마지막 수집 시간 업데이트 실패 (무시): {e}")
 
@@ -139,7 +182,6 @@ async def collect_all_data(
         fundamentals_success = 0
         fundamentals_failed = 0
         try:
-            from app.database import get_db_connection, USE_POSTGRES
             with get_db_connection() as conn_or_cursor:
                 if USE_POSTGRES:
                     _cursor = conn_or_cursor
@@ -223,7 +265,8 @@ async def collect_all_data(
 async def backfill_data(
     request: Request,
     days: int = Query(DEFAULT_BACKFILL_DAYS, ge=1, le=MAX_COLLECTION_DAYS, description=f"백필할 일수 (기본: {DEFAULT_BACKFILL_DAYS}일)"),
-    api_key: str = Depends(verify_api_key_dependency)
+    api_key: str = Depends(verify_api_key_dependency),
+    collector: ETFDataCollector = Depends(get_collector)
 ):
     """
     모든 종목의 히스토리 데이터를 백필
@@ -234,7 +277,6 @@ async def backfill_data(
         백필 결과 및 종목별 상세 정보
     """
     try:
-        collector = ETFDataCollector()
         result = collector.backfill_all_tickers(days=days)
 
         # 백필 후 모든 캐시 무효화 (히스토리 데이터 갱신)
@@ -259,49 +301,50 @@ async def backfill_data(
         raise HTTPException(status_code=500, detail=ERROR_INTERNAL_BACKFILL)
 
 
+def _build_collection_status(collector: ETFDataCollector) -> dict:
+    """종목별 수집 현황 집계 (DB 조회 - 스레드에서 실행)"""
+    all_etfs = collector.get_all_etfs()
+
+    # 최근 30일 종목별 건수/최신일을 한 번의 GROUP BY 집계로 조회 (가격 행 조회 없이)
+    start_date = date.today() - timedelta(days=30)
+    summary = collector.get_recent_price_summary(start_date)
+
+    status_list = []
+    for etf in all_etfs:
+        count, latest_date = summary.get(etf.ticker, (0, None))
+
+        status_list.append({
+            "ticker": etf.ticker,
+            "name": etf.name,
+            "type": etf.type,
+            "recent_data_count": count,
+            "latest_date": latest_date
+        })
+
+    return {
+        "total_tickers": len(all_etfs),
+        "status": status_list
+    }
+
+
 @router.get("/status")
 @limiter.limit(RateLimitConfig.READ_ONLY)
-async def get_collection_status(request: Request):
+async def get_collection_status(request: Request, collector: ETFDataCollector = Depends(get_collector)):
     """
     데이터 수집 상태 조회
 
     Returns:
         각 종목별 데이터 수집 현황
     """
-    # 캐시 확인
     cache_key = make_cache_key("status")
-    cached_result = cache.get(cache_key)
-    if cached_result is not None:
-        logger.debug(f"Cache hit for {cache_key}")
-        return cached_result
-
     try:
-        collector = ETFDataCollector()
-        all_etfs = collector.get_all_etfs()
-
-        status_list = []
-        for etf in all_etfs:
-            # 최근 30일 데이터 조회
-            from datetime import date, timedelta
-            end_date = date.today()
-            start_date = end_date - timedelta(days=30)
-
-            prices = collector.get_price_data(etf.ticker, start_date, end_date)
-
-            status_list.append({
-                "ticker": etf.ticker,
-                "name": etf.name,
-                "type": etf.type,
-                "recent_data_count": len(prices),
-                "latest_date": prices[0].date if prices else None
-            })
-
-        result = {
-            "total_tickers": len(all_etfs),
-            "status": status_list
-        }
-        cache.set(cache_key, result, ttl_seconds=CACHE_TTL_STATUS)  # 10초 캐싱 (상태 정보)
-        return result
+        # 캐시 만료 직후 동시 요청은 한 번만 집계 (single-flight)
+        # 수집/초기화 시 무효화되므로 TTL은 안전망 (invalidate_data_summary_cache)
+        return await cache.aget_or_set(
+            cache_key,
+            lambda: asyncio.to_thread(_build_collection_status, collector),
+            ttl_seconds=CACHE_TTL_BY_ENDPOINT["status"],
+        )
     except sqlite3.Error as e:
         logger.error(f"Database error getting collection status: {e}")
         raise HTTPException(status_code=500, detail=ERROR_DATABASE)
@@ -319,29 +362,109 @@ async def get_scheduler_status(request: Request):
     Returns:
         스케줄러 실행 상태 및 마지막 수집 시간
     """
-    # 캐시 확인
+    # 직렬화된 본문을 캐시 → 폴링 시 dict 재직렬화 없이 ETag 비교만 하고, 변화가 없으면 304
     cache_key = make_cache_key("scheduler_status")
-    cached_result = cache.get(cache_key)
-    if cached_result is not None:
-        logger.debug(f"Cache hit for {cache_key}")
-        return cached_result
-
-    try:
-        scheduler = get_scheduler()
-        status = scheduler.get_status()
+    body = cache.get(cache_key)
+    if body is None:
+        try:
+            scheduler = get_scheduler()
+            status = scheduler.get_status()
+
+            body = json_utils.dumps({
+                "scheduler": status,
+                "message": "Scheduler status retrieved successfully"
+            }).encode()
+        except sqlite3.Error as e:
+            logger.error(f"Database error getting scheduler status: {e}")
+            raise HTTPException(status_code=500, detail=ERROR_DATABASE)
+        except Exception as e:
+            logger.error(f"Unexpected error getting scheduler status: {e}", exc_info=True)
+            raise HTTPException(status_code=500, detail=ERROR_INTERNAL_GET_SCHEDULER_STATUS)
+        cache.set(cache_key, body, ttl_seconds=CACHE_TTL_BY_ENDPOINT["scheduler_status"])  # 10초 캐싱 (상태 정보)
+
+    return etag_json_response(request, body)
+
+
+def _build_data_stats() -> dict:
+    """전체 통계 집계 (DB 조회 - 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+    with get_db_connection() as conn_or_cursor:
+        # PostgreSQL과 SQLite 처리 분기
+        if USE_POSTGRES:
+            cursor = conn_or_cursor
+        else:
+            cursor = conn_or_cursor.cursor()
+
+        # 각 테이블의 레코드 수 + 최근 가격 날짜를 한 번의 쿼리로 조회
+        # (PostgreSQL의 prices/news/trading_flow는 통계 기반 근사치, _stats_count_sql 참고)
+        # stock_catalog.is_active - PostgreSQL: BOOLEAN, SQLite: INTEGER (1/0)
+        # → 부분 인덱스 idx_stock_catalog_active와 같은 조건이라 인덱스만으로 집계
+        is_active_true = "TRUE" if USE_POSTGRES else "1"
+        cursor.execute(f"""
+            SELECT {_stats_count_sql("etfs", USE_POSTGRES)} AS etfs,
+                   {_stats_count_sql("prices", USE_POSTGRES)} AS prices,
+                   {_stats_count_sql("news", USE_POSTGRES)} AS news,
+                   {_stats_count_sql("trading_flow", USE_POSTGRES)} AS trading_flow,
+                   (SELECT COUNT(*) FROM stock_catalog WHERE is_active = {is_active_true}) AS stock_catalog,
+                   (SELECT MAX(date) FROM prices) AS last_price_date
+        """)
+        counts = cursor.fetchone()
+        etfs_count = counts['etfs']
+        prices_count = counts['prices']
+        news_count = counts['news']
+        trading_flow_count = counts['trading_flow']
+        stock_catalog_count = counts['stock_catalog']
+
+        # 마지막 수집 시간 (스케줄러의 수집 실행 시간을 우선 사용)
+        last_collection = None
+
+        # 방법 1: 스케줄러의 마지막 수집 시간 확인 (수집이 실행된 실제 시간)
+        try:
+            scheduler = get_scheduler()
+            status = scheduler.get_status()
+            scheduler_time = status.get("last_collection_time")
+            if scheduler_time:
+                last_collection = scheduler_time
+        except (AttributeError, KeyError, Exception) as e:
+            logger.warning(f"Failed to get scheduler status: {e}")
+
+        # 방법 2: 스케줄러 시간이 없으면 데이터베이스에서 가장 최근 데이터 날짜 사용 (위 집계 쿼리에서 조회)
+        if not last_collection:
+            last_price_date = counts['last_price_date']
+
+            if last_price_date:
+                # 날짜를 datetime으로 변환
+                try:
+                    # PostgreSQL은 date 객체를 반환할 수 있음
+                    if hasattr(last_price_date, 'isoformat'):
+                        last_collection = last_price_date.isoformat()
+                    else:
+                        last_collection = datetime.fromisoformat(str(last_price_date)).isoformat()
+                except (ValueError, TypeError) as e:
+                    logger.warning(f"Failed to parse last_price_date: {last_price_date}, error: {e}")
+                    last_collection = str(last_price_date)
+
+        # 데이터베이스 파일 크기 (MB) - SQLite만 해당
+        if USE_POSTGRES:
+            # PostgreSQL에서는 데이터베이스 크기 조회
+            try:
+                cursor.execute("SELECT pg_database_size(current_database()) as size")
+                result = cursor.fetchone()
+                db_size_bytes = result['size'] if result else 0
+            except Exception:
+                db_size_bytes = 0
+        else:
+            db_size_bytes = _get_sqlite_file_size()
+        db_size_mb = round(db_size_bytes / (1024 * 1024), 2)
 
-        result = {
-            "scheduler": status,
-            "message": "Scheduler status retrieved successfully"
+        return {
+            "etfs": etfs_count,
+            "prices": prices_count,
+            "news": news_count,
+            "trading_flow": trading_flow_count,
+            "stock_catalog": stock_catalog_count,
+            "last_collection": last_collection,
+            "database_size_mb": db_size_mb
         }
-        cache.set(cache_key, result, ttl_seconds=CACHE_TTL_STATUS)  # 10초 캐싱 (상태 정보)
-        return result
-    except sqlite3.Error as e:
-        logger.error(f"Database error getting scheduler status: {e}")
-        raise HTTPException(status_code=500, detail=ERROR_DATABASE)
-    except Exception as e:
-        logger.error(f"Unexpected error getting scheduler status: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=ERROR_INTERNAL_GET_SCHEDULER_STATUS)
 
 
 @router.get("/stats")
@@ -369,108 +492,15 @@ async def get_data_stats(request: Request):
     - 200: 성공
     - 500: 서버 오류
     """
-    # 캐시 확인
     cache_key = make_cache_key("stats")
-    cached_result = cache.get(cache_key)
-    if cached_result is not None:
-        logger.debug(f"Cache hit for {cache_key}")
-        return cached_result
-
     try:
-        from app.database import get_db_connection, DB_PATH, USE_POSTGRES
-
-        with get_db_connection() as conn_or_cursor:
-            # PostgreSQL과 SQLite 처리 분기
-            if USE_POSTGRES:
-                cursor = conn_or_cursor
-            else:
-                cursor = conn_or_cursor.cursor()
-
-            # 각 테이블의 레코드 수 조회
-            cursor.execute("SELECT COUNT(*) as cnt FROM etfs")
-            result = cursor.fetchone()
-            etfs_count = result['cnt'] if USE_POSTGRES else result[0]
-
-            cursor.execute("SELECT COUNT(*) as cnt FROM prices")
-            result = cursor.fetchone()
-            prices_count = result['cnt'] if USE_POSTGRES else result[0]
-
-            cursor.execute("SELECT COUNT(*) as cnt FROM news")
-            result = cursor.fetchone()
-            news_count = result['cnt'] if USE_POSTGRES else result[0]
-
-            cursor.execute("SELECT COUNT(*) as cnt FROM trading_flow")
-            result = cursor.fetchone()
-            trading_flow_count = result['cnt'] if USE_POSTGRES else result[0]
-
-            # stock_catalog 테이블의 종목 목록 수 조회
-            # PostgreSQL: is_active는 BOOLEAN, SQLite: INTEGER (1/0)
-            if USE_POSTGRES:
-                cursor.execute("SELECT COUNT(*) as cnt FROM stock_catalog WHERE is_active = TRUE")
-            else:
-                cursor.execute("SELECT COUNT(*) as cnt FROM stock_catalog WHERE is_active = 1")
-            result = cursor.fetchone()
-            stock_catalog_count = result['cnt'] if USE_POSTGRES else result[0]
-
-            # 마지막 수집 시간 (스케줄러의 수집 실행 시간을 우선 사용)
-            last_collection = None
-
-            # 방법 1: 스케줄러의 마지막 수집 시간 확인 (수집이 실행된 실제 시간)
-            try:
-                scheduler = get_scheduler()
-                status = scheduler.get_status()
-                scheduler_time = status.get("last_collection_time")
-                if scheduler_time:
-                    last_collection = scheduler_time
-            except (AttributeError, KeyError, Exception) as e:
-                logger.warning(f"Failed to get scheduler status: {e}")
-
-            # 방법 2: 스케줄러 시간이 없으면 데이터베이스에서 가장 최근 데이터 날짜 조회
-            if not last_collection:
-                cursor.execute("""
-                    SELECT MAX(date) as last_date
-                    FROM prices
-                """)
-                result = cursor.fetchone()
-                last_price_date = result['last_date'] if USE_POSTGRES else result[0]
-
-                if last_price_date:
-                    # 날짜를 datetime으로 변환
-                    from datetime import datetime
-                    try:
-                        # PostgreSQL은 date 객체를 반환할 수 있음
-                        if hasattr(last_price_date, 'isoformat'):
-                            last_collection = last_price_date.isoformat()
-                        else:
-                            last_collection = datetime.fromisoformat(str(last_price_date)).isoformat()
-                    except (ValueError, TypeError) as e:
-                        logger.warning(f"Failed to parse last_price_date: {last_price_date}, error: {e}")
-                        last_collection = str(last_price_date)
-
-            # 데이터베이스 파일 크기 (MB) - SQLite만 해당
-            if USE_POSTGRES:
-                # PostgreSQL에서는 데이터베이스 크기 조회
-                try:
-                    cursor.execute("SELECT pg_database_size(current_database()) as size")
-                    result = cursor.fetchone()
-                    db_size_bytes = result['size'] if result else 0
-                except Exception:
-                    db_size_bytes = 0
-            else:
-                db_size_bytes = os.path.getsize(DB_PATH) if DB_PATH and DB_PATH.exists() else 0
-            db_size_mb = round(db_size_bytes / (1024 * 1024), 2)
-
-            result = {
-                "etfs": etfs_count,
-                "prices": prices_count,
-                "news": news_count,
-                "trading_flow": trading_flow_count,
-                "stock_catalog": stock_catalog_count,
-                "last_collection": last_collection,
-                "database_size_mb": db_size_mb
-            }
-            cache.set(cache_key, result, ttl_seconds=CACHE_TTL_STATS)  # 1분 캐싱 (통계 정보)
-            return result
+        # 캐시 만료 직후 동시 요청은 한 번만 집계 (single-flight)
+        # 수집/초기화 시 무효화되므로 TTL은 안전망 (invalidate_data_summary_cache)
+        return await cache.aget_or_set(
+            cache_key,
+            lambda: asyncio.to_thread(_build_data_stats),
+            ttl_seconds=CACHE_TTL_BY_ENDPOINT["stats"],
+        )
     except sqlite3.Error as e:
         logger.error(f"Database error getting stats: {e}")
         raise HTTPException(status_code=500, detail=ERROR_DATABASE)
@@ -513,9 +543,29 @@ async def get_cache_stats(request: Request):
         raise HTTPException(status_code=500, detail="Failed to get cache statistics")
 
 
+def _vacuum_after_reset():
+    """
+    초기화 후 SQLite VACUUM (BackgroundTasks용)
+
+    전체 초기화로 생긴 빈 페이지를 회수하여 파일 크기 축소.
+    응답은 이미 전송된 뒤이므로 실패해도 로그만 남김 (데이터 삭제는 커밋 완료 상태)
+    """
+    try:
+        with get_db_connection() as conn:
+            logger.debug("Running VACUUM to reclaim disk space...")
+            conn.execute("VACUUM")
+            logger.info("VACUUM completed")
+    except sqlite3.Error as e:
+        logger.error(f"VACUUM after database reset failed: {e}")
+
+
 @router.delete("/reset")
 @limiter.limit(RateLimitConfig.DANGEROUS)
-async def reset_database(request: Request, api_key: str = Depends(verify_api_key_dependency)):
+async def reset_database(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    api_key: str = Depends(verify_api_key_dependency)
+):
     """
     데이터베이스 초기화 (위험!)
 
@@ -544,8 +594,6 @@ async def reset_database(request: Request, api_key: str = Depends(verify_api_key
     - 500: 서버 오류
     """
     try:
-        from app.database import get_db_connection, USE_POSTGRES
-
         logger.info("Database reset started")
         
         with get_db_connection() as conn_or_cursor:
@@ -557,27 +605,26 @@ async def reset_database(request: Request, api_key: str = Depends(verify_api_key
                 conn = conn_or_cursor
                 cursor = conn.cursor()
 
-            # 삭제 전 레코드 수 확인
-            logger.debug("Counting records before deletion...")
-            cursor.execute("SELECT COUNT(*) as cnt FROM prices")
-            result = cursor.fetchone()
-            prices_count = result['cnt'] if USE_POSTGRES else result[0]
-
-            cursor.execute("SELECT COUNT(*) as cnt FROM news")
-            result = cursor.fetchone()
-            news_count = result['cnt'] if USE_POSTGRES else result[0]
-
-            cursor.execute("SELECT COUNT(*) as cnt FROM trading_flow")
-            result = cursor.fetchone()
-            trading_flow_count = result['cnt'] if USE_POSTGRES else result[0]
-
-            cursor.execute("SELECT COUNT(*) as cnt FROM collection_status")
-            result = cursor.fetchone()
-            collection_status_count = result['cnt'] if USE_POSTGRES else result[0]
+            # SQLite: 쓰기 잠금을 먼저 잡고 한 트랜잭션으로 처리 (init_db와 동일)
+            # → 건수 조회와 삭제 사이에 스케줄러가 끼어들지 않아 응답 건수 = 실제 삭제 건수, commit(fsync) 1회
+            if not USE_POSTGRES and not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
 
-            cursor.execute("SELECT COUNT(*) as cnt FROM intraday_prices")
-            result = cursor.fetchone()
-            intraday_prices_count = result['cnt'] if USE_POSTGRES else result[0]
+            # 삭제 전 레코드 수 확인 (한 번의 쿼리로 조회)
+            logger.debug("Counting records before deletion...")
+            cursor.execute("""
+                SELECT (SELECT COUNT(*) FROM prices) AS prices,
+                       (SELECT COUNT(*) FROM news) AS news,
+                       (SELECT COUNT(*) FROM trading_flow) AS trading_flow,
+                       (SELECT COUNT(*) FROM collection_status) AS collection_status,
+                       (SELECT COUNT(*) FROM intraday_prices) AS intraday_prices
+            """)
+            counts = cursor.fetchone()
+            prices_count = counts['prices']
+            news_count = counts['news']
+            trading_flow_count = counts['trading_flow']
+            collection_status_count = counts['collection_status']
+            intraday_prices_count = counts['intraday_prices']
 
             logger.info(
                 f"Records to delete: prices={prices_count}, news={news_count}, "
@@ -587,28 +634,17 @@ async def reset_database(request: Request, api_key: str = Depends(verify_api_key
 
             # 테이블 데이터 삭제 (etfs 제외)
             logger.debug("Deleting data from tables...")
-            cursor.execute("DELETE FROM prices")
-            deleted_prices = cursor.rowcount if USE_POSTGRES else cursor.rowcount
-            logger.debug(f"Deleted {deleted_prices} rows from prices")
-
-            cursor.execute("DELETE FROM news")
-            deleted_news = cursor.rowcount if USE_POSTGRES else cursor.rowcount
-            logger.debug(f"Deleted {deleted_news} rows from news")
-
-            cursor.execute("DELETE FROM trading_flow")
-            deleted_trading_flow = cursor.rowcount if USE_POSTGRES else cursor.rowcount
-            logger.debug(f"Deleted {deleted_trading_flow} rows from trading_flow")
-
-            cursor.execute("DELETE FROM collection_status")
-            deleted_collection_status = cursor.rowcount if USE_POSTGRES else cursor.rowcount
-            logger.debug(f"Deleted {deleted_collection_status} rows from collection_status")
-
-            cursor.execute("DELETE FROM intraday_prices")
-            deleted_intraday = cursor.rowcount if USE_POSTGRES else cursor.rowcount
-            logger.debug(f"Deleted {deleted_intraday} rows from intraday_prices")
+            if USE_POSTGRES:
+                # TRUNCATE: 행 단위 삭제 없이 한 문장으로 비움, RESTART IDENTITY로 SERIAL ID도 1부터
+                cursor.execute(
+                    "TRUNCATE prices, news, trading_flow, collection_status, intraday_prices RESTART IDENTITY"
+                )
+            else:
+                # SQLite: WHERE 없는 DELETE는 truncate 최적화로 처리됨
+                for table in ("prices", "news", "trading_flow", "collection_status", "intraday_prices"):
+                    cursor.execute(f"DELETE FROM {table}")
 
-            # SQLite의 경우 sqlite_sequence 테이블 초기화 (AUTOINCREMENT ID를 1부터 다시 시작)
-            if not USE_POSTGRES:
+                # sqlite_sequence 테이블 초기화 (AUTOINCREMENT ID를 1부터 다시 시작)
                 logger.debug("Resetting SQLite sequences...")
                 try:
                     cursor.execute("DELETE FROM sqlite_sequence WHERE name IN ('prices', 'news', 'trading_flow', 'intraday_prices')")
@@ -622,11 +658,9 @@ async def reset_database(request: Request, api_key: str = Depends(verify_api_key
             conn.commit()
             logger.info("Transaction committed successfully")
 
-            # SQLite VACUUM: 전체 초기화이므로 빈 페이지를 회수하여 파일 크기 축소
+            # SQLite VACUUM: 파일 전체를 다시 쓰므로 응답 전송 후 백그라운드에서 실행
             if not USE_POSTGRES:
-                logger.debug("Running VACUUM to reclaim disk space...")
-                conn.execute("VACUUM")
-                logger.info("VACUUM completed")
+                background_tasks.add_task(_vacuum_after_reset)
 
             logger.warning(
                 f"Database reset: deleted {prices_count} prices, {news_count} news, "
@@ -12,7 +12,7 @@ from app.services.comparison_service import ComparisonService
 from app.exceptions import DatabaseException, ValidationException, ScraperException
 from app.utils.date_utils import apply_default_dates
 from app.utils.data_collection import auto_collect_if_needed
-from app.utils.cache import get_cache, make_cache_key
+from app.utils.cache import get_cache, make_cache_key, invalidate_data_summary_cache
 from app.dependencies import get_etf_or_404, get_collector, verify_api_key_dependency
 from app.middleware.rate_limit import limiter, RateLimitConfig
 from app.config import Config
@@ -31,9 +31,7 @@ from app.constants import (
     ERROR_INTERNAL_FETCH_METRICS,
     ERROR_INTERNAL_COMPARE,
     ERROR_INTERNAL_COLLECTION,
-    CACHE_TTL_STATIC,
-    CACHE_TTL_FAST_CHANGING,
-    CACHE_TTL_SLOW_CHANGING,
+    CACHE_TTL_BY_ENDPOINT,
 )
 import asyncio
 import sqlite3
@@ -102,7 +100,7 @@ async def get_etfs(collector: ETFDataCollector = Depends(get_collector)):
 
     try:
         result = collector.get_all_etfs()
-        cache.set(cache_key, result, ttl_seconds=CACHE_TTL_STATIC)  # 5분 캐싱 (정적 데이터)
+        cache.set(cache_key, result, ttl_seconds=CACHE_TTL_BY_ENDPOINT["etfs"])  # 5분 캐싱 (정적 데이터)
         return result
     except sqlite3.Error as e:
         logger.error(f"Database error fetching ETFs: {e}")
@@ -238,7 +236,7 @@ async def compare_etfs(
         result = comparison_service.get_comparison_data(ticker_list, start_date, end_date)
 
         logger.info(f"Comparison completed for {len(ticker_list)} tickers")
-        cache.set(cache_key, result, ttl_seconds=CACHE_TTL_SLOW_CHANGING)  # 1분 캐싱 (복잡한 연산)
+        cache.set(cache_key, result, ttl_seconds=CACHE_TTL_BY_ENDPOINT["compare"])  # 1분 캐싱 (복잡한 연산)
         return result
 
     except ValidationException as e:
@@ -284,27 +282,8 @@ async def get_etf(etf: ETF = Depends(get_etf_or_404)):
     - 404: 종목을 찾을 수 없음
     - 500: 서버 오류
     """
-    # 캐시 확인
-    cache_key = make_cache_key("etf", ticker=etf.ticker)
-    cached_result = cache.get(cache_key)
-    if cached_result is not None:
-        logger.debug(f"Cache hit for {cache_key}")
-        return cached_result
-
-    try:
-        cache.set(cache_key, etf, ttl_seconds=CACHE_TTL_STATIC)  # 5분 캐싱 (정적 데이터)
-        return etf
-    except HTTPException:
-        raise
-    except sqlite3.Error as e:
-        logger.error(f"Database error fetching ETF {etf.ticker}: {e}")
-        raise HTTPException(status_code=500, detail=ERROR_DATABASE)
-    except ValidationException as e:
-        logger.error(f"Validation error for ticker {etf.ticker}: {e}")
-        raise HTTPException(status_code=400, detail=ERROR_VALIDATION_TICKER)
-    except Exception as e:
-        logger.error(f"Unexpected error fetching ETF {etf.ticker}: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=ERROR_INTERNAL)
+    # 종목 정보 조회/캐시는 get_etf_or_404 의존성에서 처리 ("etf:{ticker}" 키)
+    return etf
 
 @router.get("/{ticker}/prices", response_model=List[PriceData])
 async def get_prices(
@@ -409,7 +388,7 @@ async def get_prices(
         )
 
         logger.debug(f"Successfully fetched {len(prices)} price records for {etf.ticker}")
-        cache.set(cache_key, prices, ttl_seconds=CACHE_TTL_FAST_CHANGING)  # 30초 캐싱 (가격 데이터)
+        cache.set(cache_key, prices, ttl_seconds=CACHE_TTL_BY_ENDPOINT["prices"])  # 30초 캐싱 (가격 데이터)
         return prices
 
     except sqlite3.Error as e:
@@ -456,6 +435,7 @@ async def collect_prices(
         cache.invalidate_pattern(f"prices:{etf.ticker}")
         cache.invalidate_pattern(f"etf:{etf.ticker}")
         cache.invalidate_pattern(f"metrics:{etf.ticker}")
+        invalidate_data_summary_cache()
 
         if saved_count == 0:
             logger.warning(f"No data collected for {etf.ticker}")
@@ -528,11 +508,11 @@ async def get_trading_flow(
 
         if not trading_data:
             logger.warning(f"No trading flow data found for {etf.ticker} between {start_date} and {end_date}")
-            cache.set(cache_key, [], ttl_seconds=CACHE_TTL_FAST_CHANGING)  # 30초 캐싱 (빈 결과도 캐싱)
+            cache.set(cache_key, [], ttl_seconds=CACHE_TTL_BY_ENDPOINT["trading_flow"])  # 30초 캐싱 (빈 결과도 캐싱)
             return []
 
         logger.debug(f"Retrieved {len(trading_data)} trading flow records for {etf.ticker}")
-        cache.set(cache_key, trading_data, ttl_seconds=CACHE_TTL_FAST_CHANGING)  # 30초 캐싱 (매매동향)
+        cache.set(cache_key, trading_data, ttl_seconds=CACHE_TTL_BY_ENDPOINT["trading_flow"])  # 30초 캐싱 (매매동향)
         return trading_data
 
     except sqlite3.Error as e:
@@ -571,6 +551,7 @@ async def collect_trading_flow(
 
         # 수집 후 해당 티커의 캐시 무효화
         cache.invalidate_pattern(f"trading_flow:{etf.ticker}")
+        invalidate_data_summary_cache()
 
         return {
             "ticker": etf.ticker,
@@ -658,7 +639,7 @@ async def get_metrics(
 
     try:
         result = collector.get_etf_metrics(etf.ticker)
-        cache.set(cache_key, result, ttl_seconds=CACHE_TTL_SLOW_CHANGING)  # 1분 캐싱 (지표)
+        cache.set(cache_key, result, ttl_seconds=CACHE_TTL_BY_ENDPOINT["metrics"])  # 1분 캐싱 (지표)
         return result
     except sqlite3.Error as e:
         logger.error(f"Database error fetching metrics for {etf.ticker}: {e}")
@@ -736,7 +717,7 @@ async def get_insights(
         from app.services.insights_service import InsightsService
         insights_service = InsightsService()
         result = insights_service.get_insights(etf.ticker, period)
-        cache.set(cache_key, result, ttl_seconds=CACHE_TTL_SLOW_CHANGING)  # 1분 캐싱
+        cache.set(cache_key, result, ttl_seconds=CACHE_TTL_BY_ENDPOINT["insights"])  # 1분 캐싱
         return result
     except sqlite3.Error as e:
         logger.error(f"Database error fetching insights for {etf.ticker}: {e}")
@@ -892,7 +873,7 @@ async def get_batch_summary(
                 result_data[ticker] = ETFCardSummary(ticker=ticker)
 
         response = BatchSummaryResponse(data=result_data)
-        cache.set(cache_key, response, ttl_seconds=CACHE_TTL_FAST_CHANGING)  # 30초 캐싱 (배치 요약)
+        cache.set(cache_key, response, ttl_seconds=CACHE_TTL_BY_ENDPOINT["batch_summary"])  # 30초 캐싱 (배치 요약)
 
         logger.debug(f"Successfully fetched batch summary for {len(result_data)} tickers")
         return response
@@ -1113,7 +1094,7 @@ async def get_intraday_prices(
             # 수집 중에는 캐시하지 않음 (다음 요청에서 새 데이터 반영)
         else:
             # 장중에는 캐시 TTL을 짧게(15초), 장 외에는 기본값(30초) 사용
-            intraday_cache_ttl = 15 if is_market_hours else CACHE_TTL_FAST_CHANGING
+            intraday_cache_ttl = 15 if is_market_hours else CACHE_TTL_BY_ENDPOINT["intraday"]
             cache.set(cache_key, response, ttl_seconds=intraday_cache_ttl)
         return response
 
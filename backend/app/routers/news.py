@@ -7,7 +7,7 @@ from app.services.news_analyzer import NewsAnalyzer
 from app.services.data_collector import ETFDataCollector
 from app.exceptions import ValidationException, ScraperException
 from app.utils.date_utils import apply_default_dates
-from app.utils.cache import get_cache, make_cache_key
+from app.utils.cache import get_cache, make_cache_key, invalidate_data_summary_cache
 from app.dependencies import get_etf_or_404, get_collector, verify_api_key_dependency
 from app.constants import (
     ERROR_DATABASE,
@@ -16,7 +16,7 @@ from app.constants import (
     ERROR_VALIDATION_COLLECTION_PARAMS,
     ERROR_INTERNAL_FETCH_NEWS,
     ERROR_INTERNAL_COLLECTION,
-    CACHE_TTL_SLOW_CHANGING,
+    CACHE_TTL_BY_ENDPOINT,
 )
 import sqlite3
 import logging
@@ -72,6 +72,7 @@ async def get_news(
             days_to_collect = max(1, min(30, days_requested if days_requested > 0 else 7))
             try:
                 collect_result = scraper.collect_and_save_news(etf.ticker, days=days_to_collect)
+                invalidate_data_summary_cache()
                 logger.info(
                     "On-demand news collection completed for %s: %s",
                     etf.ticker,
@@ -92,7 +93,7 @@ async def get_news(
 
         if not news_list:
             logger.warning(f"No news found for {etf.ticker} between {start_date} and {end_date}")
-            cache.set(cache_key, [], ttl_seconds=CACHE_TTL_SLOW_CHANGING)  # 1분 캐싱 (빈 결과도 캐싱)
+            cache.set(cache_key, [], ttl_seconds=CACHE_TTL_BY_ENDPOINT["news"])  # 1분 캐싱 (빈 결과도 캐싱)
             return NewsListResponse(news=[], analysis=None)
 
         logger.debug(f"Retrieved {len(news_list)} news articles for {etf.ticker}")
@@ -152,7 +153,7 @@ async def get_news(
             ]
             response = NewsListResponse(news=basic_news, analysis=None)
 
-        cache.set(cache_key, response, ttl_seconds=CACHE_TTL_SLOW_CHANGING)  # 1분 캐싱 (뉴스)
+        cache.set(cache_key, response, ttl_seconds=CACHE_TTL_BY_ENDPOINT["news"])  # 1분 캐싱 (뉴스)
         return response
 
     except sqlite3.Error as e:
@@ -186,6 +187,7 @@ async def collect_news(
 
         # 수집 후 해당 티커의 뉴스 캐시 무효화
         cache.invalidate_pattern(f"news:{etf.ticker}")
+        invalidate_data_summary_cache()
 
         result['name'] = etf.name
         return result
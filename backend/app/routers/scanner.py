@@ -4,6 +4,7 @@ Scanner API 라우터
 ETF 조건 검색, 테마 탐색, 추천 프리셋 제공
 """
 import logging
+from types import MappingProxyType
 from fastapi import APIRouter, Query, BackgroundTasks, Request, Depends
 from typing import Optional, List
 from app.database import get_db_connection, get_cursor, USE_POSTGRES
@@ -18,10 +19,29 @@ router = APIRouter()
 
 SCANNER_CACHE_TTL = 60  # 60초
 
+# 정렬 컬럼 화이트리스트 (키: 파라미터명, 값: 실제 컬럼명)
+# 요청마다 dict를 새로 만들지 않도록 모듈 상수로 두고, MappingProxyType으로 읽기 전용
+ALLOWED_SORT_COLUMNS = MappingProxyType({
+    "weekly_return": "sc.weekly_return",
+    "monthly_return": "sc.monthly_return",
+    "ytd_return": "sc.ytd_return",
+    "daily_change_pct": "sc.daily_change_pct",
+    "volume": "sc.volume",
+    "close_price": "sc.close_price",
+    "foreign_net": "sc.foreign_net",
+    "institutional_net": "sc.institutional_net",
+    "name": "sc.name",
+})
+
 
 def _row_to_screening_item(row, registered_tickers: set) -> ScreeningItem:
-    """DB row를 ScreeningItem으로 변환"""
-    return ScreeningItem(
+    """
+    DB row를 ScreeningItem으로 변환
+
+    stock_catalog 컬럼 타입이 필드 타입과 일치하므로(REAL/BIGINT/TEXT, catalog_updated_at만 str 변환)
+    행마다 검증하지 않고 model_construct로 생성 (응답 직렬화 시 response_model 검증은 그대로 수행)
+    """
+    return ScreeningItem.model_construct(
         ticker=row['ticker'],
         name=row['name'],
         type=row['type'],
@@ -142,18 +162,6 @@ async def search_scanner(
 
     where_sql = " AND ".join(where_clauses)
 
-    # 정렬 컬럼 화이트리스트 (키: 파라미터명, 값: 실제 컬럼명)
-    ALLOWED_SORT_COLUMNS = {
-        "weekly_return": "sc.weekly_return",
-        "monthly_return": "sc.monthly_return",
-        "ytd_return": "sc.ytd_return",
-        "daily_change_pct": "sc.daily_change_pct",
-        "volume": "sc.volume",
-        "close_price": "sc.close_price",
-        "foreign_net": "sc.foreign_net",
-        "institutional_net": "sc.institutional_net",
-        "name": "sc.name",
-    }
     sort_column = ALLOWED_SORT_COLUMNS.get(sort_by, "sc.weekly_return")
     sort_dir_sql = "ASC" if sort_dir == "asc" else "DESC"
 
@@ -161,12 +169,7 @@ async def search_scanner(
         cursor = get_cursor(conn_or_cursor)
         registered_tickers = _get_registered_tickers(cursor)
 
-        # 전체 건수
-        cursor.execute(f"SELECT COUNT(*) as cnt FROM stock_catalog sc WHERE {where_sql}", params)
-        row = cursor.fetchone()
-        total = row['cnt'] if USE_POSTGRES else row[0]
-
-        # 데이터 조회
+        # 데이터 조회 (전체 건수는 COUNT(*) OVER()로 같은 쿼리에서 계산)
         offset = (page - 1) * page_size
         query_params = params + [page_size, offset]
 
@@ -182,7 +185,8 @@ async def search_scanner(
                    sc.weekly_return, sc.monthly_return, sc.ytd_return,
                    sc.ytd_base_date,
                    sc.foreign_net, sc.institutional_net,
-                   sc.catalog_updated_at
+                   sc.catalog_updated_at,
+                   COUNT(*) OVER() AS total_count
             FROM stock_catalog sc
             WHERE {where_sql}
             ORDER BY {order_clause}
@@ -191,6 +195,16 @@ async def search_scanner(
 
         rows = cursor.fetchall()
 
+        if rows:
+            total = rows[0]['total_count']
+        elif page == 1:
+            total = 0
+        else:
+            # 범위를 벗어난 페이지는 행이 없어 건수를 알 수 없으므로 별도 COUNT
+            cursor.execute(f"SELECT COUNT(*) as cnt FROM stock_catalog sc WHERE {where_sql}", params)
+            row = cursor.fetchone()
+            total = row['cnt'] if USE_POSTGRES else row[0]
+
     items = [_row_to_screening_item(dict(row), registered_tickers) for row in rows]
 
     result = ScreeningResponse(
@@ -9,6 +9,7 @@ from fastapi import APIRouter, HTTPException, Path as PathParam, Query, Depends,
 from pydantic import BaseModel
 from typing import Dict, Any, List, Optional
 from pathlib import Path
+import functools
 import logging
 import json
 import os
@@ -32,31 +33,56 @@ def _get_api_keys_path() -> str:
     return os.path.join(config_dir, "api-keys.json")
 
 
+# api-keys.json 파싱 결과 캐시: (경로, st_mtime_ns, st_size) → 키 dict
+_api_keys_cache: Optional[tuple] = None
+
+
 def _load_api_keys() -> Dict[str, str]:
-    """api-keys.json에서 API 키 로드"""
+    """
+    api-keys.json에서 API 키 로드
+
+    파일의 mtime/크기가 그대로면 이전 파싱 결과를 재사용한다 (호출자가 수정할 수 있도록 복사본 반환).
+    """
+    global _api_keys_cache
     keys_path = _get_api_keys_path()
-    if not os.path.exists(keys_path):
+    try:
+        stat = os.stat(keys_path)
+    except FileNotFoundError:
         return {}
+    signature = (keys_path, stat.st_mtime_ns, stat.st_size)
+    if _api_keys_cache is not None and _api_keys_cache[0] == signature:
+        return dict(_api_keys_cache[1])
     try:
         with open(keys_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+            keys = json.load(f)
     except Exception as e:
         logger.error(f"Failed to load api-keys.json: {e}")
         return {}
+    _api_keys_cache = (signature, keys)
+    return dict(keys)
 
 
 def _save_api_keys(keys: Dict[str, str]):
     """api-keys.json에 API 키 저장"""
+    global _api_keys_cache
     keys_path = _get_api_keys_path()
     config_dir = os.path.dirname(keys_path)
     if not os.path.exists(config_dir):
         os.makedirs(config_dir, exist_ok=True)
     with open(keys_path, "w", encoding="utf-8") as f:
         json.dump(keys, f, indent=2, ensure_ascii=False)
+    # mtime 해상도가 낮은 파일시스템에서도 다음 로드가 새 내용을 읽도록 캐시 폐기
+    _api_keys_cache = None
 
 
+@functools.cache
 def load_api_keys_to_env():
-    """저장된 API 키를 os.environ에 로드 (서버 시작 시 호출)"""
+    """
+    저장된 API 키를 os.environ에 로드 (서버 시작 시 호출)
+
+    프로세스당 한 번만 파일을 읽는다 (reload/테스트에서 startup이 반복돼도 재실행 안 함).
+    실행 중 변경은 update_api_keys 엔드포인트가 os.environ/Config에 직접 반영한다.
+    """
     keys = _load_api_keys()
     count = 0
     for key, value in keys.items():
@@ -176,9 +202,10 @@ async def create_stock(
         stocks_manager.add_stock(ticker, stock_dict)
 
         # 캐시 무효화 (ETF 목록 캐시 무효화하여 대시보드에 즉시 반영)
-        from app.utils.cache import get_cache
+        from app.utils.cache import get_cache, invalidate_data_summary_cache
         cache = get_cache()
         cache.invalidate_pattern("etfs")
+        invalidate_data_summary_cache()
         logger.info(f"Cache invalidated for etfs after creating stock {ticker}")
 
         # Return created stock
@@ -267,9 +294,10 @@ async def update_stock(
         stocks_manager.update_stock(ticker, merged_data)
 
         # 캐시 무효화 (ETF 상세 정보 캐시도 무효화)
-        from app.utils.cache import get_cache
+        from app.utils.cache import get_cache, invalidate_data_summary_cache
         cache = get_cache()
         cache.invalidate_pattern("etfs")
+        invalidate_data_summary_cache()
         cache.invalidate_pattern(f"etf:{ticker}")
 
         # Return updated stock
@@ -337,9 +365,10 @@ async def delete_stock(
         deleted_counts = stocks_manager.delete_stock(ticker)
 
         # 캐시 무효화 (ETF 목록 및 해당 종목 캐시 무효화)
-        from app.utils.cache import get_cache
+        from app.utils.cache import get_cache, invalidate_data_summary_cache
         cache = get_cache()
         cache.invalidate_pattern("etfs")
+        invalidate_data_summary_cache()
         cache.invalidate_pattern(f"etf:{ticker}")
         logger.info(f"Cache invalidated for etfs after deleting stock {ticker}")
 
@@ -459,6 +488,10 @@ async def collect_ticker_catalog(request: Request, api_key: str = Depends(verify
 
         result = await asyncio.to_thread(ticker_catalog_collector.collect_all_stocks)
 
+        # stock_catalog 건수가 바뀌므로 통계 캐시 무효화
+        from app.utils.cache import invalidate_data_summary_cache
+        invalidate_data_summary_cache()
+
         logger.info(f"[종목목록수집] 종목 목록 수집 완료: {result}")
         return result
 
@@ -595,12 +628,13 @@ async def reorder_stocks(
         
         # 데이터베이스 캐시 갱신 (필요 시)
         # Config 캐시 강제 갱신
-        Config._stock_config_cache = None
+        Config.reload_stock_config()
         
         # ETF 캐시 무효화 (순서가 변경되었으므로)
-        from app.utils.cache import get_cache
+        from app.utils.cache import get_cache, invalidate_data_summary_cache
         cache = get_cache()
         cache.invalidate_pattern("etfs")
+        invalidate_data_summary_cache()
         
         logger.info(f"Successfully reordered {len(tickers)} stocks")
         
@@ -0,0 +1,184 @@
+"""
+알림 트리거 기록 배치 writer
+
+프론트엔드가 감지한 알림 트리거(/api/alerts/trigger)를 큐에 쌓아 두고
+백그라운드 스레드가 짧은 간격으로 모아서 한 트랜잭션으로 기록한다.
+- alert_history: executemany 한 번
+- alert_rules.last_triggered_at: WHERE id IN (...) 한 번
+- commit 한 번 (요청마다 두 문장 + commit 하던 비용을 배치 단위로 분산)
+
+기록 시점에 이미 삭제된 규칙의 트리거는 WHERE EXISTS로 건너뛴다 (PostgreSQL FK 위반 방지).
+그 밖의 이유로 배치가 실패하면 롤백 후 한 건씩 다시 기록해 잘못된 한 건이 배치 전체를 잃게 하지 않는다.
+
+프론트엔드는 기록 결과를 기다리지 않으므로(fire-and-forget) 요청 핸들러는 큐에 넣고 바로 반환한다.
+"""
+import logging
+import queue
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from app.database import get_db_connection, USE_POSTGRES
+from app.utils.cache import get_cache
+
+logger = logging.getLogger(__name__)
+
+PP = "%s" if USE_POSTGRES else "?"
+
+# 마지막 파라미터는 rule_id (규칙이 삭제되었으면 INSERT하지 않음)
+_SQL_INSERT_HISTORY = f"""INSERT INTO alert_history (rule_id, ticker, alert_type, message)
+    SELECT {PP}, {PP}, {PP}, {PP}
+    WHERE EXISTS (SELECT 1 FROM alert_rules WHERE id = {PP})"""
+
+# (rule_id, ticker, alert_type, message)
+TriggerRow = Tuple[int, str, str, str]
+
+_STOP = object()
+
+
+class AlertTriggerWriter:
+    """alert_history 배치 기록 스레드"""
+
+    def __init__(self, flush_interval: float = 0.1, max_batch: int = 500):
+        """
+        Args:
+            flush_interval: 첫 항목 도착 후 배치를 모으는 대기 시간(초)
+            max_batch: 한 트랜잭션에 기록할 최대 건수
+        """
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        # 스레드의 기록과 flush()의 기록이 겹치지 않도록 직렬화
+        # (처리 완료는 queue.task_done()으로 표시해 flush()가 join()으로 대기)
+        self._write_lock = threading.Lock()
+
+    def enqueue(self, rule_id: int, ticker: str, alert_type: str, message: str):
+        """트리거 기록 예약 (즉시 반환)"""
+        self._ensure_started()
+        self._queue.put((rule_id, ticker, alert_type, message))
+
+    def flush(self):
+        """큐에 남은 항목을 기록하고, 스레드가 처리 중인 배치가 끝날 때까지 대기 (종료 시/테스트용)"""
+        batch = self._drain_nowait()
+        if batch:
+            with self._write_lock:
+                self._write(batch)
+            for _ in batch:
+                self._queue.task_done()
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def stop(self, timeout: float = 5.0):
+        """스레드 종료 후 남은 항목 기록"""
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join(timeout)
+        self._thread = None
+        self.flush()
+
+    def _ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="alert-trigger-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _drain_nowait(self, limit: Optional[int] = None) -> List[TriggerRow]:
+        """큐에서 대기 없이 꺼낼 수 있는 만큼 꺼냄 (_STOP은 다시 넣어 스레드가 종료하도록)"""
+        batch: List[TriggerRow] = []
+        while limit is None or len(batch) < limit:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)
+                self._queue.task_done()
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            # 동시에 발생한 트리거를 한 배치로 모으기 위해 잠깐 대기
+            time.sleep(self.flush_interval)
+            with self._write_lock:
+                batch = [item] + self._drain_nowait(self.max_batch - 1)
+                self._write(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _write(self, batch: List[TriggerRow]):
+        try:
+            self._write_rows(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                logger.error(f"Failed to record alert trigger {batch[0][:3]}: {e}")
+                return
+            logger.warning(f"Failed to record {len(batch)} alert triggers as a batch, retrying one by one: {e}")
+            written = []
+            for row in batch:
+                try:
+                    self._write_rows([row])
+                    written.append(row)
+                except Exception as row_error:
+                    logger.error(f"Failed to record alert trigger {row[:3]}: {row_error}")
+            batch = written
+            if not batch:
+                return
+
+        # last_triggered_at이 바뀌었으므로 알림 규칙 목록 캐시 무효화
+        cache = get_cache()
+        for ticker in {row[1] for row in batch}:
+            cache.invalidate_pattern(f"alert_rules:{ticker}:")
+
+    def _write_rows(self, rows: List[TriggerRow]):
+        """rows를 한 트랜잭션으로 기록 (실패 시 롤백 후 예외 전파)"""
+        with get_db_connection() as conn_or_cursor:
+            if USE_POSTGRES:
+                cursor = conn_or_cursor
+                conn = cursor.connection
+            else:
+                conn = conn_or_cursor
+                cursor = conn.cursor()
+
+            try:
+                cursor.executemany(_SQL_INSERT_HISTORY, [row + (row[0],) for row in rows])
+                rule_ids = sorted({row[0] for row in rows})
+                cursor.execute(
+                    f"UPDATE alert_rules SET last_triggered_at = CURRENT_TIMESTAMP "
+                    f"WHERE id IN ({', '.join([PP] * len(rule_ids))})",
+                    rule_ids,
+                )
+                conn.commit()
+            except Exception:
+                # 중단된 트랜잭션이 풀로 돌아가지 않도록 롤백
+                conn.rollback()
+                raise
+
+
+# 전역 writer 인스턴스
+_writer_instance: Optional[AlertTriggerWriter] = None
+
+
+def get_alert_trigger_writer() -> AlertTriggerWriter:
+    """
+    알림 트리거 writer 조회 (싱글톤 패턴)
+
+    Returns:
+        AlertTriggerWriter: writer 인스턴스
+    """
+    global _writer_instance
+    if _writer_instance is None:
+        _writer_instance = AlertTriggerWriter()
+    return _writer_instance
@@ -1,8 +1,9 @@
 from typing import List, Optional, Dict
 from datetime import date, datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from app.models import ETF, PriceData, TradingFlow, ETFMetrics
-from app.database import get_db_connection, get_cursor, USE_POSTGRES
+from app.models import ETF, PriceData, TradingFlow, ETFMetrics, ReturnsBreakdown
+from app.database import get_db_connection, get_ro_db_connection, get_cursor, USE_POSTGRES
+from app.utils import json_utils
 from app.utils.retry import retry_with_backoff
 from app.utils.rate_limiter import RateLimiter
 from app.constants import (
@@ -11,6 +12,7 @@ from app.constants import (
     PERCENT_MULTIPLIER,
     DEFAULT_RATE_LIMITER_INTERVAL
 )
+import json
 import logging
 import requests
 from bs4 import BeautifulSoup
@@ -406,7 +408,6 @@ class ETFDataCollector:
         Returns:
             List[ETF]: ETFs ordered by stocks.json file
         """
-        import json
         from app.config import Config
         from app.database import get_cursor
         
@@ -422,7 +423,7 @@ class ETFDataCollector:
                 # relevance_keywords를 JSON 문자열에서 리스트로 파싱
                 if row_dict.get('relevance_keywords'):
                     try:
-                        row_dict['relevance_keywords'] = json.loads(row_dict['relevance_keywords'])
+                        row_dict['relevance_keywords'] = json_utils.loads(row_dict['relevance_keywords'])
                     except json.JSONDecodeError:
                         row_dict['relevance_keywords'] = []
                 etfs_dict[row_dict['ticker']] = ETF(**row_dict)
@@ -438,7 +439,6 @@ class ETFDataCollector:
     
     def get_etf_info(self, ticker: str) -> Optional[ETF]:
         """Get basic info for specific ETF"""
-        import json
         from app.database import USE_POSTGRES
         param_placeholder = "%s" if USE_POSTGRES else "?"
         with get_db_connection() as conn_or_cursor:
@@ -450,7 +450,7 @@ class ETFDataCollector:
                 # relevance_keywords를 JSON 문자열에서 리스트로 파싱
                 if row_dict.get('relevance_keywords'):
                     try:
-                        row_dict['relevance_keywords'] = json.loads(row_dict['relevance_keywords'])
+                        row_dict['relevance_keywords'] = json_utils.loads(row_dict['relevance_keywords'])
                     except json.JSONDecodeError:
                         row_dict['relevance_keywords'] = []
                 return ETF(**row_dict)
@@ -531,7 +531,7 @@ class ETFDataCollector:
         logger.debug(f"Fetching prices for {ticker} from {start_date} to {end_date}" + (f" (limit: {limit})" if limit else ""))
         p = "%s" if USE_POSTGRES else "?"
 
-        with get_db_connection() as conn_or_cursor:
+        with get_ro_db_connection() as conn_or_cursor:
             cursor = get_cursor(conn_or_cursor)
 
             query = f"""
@@ -567,7 +567,7 @@ class ETFDataCollector:
         logger.debug(f"Fetching trading flow for {ticker} from {start_date} to {end_date}" + (f" (limit: {limit})" if limit else ""))
         p = "%s" if USE_POSTGRES else "?"
 
-        with get_db_connection() as conn_or_cursor:
+        with get_ro_db_connection() as conn_or_cursor:
             cursor = get_cursor(conn_or_cursor)
 
             query = f"""
@@ -602,7 +602,7 @@ class ETFDataCollector:
         p = "%s" if USE_POSTGRES else "?"
 
         try:
-            with get_db_connection() as conn_or_cursor:
+            with get_ro_db_connection() as conn_or_cursor:
                 cursor = get_cursor(conn_or_cursor)
 
                 # Get price data for calculations
@@ -623,7 +623,7 @@ class ETFDataCollector:
                     return ETFMetrics(
                         ticker=ticker,
                         aum=None,
-                        returns={"1w": None, "1m": None, "ytd": None},
+                        returns=ReturnsBreakdown(),
                         volatility=None
                     )
 
@@ -706,7 +706,7 @@ class ETFDataCollector:
                 return ETFMetrics(
                     ticker=ticker,
                     aum=None,  # AUM data not available from scraping
-                    returns=returns,
+                    returns=ReturnsBreakdown(one_w=returns['1w'], one_m=returns['1m'], ytd=returns['ytd']),
                     volatility=volatility,
                     max_drawdown=max_drawdown,
                     sharpe_ratio=sharpe_ratio
@@ -717,7 +717,7 @@ class ETFDataCollector:
             return ETFMetrics(
                 ticker=ticker,
                 aum=None,
-                returns={"1w": None, "1m": None, "ytd": None},
+                returns=ReturnsBreakdown(),
                 volatility=None
             )
     
@@ -1390,7 +1390,7 @@ class ETFDataCollector:
         logger.debug(f"Fetching trading flow for {ticker} from {start_date} to {end_date}" + (f" (limit: {limit})" if limit else ""))
         p = "%s" if USE_POSTGRES else "?"
 
-        with get_db_connection() as conn_or_cursor:
+        with get_ro_db_connection() as conn_or_cursor:
             cursor = get_cursor(conn_or_cursor)
 
             query = f"""
@@ -1432,7 +1432,7 @@ class ETFDataCollector:
         logger.debug(f"Batch fetching prices for {len(tickers)} tickers from {start_date} to {end_date}")
         p = "%s" if USE_POSTGRES else "?"
 
-        with get_db_connection() as conn_or_cursor:
+        with get_ro_db_connection() as conn_or_cursor:
             cursor = get_cursor(conn_or_cursor)
 
             # IN 절을 위한 플레이스홀더 생성
@@ -1493,7 +1493,7 @@ class ETFDataCollector:
         logger.debug(f"Batch fetching trading flow for {len(tickers)} tickers from {start_date} to {end_date}")
         p = "%s" if USE_POSTGRES else "?"
 
-        with get_db_connection() as conn_or_cursor:
+        with get_ro_db_connection() as conn_or_cursor:
             cursor = get_cursor(conn_or_cursor)
 
             # IN 절을 위한 플레이스홀더 생성
@@ -1547,7 +1547,7 @@ class ETFDataCollector:
         logger.info(f"Batch fetching latest prices for {len(tickers)} tickers")
         p = "%s" if USE_POSTGRES else "?"
 
-        with get_db_connection() as conn_or_cursor:
+        with get_ro_db_connection() as conn_or_cursor:
             cursor = get_cursor(conn_or_cursor)
 
             # IN 절을 위한 플레이스홀더 생성
@@ -1579,13 +1579,47 @@ class ETFDataCollector:
             logger.debug(f"Batch fetched latest prices for {len([v for v in result.values() if v])} tickers")
             return result
 
-    def calculate_missing_days(self, ticker: str, requested_days: int) -> int:
+    def get_recent_price_summary(self, start_date: date) -> Dict[str, tuple]:
+        """
+        start_date 이후 종목별 가격 데이터 건수와 최신 날짜를 한 번의 집계 쿼리로 조회
+
+        수집 현황(/api/data/status)처럼 건수·최신일만 필요할 때 사용 (행 조회/PriceData 생성 없음)
+
+        Args:
+            start_date: 집계 시작 날짜
+
+        Returns:
+            {ticker: (count, latest_date)} - 데이터가 없는 종목은 포함되지 않음
+        """
+        p = "%s" if USE_POSTGRES else "?"
+
+        with get_ro_db_connection() as conn_or_cursor:
+            cursor = get_cursor(conn_or_cursor)
+            cursor.execute(f"""
+                SELECT ticker, COUNT(*) AS cnt, MAX(date) AS latest_date
+                FROM prices
+                WHERE date >= {p}
+                GROUP BY ticker
+            """, (start_date,))
+
+            result = {}
+            for row in cursor.fetchall():
+                latest = row['latest_date']
+                # SQLite는 날짜를 문자열로 반환하므로 PriceData.date와 같은 date 타입으로 맞춤
+                if isinstance(latest, str):
+                    latest = date.fromisoformat(latest[:10])
+                result[row['ticker']] = (row['cnt'], latest)
+            return result
+
+    def calculate_missing_days(self, ticker: str, requested_days: int,
+                               status: Optional[dict] = None) -> int:
         """
         실제로 수집해야 할 일수 계산 (중복 방지 최적화)
 
         Args:
             ticker: 종목 코드
             requested_days: 사용자가 요청한 일수
+            status: 미리 조회한 수집 상태 (None이면 DB에서 조회, 이력 없음은 빈 dict)
 
         Returns:
             실제로 수집해야 할 일수 (0이면 수집 불필요)
@@ -1594,7 +1628,8 @@ class ETFDataCollector:
         from app.database import get_collection_status
 
         # collection_status에서 마지막 수집 날짜 확인
-        status = get_collection_status(ticker)
+        if status is None:
+            status = get_collection_status(ticker)
 
         if not status or not status.get('last_price_date'):
             # 수집 이력이 없으면 요청한 일수만큼 수집
@@ -1622,7 +1657,9 @@ class ETFDataCollector:
 
         return actual_days
 
-    def collect_and_save_prices_smart(self, ticker: str, days: int = 10) -> int:
+    def collect_and_save_prices_smart(self, ticker: str, days: int = 10,
+                                      status: Optional[dict] = None,
+                                      now: Optional[str] = None) -> int:
         """
         스마트 가격 데이터 수집 (중복 방지)
 
@@ -1631,6 +1668,8 @@ class ETFDataCollector:
         Args:
             ticker: 종목 코드
             days: 수집할 일수 (최대값)
+            status: 미리 조회한 수집 상태 (None이면 DB에서 조회)
+            now: 수집 상태에 기록할 배치 시각 (None이면 현재 시각)
 
         Returns:
             저장된 레코드 수
@@ -1639,7 +1678,7 @@ class ETFDataCollector:
         from app.database import update_collection_status
 
         # 실제로 수집해야 할 일수 계산
-        actual_days = self.calculate_missing_days(ticker, days)
+        actual_days = self.calculate_missing_days(ticker, days, status=status)
 
         if actual_days == 0:
             logger.info(f"[{ticker}] 스마트 수집: 최신 데이터 보유 → 스킵")
@@ -1651,7 +1690,7 @@ class ETFDataCollector:
 
         if not price_data:
             logger.warning(f"[{ticker}] 스마트 수집: 데이터 없음")
-            update_collection_status(ticker, success=False)
+            update_collection_status(ticker, success=False, now=now)
             return 0
 
         # 데이터 저장
@@ -1663,20 +1702,25 @@ class ETFDataCollector:
             update_collection_status(
                 ticker,
                 price_date=latest_date.isoformat(),
-                success=True
+                success=True,
+                now=now
             )
             logger.info(f"[{ticker}] 스마트 수집 완료: {saved_count}건 저장, "
                        f"마지막 날짜: {latest_date}")
 
         return saved_count
 
-    def collect_and_save_trading_flow_smart(self, ticker: str, days: int = 10) -> int:
+    def collect_and_save_trading_flow_smart(self, ticker: str, days: int = 10,
+                                            status: Optional[dict] = None,
+                                            now: Optional[str] = None) -> int:
         """
         스마트 매매동향 데이터 수집 (중복 방지)
 
         Args:
             ticker: 종목 코드
             days: 수집할 일수 (최대값)
+            status: 미리 조회한 수집 상태 (None이면 DB에서 조회)
+            now: 수집 상태에 기록할 배치 시각 (None이면 현재 시각)
 
         Returns:
             저장된 레코드 수
@@ -1685,7 +1729,8 @@ class ETFDataCollector:
         from app.database import update_collection_status, get_collection_status
 
         # collection_status에서 마지막 수집 날짜 확인
-        status = get_collection_status(ticker)
+        if status is None:
+            status = get_collection_status(ticker)
 
         if status and status.get('last_trading_flow_date'):
             # Handle both date objects (PostgreSQL) and strings (SQLite)
@@ -1720,7 +1765,8 @@ class ETFDataCollector:
             update_collection_status(
                 ticker,
                 trading_flow_date=latest_date.isoformat(),
-                success=True
+                success=True,
+                now=now
             )
 
         return saved_count
@@ -6,6 +6,7 @@
 from typing import Dict, List, Optional
 from datetime import date, timedelta
 from app.database import get_db_connection, get_cursor, USE_POSTGRES
+from app.models import ReturnsBreakdown
 from app.services.data_collector import ETFDataCollector
 from app.services.news_scraper import NewsScraper
 import logging
@@ -115,19 +116,19 @@ class InsightsService:
             }
         """
         # 수익률 기반 분석
-        returns = metrics.returns if hasattr(metrics, 'returns') else {}
+        returns = metrics.returns if hasattr(metrics, 'returns') else ReturnsBreakdown()
         volatility = metrics.volatility if hasattr(metrics, 'volatility') else None
         
         # 단기 전략 (1주 수익률 기반)
-        short_term_return = returns.get("1w")
+        short_term_return = returns.one_w
         short_term = self._get_strategy_from_return(short_term_return, "단기")
         
         # 중기 전략 (1개월 수익률 기반)
-        medium_term_return = returns.get("1m")
+        medium_term_return = returns.one_m
         medium_term = self._get_strategy_from_return(medium_term_return, "중기")
         
         # 장기 전략 (YTD 수익률 기반)
-        long_term_return = returns.get("ytd")
+        long_term_return = returns.ytd
         long_term = self._get_strategy_from_return(long_term_return, "장기")
         
         # 종합 추천 (중기 전략 우선)
@@ -228,9 +229,9 @@ class InsightsService:
         key_points = []
         
         # 수익률 포인트
-        returns = metrics.returns if hasattr(metrics, 'returns') else {}
-        if returns.get("1m"):
-            return_1m = returns["1m"]
+        returns = metrics.returns if hasattr(metrics, 'returns') else ReturnsBreakdown()
+        if returns.one_m:
+            return_1m = returns.one_m
             if return_1m > 10:
                 key_points.append(f"1개월 수익률 {return_1m:.1f}%로 강세 지속")
             elif return_1m < -10:
@@ -327,8 +328,8 @@ class InsightsService:
             risks.append("높은 변동성으로 인한 가격 급등락 리스크")
         
         # 하락 리스크
-        returns = metrics.returns if hasattr(metrics, 'returns') else {}
-        if returns.get("1m") and returns["1m"] < -10:
+        returns = metrics.returns if hasattr(metrics, 'returns') else ReturnsBreakdown()
+        if returns.one_m and returns.one_m < -10:
             risks.append("최근 하락세 지속으로 추가 하락 가능성")
         
         # 뉴스 기반 리스크 키워드 분석
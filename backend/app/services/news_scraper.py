@@ -1,7 +1,7 @@
 from typing import List, Dict, Optional
 from datetime import date, datetime, timedelta
 from app.models import News
-from app.database import get_db_connection, get_cursor, USE_POSTGRES
+from app.database import get_db_connection, get_ro_db_connection, get_cursor, USE_POSTGRES
 from app.config import Config
 from app.utils.retry import retry_with_backoff
 from app.utils.rate_limiter import RateLimiter
@@ -450,7 +450,7 @@ class NewsScraper:
         # PostgreSQL과 SQLite의 플레이스홀더 차이
         param_placeholder = "%s" if USE_POSTGRES else "?"
 
-        with get_db_connection() as conn_or_cursor:
+        with get_ro_db_connection() as conn_or_cursor:
             cursor = get_cursor(conn_or_cursor)
             cursor.execute(f"""
                 SELECT date, published_at, title, url, source, relevance_score
@@ -496,7 +496,7 @@ class NewsScraper:
         logger.debug(f"Batch fetching news for {len(tickers)} tickers from {start_date} to {end_date}")
         param_placeholder = "%s" if USE_POSTGRES else "?"
 
-        with get_db_connection() as conn_or_cursor:
+        with get_ro_db_connection() as conn_or_cursor:
             cursor = get_cursor(conn_or_cursor)
             placeholders = ','.join([param_placeholder] * len(tickers))
             cursor.execute(f"""
@@ -18,7 +18,13 @@ from app.services.data_collector import ETFDataCollector
 from app.services.news_scraper import NewsScraper
 from app.services.ticker_catalog_collector import TickerCatalogCollector
 from app.services.catalog_data_collector import CatalogDataCollector
-from app.database import get_db_connection, USE_POSTGRES
+from app.database import (
+    get_db_connection,
+    get_collection_status_many,
+    defer_collection_status_updates,
+    USE_POSTGRES,
+)
+from app.utils.cache import invalidate_data_summary_cache
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -80,34 +86,46 @@ class DataCollectionScheduler:
                 or (start_time - self.last_news_collection_time) >= news_interval
             )
 
-            for ticker in tickers:
-                try:
-                    stock_info = Config.get_stock_info(ticker)
-                    stock_name = stock_info.get('name', ticker) if stock_info else ticker
-
-                    # 1. 가격 데이터 수집 (스마트 수집 사용 - 중복 방지)
-                    price_count = self.collector.collect_and_save_prices_smart(ticker, days=1)
-                    total_price_records += price_count
-                    logger.info(f"[{ticker}/{stock_name}] 가격 데이터: {price_count}건")
-
-                    # 2. 매매동향 데이터 수집 (스마트 수집 사용 - 중복 방지)
-                    trading_count = self.collector.collect_and_save_trading_flow_smart(ticker, days=1)
-                    total_trading_records += trading_count
-                    logger.info(f"[{ticker}/{stock_name}] 매매동향: {trading_count}건")
-
-                    # 3. 뉴스 데이터 수집 (1일) — 쓰로틀 간격 지났을 때만
-                    if collect_news:
-                        news_result = self.news_scraper.collect_and_save_news(ticker, days=1)
-                        news_count = news_result.get('collected', 0)
-                        total_news_records += news_count
-                        logger.info(f"[{ticker}/{stock_name}] 뉴스: {news_count}건")
+            # 수집 상태는 주기마다 한 번의 IN 쿼리로 조회 (종목별 N+1 조회 방지)
+            statuses = get_collection_status_many(tickers)
+            # 수집 상태 시각은 주기당 한 번만 만들어 전 종목에 공유
+            batch_now = datetime.now().isoformat()
+
+            # 종목별 수집 상태 쓰기는 주기 끝에 한 번에 기록 (종목마다 commit하지 않음)
+            with defer_collection_status_updates():
+                for ticker in tickers:
+                    try:
+                        stock_info = Config.get_stock_info(ticker)
+                        stock_name = stock_info.get('name', ticker) if stock_info else ticker
+                        status = statuses.get(ticker, {})
+
+                        # 1. 가격 데이터 수집 (스마트 수집 사용 - 중복 방지)
+                        price_count = self.collector.collect_and_save_prices_smart(
+                            ticker, days=1, status=status, now=batch_now
+                        )
+                        total_price_records += price_count
+                        logger.info(f"[{ticker}/{stock_name}] 가격 데이터: {price_count}건")
+
+                        # 2. 매매동향 데이터 수집 (스마트 수집 사용 - 중복 방지)
+                        trading_count = self.collector.collect_and_save_trading_flow_smart(
+                            ticker, days=1, status=status, now=batch_now
+                        )
+                        total_trading_records += trading_count
+                        logger.info(f"[{ticker}/{stock_name}] 매매동향: {trading_count}건")
+
+                        # 3. 뉴스 데이터 수집 (1일) — 쓰로틀 간격 지났을 때만
+                        if collect_news:
+                            news_result = self.news_scraper.collect_and_save_news(ticker, days=1)
+                            news_count = news_result.get('collected', 0)
+                            total_news_records += news_count
+                            logger.info(f"[{ticker}/{stock_name}] 뉴스: {news_count}건")
 
-                    success_count += 1
+                        success_count += 1
 
-                except Exception as e:
-                    logger.error(f"[{ticker}] 데이터 수집 실패: {e}")
-                    error_count += 1
-                    continue
+                    except Exception as e:
+                        logger.error(f"[{ticker}] 데이터 수집 실패: {e}")
+                        error_count += 1
+                        continue
 
             end_time = datetime.now(KST)
             duration = (end_time - start_time).total_seconds()
@@ -116,6 +134,8 @@ class DataCollectionScheduler:
             self.last_collection_time = end_time
             if collect_news:
                 self.last_news_collection_time = end_time
+            # 수집 현황/통계/스케줄러 상태 캐시 무효화 (TTL 대신 쓰기 시점 무효화)
+            invalidate_data_summary_cache()
 
             news_log = f"뉴스 {total_news_records}건" if collect_news else "뉴스 건너뜀(쓰로틀)"
             logger.info(
@@ -215,6 +235,7 @@ class DataCollectionScheduler:
             
             end_time = datetime.now(KST)
             self.last_catalog_collection_time = end_time
+            invalidate_data_summary_cache()
             
             logger.info(
                 f"[스케줄러-카탈로그수집] 완료: "
@@ -253,6 +274,7 @@ class DataCollectionScheduler:
 
             end_time = datetime.now(KST)
             self.last_catalog_data_collection_time = end_time
+            invalidate_data_summary_cache()
 
             logger.info(
                 f"[스케줄러-카탈로그데이터수집] 완료: "
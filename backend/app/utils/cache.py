@@ -5,9 +5,10 @@ TTL(Time To Live) 기반의 스레드 안전한 메모리 캐시 구현
 실시간 데이터 업데이트 최적화를 위해 사용
 """
 
+import asyncio
 import threading
 import time
-from typing import Any, Optional, Dict, Callable
+from typing import Any, Awaitable, Optional, Dict, Callable
 from datetime import datetime, timedelta
 import logging
 import hashlib
@@ -21,10 +22,12 @@ class MemoryCache:
     TTL 기반 메모리 캐시
 
     Features:
-    - TTL(Time To Live) 지원
+    - 항목별 TTL(Time To Live) 지원 (조회 시 TTL을 연장하지 않음)
     - 스레드 안전성 (threading.Lock)
     - 캐시 통계 제공
-    - LRU eviction (최대 크기 제한)
+    - 비동기 single-flight 로딩 (aget_or_set: 같은 키의 동시 미스는 로더 1회만 실행)
+    - LFU eviction (최대 크기 제한): 만료 항목을 먼저 정리하고,
+      그래도 가득 차 있으면 조회 횟수가 가장 적은 항목(동률이면 오래된 항목)을 제거
     """
 
     def __init__(self, default_ttl_seconds: int = 30, max_size: int = 1000):
@@ -37,6 +40,12 @@ class MemoryCache:
         self._lock = threading.Lock()
         self._default_ttl = default_ttl_seconds
         self._max_size = max_size
+        # aget_or_set 키별 진행 중인 로딩 (이벤트 루프에서만 접근, 로딩이 끝나면 제거)
+        # 대기 요청은 로더를 다시 실행하지 않고 이 Future로 선행 요청의 결과를 받는다
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # 로딩 중인 키 → 로딩 도중 무효화 여부 (_lock으로 보호, 다른 스레드의 무효화도 반영)
+        # 무효화된 키의 로딩 결과는 반환만 하고 저장하지 않는다 (다른 키의 무효화는 영향 없음)
+        self._loading_keys: Dict[str, bool] = {}
 
         # 통계
         self._stats = {
@@ -48,27 +57,40 @@ class MemoryCache:
 
     def _is_expired(self, item: Dict[str, Any]) -> bool:
         """캐시 항목이 만료되었는지 확인"""
-        return time.time() > item["expires_at"]
+        return time.monotonic() > item["expires_at"]
 
     def _evict_oldest(self):
-        """가장 오래된 항목 제거 (LRU)"""
+        """
+        공간 확보를 위한 항목 제거 (LFU)
+
+        만료된 항목이 있으면 그것만 정리하고, 없으면 조회 횟수가 가장 적은 항목을 제거한다.
+        대시보드 버스트 중 반복 조회되는 항목이 한 번 쓰고 버려지는 항목에 밀려나지 않는다.
+        """
         if not self._cache:
             return
 
-        oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k]["created_at"])
-        del self._cache[oldest_key]
+        if self._cleanup_expired():
+            return
+
+        victim_key = min(
+            self._cache.keys(),
+            key=lambda k: (self._cache[k]["hits"], self._cache[k]["created_at"])
+        )
+        del self._cache[victim_key]
         self._stats["evictions"] += 1
-        logger.debug(f"Evicted oldest cache entry: {oldest_key}")
+        logger.debug(f"Evicted least frequently used cache entry: {victim_key}")
 
-    def _cleanup_expired(self):
-        """만료된 항목 정리"""
+    def _cleanup_expired(self) -> int:
+        """만료된 항목 정리 후 정리한 개수 반환"""
+        now = time.monotonic()
         expired_keys = [
             key for key, item in self._cache.items()
-            if self._is_expired(item)
+            if now > item["expires_at"]
         ]
         for key in expired_keys:
             del self._cache[key]
             logger.debug(f"Cleaned up expired cache entry: {key}")
+        return len(expired_keys)
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -93,6 +115,7 @@ class MemoryCache:
                 logger.debug(f"Cache miss (expired): {key}")
                 return None
 
+            item["hits"] += 1
             self._stats["hits"] += 1
             logger.debug(f"Cache hit: {key}")
             return item["value"]
@@ -107,21 +130,27 @@ class MemoryCache:
             ttl_seconds: TTL (초), None이면 기본값 사용
         """
         with self._lock:
-            # 크기 제한 확인
-            if len(self._cache) >= self._max_size:
-                self._evict_oldest()
-
-            ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
-
-            self._cache[key] = {
-                "value": value,
-                "created_at": time.time(),
-                "expires_at": time.time() + ttl,
-                "ttl": ttl,
-            }
+            self._set_locked(key, value, ttl_seconds)
+
+    def _set_locked(self, key: str, value: Any, ttl_seconds: Optional[int]):
+        """set() 본체 (호출자가 _lock을 잡고 있어야 함)"""
+        # 크기 제한 확인 (기존 키 덮어쓰기는 공간을 더 쓰지 않음)
+        if key not in self._cache and len(self._cache) >= self._max_size:
+            self._evict_oldest()
+
+        ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
+        now = time.monotonic()
+
+        self._cache[key] = {
+            "value": value,
+            "created_at": now,
+            "expires_at": now + ttl,
+            "ttl": ttl,
+            "hits": 0,
+        }
 
-            self._stats["sets"] += 1
-            logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
+        self._stats["sets"] += 1
+        logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
 
     def delete(self, key: str) -> bool:
         """
@@ -134,6 +163,8 @@ class MemoryCache:
             삭제 성공 여부
         """
         with self._lock:
+            if key in self._loading_keys:
+                self._loading_keys[key] = True
             if key in self._cache:
                 del self._cache[key]
                 logger.debug(f"Cache deleted: {key}")
@@ -143,6 +174,8 @@ class MemoryCache:
     def clear(self):
         """모든 캐시 항목 삭제"""
         with self._lock:
+            for loading_key in self._loading_keys:
+                self._loading_keys[loading_key] = True
             count = len(self._cache)
             self._cache.clear()
             logger.debug(f"Cache cleared: {count} items removed")
@@ -155,6 +188,9 @@ class MemoryCache:
             pattern: 키에 포함되어야 하는 문자열
         """
         with self._lock:
+            for loading_key in self._loading_keys:
+                if pattern in loading_key:
+                    self._loading_keys[loading_key] = True
             keys_to_delete = [key for key in self._cache.keys() if pattern in key]
             for key in keys_to_delete:
                 del self._cache[key]
@@ -216,6 +252,69 @@ class MemoryCache:
         self.set(key, value, ttl_seconds)
         return value
 
+    async def aget_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_seconds: Optional[int] = None
+    ) -> Any:
+        """
+        get_or_set의 비동기 버전 (single-flight)
+
+        캐시 만료 직후 같은 키로 동시에 들어온 요청이 모두 DB를 조회하지 않도록
+        첫 요청만 loader를 실행하고, 나머지는 그 결과(또는 예외)를 함께 받는다.
+        loader 실행 중에 이 키가 무효화(delete/clear/invalidate_pattern 매칭)되면
+        결과는 반환하되 캐시에는 저장하지 않는다 (무효화 이전 데이터가 TTL 동안 남는 것 방지).
+
+        Args:
+            key: 캐시 키
+            loader: 캐시 미스 시 await할 코루틴 함수 (예: lambda: asyncio.to_thread(build))
+            ttl_seconds: TTL (초)
+
+        Returns:
+            캐시된 값 또는 loader 결과
+        """
+        while True:
+            value = self.get(key)
+            if value is not None:
+                return value
+
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            # 선행 요청이 로딩 중 → 로더를 다시 실행하지 않고 같은 결과를 기다림
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 선행 요청이 취소되었으면(클라이언트 연결 종료 등) 다시 시도, 이 요청이 취소된 경우는 전파
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        with self._lock:
+            self._loading_keys[key] = False
+        try:
+            value = await loader()
+        except Exception as e:
+            future.set_exception(e)
+            # 대기 요청이 없을 때 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            with self._lock:
+                if not self._loading_keys.get(key, False):
+                    self._set_locked(key, value, ttl_seconds)
+            return value
+        finally:
+            if not future.done():
+                future.cancel()
+            with self._lock:
+                self._loading_keys.pop(key, None)
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
 
 def make_cache_key(endpoint: str, **kwargs) -> str:
     """
@@ -249,6 +348,24 @@ def make_cache_key(endpoint: str, **kwargs) -> str:
     return ":".join(key_parts)
 
 
+# 데이터 요약 엔드포인트(/api/data/status, /stats, /scheduler-status) 라우터 캐시 태그
+DATA_SUMMARY_CACHE_ENDPOINTS = ("status", "stats", "scheduler_status")
+
+
+def invalidate_data_summary_cache():
+    """
+    데이터 요약 캐시 무효화
+
+    status/stats는 TTL 대신 쓰기 시점 무효화로 최신성을 보장하므로
+    가격/매매동향/뉴스/종목 목록을 바꾸는 모든 경로(수집, 조회 시 자동 수집, 스케줄러, 종목 설정)에서 호출
+    """
+    cache = get_cache()
+    for endpoint in DATA_SUMMARY_CACHE_ENDPOINTS:
+        cache.delete(make_cache_key(endpoint))
+    # 응답 캐시 미들웨어에 저장된 /api/data/* 응답도 함께 제거
+    cache.invalidate_pattern("/api/data/")
+
+
 # 전역 캐시 인스턴스 (싱글톤)
 _global_cache: Optional[MemoryCache] = None
 _cache_lock = threading.Lock()
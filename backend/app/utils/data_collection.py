@@ -8,6 +8,8 @@ import logging
 from datetime import date
 from typing import Callable, Any, List
 
+from app.utils.cache import invalidate_data_summary_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,6 +62,10 @@ def auto_collect_if_needed(
 
     logger.info(f"Auto-collected {collected_count} {data_type} records for {ticker}")
 
+    # 새 레코드가 저장되었으면 /api/data/status, /stats 캐시 무효화
+    if collected_count:
+        invalidate_data_summary_cache()
+
     # 수집 후 재조회
     data = get_data_fn(ticker, start_date, end_date)
 
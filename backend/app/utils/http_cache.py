@@ -0,0 +1,41 @@
+"""
+HTTP 조건부 요청(ETag / If-None-Match) 유틸
+
+폴링 엔드포인트가 본문 해시를 ETag로 붙이고, 내용이 그대로면 본문 없이 304를 반환하도록 공통화
+(알림 규칙/이력 목록, 스케줄러 상태, 응답 캐시 미들웨어 HIT 경로에서 사용)
+"""
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+
+# 브라우저가 매번 ETag로 재검증하도록 (저장은 하되 재사용 전 확인)
+ETAG_CACHE_CONTROL = "no-cache"
+
+
+def make_etag(body: bytes) -> str:
+    """본문 해시 기반 weak ETag (GZip 등 인코딩이 달라져도 같은 표현으로 취급)"""
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더 값이 ETag와 일치하는지 ("*" 및 쉼표 구분 목록 지원)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in {tag.strip() for tag in if_none_match.split(",")}
+
+
+def etag_json_response(request: Request, body: bytes) -> Response:
+    """
+    본문 해시를 ETag로 붙인 JSON 응답
+
+    폴링 요청의 If-None-Match가 같으면 본문 없이 304 반환
+    (Cache-Control: no-cache → 브라우저가 매번 ETag로 재검증)
+    """
+    etag = make_etag(body)
+    headers = {"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,40 @@
+"""
+JSON 직렬화 유틸리티
+
+orjson(Rust 구현)이 설치되어 있으면 사용하고, 없으면 표준 json으로 폴백한다.
+두 경우 모두 한글을 이스케이프하지 않은 str을 반환한다.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    객체를 JSON 문자열로 직렬화 (ensure_ascii=False와 동일하게 한글 유지)
+
+    Args:
+        obj: 직렬화할 객체
+        default: 직렬화할 수 없는 객체를 변환하는 함수 (json.dumps의 default와 동일)
+    """
+    if orjson is not None:
+        # OPT_NON_STR_KEYS: 표준 json처럼 int 등 str이 아닌 dict 키 허용
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, ensure_ascii=False, default=default)
+
+
+def loads(data: Any) -> Any:
+    """
+    JSON 문자열/바이트 역직렬화
+
+    Raises:
+        json.JSONDecodeError: 파싱 실패 시 (orjson.JSONDecodeError도 이 예외의 하위 클래스)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -11,6 +11,7 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional
 from app.config import Config
+from app.utils import json_utils
 from app.database import get_db_connection, USE_POSTGRES
 
 logger = logging.getLogger(__name__)
@@ -21,13 +22,21 @@ def load_stocks() -> Dict[str, Any]:
     Load stock configuration from stocks.json file
 
     Returns:
-        Dict[str, Any]: Stock configuration with ticker as key
+        Dict[str, Any]: Writable copy of the stock configuration with ticker as key
+            (Config 캐시는 읽기 전용이므로 추가/삭제/재정렬용 복사본을 반환)
 
     Raises:
         FileNotFoundError: If stocks.json file does not exist
         json.JSONDecodeError: If JSON parsing fails
     """
-    return Config.get_stock_config()
+    # 종목별 항목도 읽기 전용(MappingProxyType/tuple)이므로 수정·JSON 저장이 가능한 dict/list로 복사
+    return {
+        ticker: {
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in info.items()
+        }
+        for ticker, info in Config.get_stock_config().items()
+    }
 
 
 def save_stocks(stocks_dict: Dict[str, Any]) -> None:
@@ -55,6 +64,9 @@ def save_stocks(stocks_dict: Dict[str, Any]) -> None:
 
         # Atomic rename
         temp_path.replace(config_path)
+        # 같은 mtime 틱 안에서 크기가 같은 파일(예: 순서 변경)을 다시 저장해도
+        # 다음 reload_stock_config()가 반드시 재파싱하도록 시그니처를 비운다
+        Config._stock_config_signature = None
         logger.info(f"Saved {len(stocks_dict)} stocks to {config_path}")
 
     except Exception as e:
@@ -143,7 +155,7 @@ def sync_stocks_to_db() -> int:
         etfs_data = []
         for ticker, info in stocks.items():
             # relevance_keywords를 JSON 문자열로 변환
-            relevance_keywords_json = json.dumps(info.get("relevance_keywords", []), ensure_ascii=False) if info.get("relevance_keywords") else None
+            relevance_keywords_json = json_utils.dumps(info["relevance_keywords"]) if info.get("relevance_keywords") else None
 
             etfs_data.append((
                 ticker,
@@ -8,6 +8,8 @@ import logging
 import sys
 from typing import Any, Dict
 
+from app.utils import json_utils
+
 
 def setup_structured_logging(
     log_level: str = "INFO",
@@ -42,7 +44,8 @@ def setup_structured_logging(
     
     # 출력 형식 결정
     if json_output:
-        processors.append(structlog.processors.JSONRenderer())
+        # orjson 기반 직렬화 (들여쓰기 없음, 미설치 시 표준 json 폴백)
+        processors.append(structlog.processors.JSONRenderer(serializer=json_utils.dumps))
     else:
         processors.append(
             structlog.dev.ConsoleRenderer(colors=True)
@@ -5,4 +5,6 @@
 python -m app.database
 
 # 서버 시작
-uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000}
+# uvloop/httptools 명시 (uvicorn[standard]에 포함, 누락 시 asyncio/h11로 조용히 폴백하지 않고 기동 실패)
+# 워커는 1개 유지: 스케줄러가 프로세스마다 실행되면 수집이 중복됨
+uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000} --loop uvloop --http httptools
@@ -10,3 +10,11 @@ def pytest_configure(config):
         "markers",
         "postgres: PostgreSQL 전용 테스트. 실행 전 'just pg-up' 필요."
     )
+
+
+@pytest.fixture(autouse=True)
+def clear_memory_cache():
+    """전역 MemoryCache를 테스트마다 비움 (이전 테스트의 캐시 응답/종목 정보가 patch를 가리지 않도록)"""
+    from app.utils.cache import get_cache
+    get_cache().clear()
+    yield
@@ -0,0 +1,291 @@
+"""
+Tests for Alerts API
+
+알림 규칙 목록/이력 조회 응답 형식 검증
+"""
+
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+from app.main import app
+from app.database import init_db, get_db_connection, PoolExhaustedException
+from app.exceptions import DatabaseException
+from app.services.alert_trigger_writer import AlertTriggerWriter, get_alert_trigger_writer
+
+client = TestClient(app)
+
+TEST_TICKER = "ALRT01"
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    """Setup database and remove test rules"""
+    init_db()
+    yield
+    get_alert_trigger_writer().flush()
+    with patch("app.middleware.auth.Config.API_KEY", None):
+        for rule in client.get(f"/api/alerts/{TEST_TICKER}", params={"active_only": False}).json():
+            client.delete(f"/api/alerts/{rule['id']}")
+    with get_db_connection() as conn:
+        conn.execute("DELETE FROM alert_history WHERE ticker = ?", (TEST_TICKER,))
+        conn.commit()
+
+
+class TestAlertRuleList:
+    """Tests for GET /api/alerts/{ticker}"""
+
+    @patch("app.middleware.auth.Config.API_KEY", None)
+    def test_list_matches_created_rule(self):
+        """Given: 생성된 규칙 / When: 목록 조회 / Then: 생성 응답과 같은 JSON"""
+        created = client.post("/api/alerts/", json={
+            "ticker": TEST_TICKER,
+            "alert_type": "buy",
+            "direction": "below",
+            "target_price": 10000,
+            "memo": "테스트",
+        })
+        assert created.status_code == 200
+
+        response = client.get(f"/api/alerts/{TEST_TICKER}")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == [created.json()]
+
+    def test_history_empty_list(self):
+        """Given: 이력 없는 종목 / Then: 빈 JSON 배열"""
+        response = client.get(f"/api/alerts/history/{TEST_TICKER}")
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+
+class TestAlertRuleListCache:
+    """알림 규칙 목록 캐시 무효화 테스트"""
+
+    RULE = {"ticker": TEST_TICKER, "alert_type": "sell", "direction": "above", "target_price": 20000}
+
+    @patch("app.middleware.auth.Config.API_KEY", None)
+    def test_repeated_list_skips_db(self):
+        """Given: 한 번 조회된 목록 / When: 재조회 / Then: DB 연결 없이 캐시 반환"""
+        client.post("/api/alerts/", json=self.RULE)
+        first = client.get(f"/api/alerts/{TEST_TICKER}")
+
+        with patch("app.routers.alerts.get_db_connection", side_effect=AssertionError("DB hit")):
+            second = client.get(f"/api/alerts/{TEST_TICKER}")
+
+        assert second.status_code == 200
+        assert second.json() == first.json()
+
+    @patch("app.middleware.auth.Config.API_KEY", None)
+    def test_create_update_delete_invalidate_list(self):
+        """Given: 캐시된 목록 / When: 생성·수정·삭제 / Then: 다음 조회에 즉시 반영"""
+        assert client.get(f"/api/alerts/{TEST_TICKER}").json() == []
+
+        rule_id = client.post("/api/alerts/", json=self.RULE).json()["id"]
+        assert [r["id"] for r in client.get(f"/api/alerts/{TEST_TICKER}").json()] == [rule_id]
+
+        client.put(f"/api/alerts/{rule_id}", json={"is_active": False})
+        assert client.get(f"/api/alerts/{TEST_TICKER}").json() == []
+        assert len(client.get(f"/api/alerts/{TEST_TICKER}", params={"active_only": False}).json()) == 1
+
+        client.delete(f"/api/alerts/{rule_id}")
+        assert client.get(f"/api/alerts/{TEST_TICKER}", params={"active_only": False}).json() == []
+
+
+class TestAlertRuleValidation:
+    """알림 규칙 요청 검증 테스트"""
+
+    @pytest.mark.parametrize("payload", [
+        {"alert_type": "hold", "direction": "above", "target_price": 100},
+        {"alert_type": "buy", "direction": "sideways", "target_price": 100},
+        {"alert_type": "buy", "direction": "below", "target_price": 0},
+        {"alert_type": "price_change", "direction": "both", "target_price": 150},
+    ])
+    @patch("app.middleware.auth.Config.API_KEY", None)
+    def test_invalid_rule_rejected(self, payload):
+        """Given: 허용되지 않는 타입/방향/목표가 / Then: 422, 저장 안 함"""
+        response = client.post("/api/alerts/", json={"ticker": TEST_TICKER, **payload})
+
+        assert response.status_code == 422
+        assert client.get(f"/api/alerts/{TEST_TICKER}", params={"active_only": False}).json() == []
+
+    @patch("app.middleware.auth.Config.API_KEY", None)
+    def test_trading_signal_allows_zero_target(self):
+        """Given: trading_signal + target_price 0 / Then: 생성 성공"""
+        response = client.post("/api/alerts/", json={
+            "ticker": TEST_TICKER, "alert_type": "trading_signal", "direction": "both", "target_price": 0,
+        })
+
+        assert response.status_code == 200
+
+    @patch("app.middleware.auth.Config.API_KEY", None)
+    def test_update_rejects_unknown_direction(self):
+        """Given: 기존 규칙 / When: 허용되지 않는 direction으로 수정 / Then: 422"""
+        rule_id = client.post("/api/alerts/", json={
+            "ticker": TEST_TICKER, "alert_type": "buy", "direction": "below", "target_price": 100,
+        }).json()["id"]
+
+        response = client.put(f"/api/alerts/{rule_id}", json={"direction": "sideways"})
+
+        assert response.status_code == 422
+
+
+class TestAlertRuleNotFound:
+    """존재하지 않는 규칙 수정/삭제 테스트"""
+
+    @patch("app.middleware.auth.Config.API_KEY", None)
+    def test_update_missing_rule_returns_404(self):
+        """Given: 없는 rule_id / When: 수정 / Then: 404"""
+        response = client.put("/api/alerts/999999999", json={"memo": "x"})
+
+        assert response.status_code == 404
+
+    @patch("app.middleware.auth.Config.API_KEY", None)
+    def test_delete_missing_rule_returns_404(self):
+        """Given: 없는 rule_id / When: 삭제 / Then: 404"""
+        response = client.delete("/api/alerts/999999999")
+
+        assert response.status_code == 404
+
+    @patch("app.middleware.auth.Config.API_KEY", None)
+    def test_update_without_fields_returns_400(self):
+        """Given: 수정 필드 없음 / Then: 400"""
+        response = client.put("/api/alerts/999999999", json={})
+
+        assert response.status_code == 400
+
+
+class TestAlertTrigger:
+    """알림 트리거 배치 기록 테스트"""
+
+    @patch("app.middleware.auth.Config.API_KEY", None)
+    def test_triggers_recorded_after_flush(self):
+        """Given: 같은 규칙 트리거 2건 / When: writer flush / Then: 이력 2건, last_triggered_at 갱신"""
+        rule_id = client.post("/api/alerts/", json={
+            "ticker": TEST_TICKER, "alert_type": "buy", "direction": "below", "target_price": 100,
+        }).json()["id"]
+        client.get(f"/api/alerts/{TEST_TICKER}")  # 목록 캐시 적재
+
+        for message in ("first", "second"):
+            response = client.post("/api/alerts/trigger", json={
+                "rule_id": rule_id, "ticker": TEST_TICKER, "alert_type": "buy", "message": message,
+            })
+            assert response.status_code == 200
+        get_alert_trigger_writer().flush()
+
+        history = client.get(f"/api/alerts/history/{TEST_TICKER}").json()
+        assert sorted(h["message"] for h in history) == ["first", "second"]
+        rules = client.get(f"/api/alerts/{TEST_TICKER}").json()
+        assert rules[0]["last_triggered_at"] is not None
+
+    def test_writer_thread_writes_one_batch(self):
+        """Given: 짧은 간격 내 트리거 3건 / Then: 스레드가 한 번의 기록으로 처리"""
+        writer = AlertTriggerWriter(flush_interval=0.05)
+        batches = []
+
+        with patch.object(writer, "_write", side_effect=batches.append):
+            for i in range(3):
+                writer.enqueue(1, TEST_TICKER, "buy", f"m{i}")
+            writer.stop()
+
+        assert [len(b) for b in batches] == [3]
+
+    def test_failed_batch_is_retried_row_by_row(self):
+        """Given: 한 건이 실패하는 배치 / Then: 나머지는 한 건씩 다시 기록"""
+        writer = AlertTriggerWriter()
+        written = []
+
+        def write_rows(rows):
+            if len(rows) > 1 or rows[0][3] == "bad":
+                raise sqlite3.IntegrityError("bad row")
+            written.extend(rows)
+
+        with patch.object(writer, "_write_rows", side_effect=write_rows):
+            writer._write([(1, TEST_TICKER, "buy", "ok1"), (1, TEST_TICKER, "buy", "bad"), (1, TEST_TICKER, "buy", "ok2")])
+
+        assert [row[3] for row in written] == ["ok1", "ok2"]
+
+    @patch("app.middleware.auth.Config.API_KEY", None)
+    def test_trigger_for_deleted_rule_is_skipped(self):
+        """Given: 삭제된 규칙의 트리거와 정상 트리거 / Then: 정상 트리거만 기록"""
+        rule_id = client.post("/api/alerts/", json={
+            "ticker": TEST_TICKER, "alert_type": "buy", "direction": "below", "target_price": 100,
+        }).json()["id"]
+
+        writer = AlertTriggerWriter()
+        writer._write([(999999999, TEST_TICKER, "buy", "orphan"), (rule_id, TEST_TICKER, "buy", "kept")])
+
+        history = client.get(f"/api/alerts/history/{TEST_TICKER}").json()
+        assert [h["message"] for h in history] == ["kept"]
+
+
+class TestAlertListETag:
+    """알림 목록 ETag / 304 테스트"""
+
+    @patch("app.middleware.auth.Config.API_KEY", None)
+    def test_unchanged_rules_return_304(self):
+        """Given: ETag 받은 목록 / When: If-None-Match로 재조회 / Then: 304, 본문 없음"""
+        client.post("/api/alerts/", json={
+            "ticker": TEST_TICKER, "alert_type": "buy", "direction": "below", "target_price": 100,
+        })
+        first = client.get(f"/api/alerts/{TEST_TICKER}")
+        etag = first.headers["ETag"]
+
+        second = client.get(f"/api/alerts/{TEST_TICKER}", headers={"If-None-Match": etag})
+
+        assert first.headers["Cache-Control"] == "no-cache"
+        assert second.status_code == 304
+        assert second.content == b""
+
+    @patch("app.middleware.auth.Config.API_KEY", None)
+    def test_etag_changes_after_write(self):
+        """Given: ETag 받은 목록 / When: 규칙 추가 후 재조회 / Then: 200, 새 ETag"""
+        etag = client.get(f"/api/alerts/{TEST_TICKER}").headers["ETag"]
+        client.post("/api/alerts/", json={
+            "ticker": TEST_TICKER, "alert_type": "sell", "direction": "above", "target_price": 100,
+        })
+
+        response = client.get(f"/api/alerts/{TEST_TICKER}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert len(response.json()) == 1
+
+    def test_history_supports_if_none_match(self):
+        """Given: 이력 ETag / When: 같은 ETag로 재조회 / Then: 304"""
+        etag = client.get(f"/api/alerts/history/{TEST_TICKER}").headers["ETag"]
+
+        response = client.get(f"/api/alerts/history/{TEST_TICKER}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+
+
+class TestAlertDatabaseError:
+    """DB 오류 공통 핸들러 테스트"""
+
+    def test_db_error_returns_json_500(self):
+        """Given: 조회 중 sqlite3 오류 / Then: 500 JSON detail (라우터 try/except 없이)"""
+        with patch("app.routers.alerts.get_db_connection", side_effect=sqlite3.OperationalError("disk I/O error")):
+            response = client.get("/api/alerts/history/ERR001")
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "데이터베이스 처리 중 오류가 발생했습니다"}
+
+    def test_database_exception_returns_json_500(self):
+        """Given: 조회 중 DatabaseException / Then: 500 JSON detail"""
+        with patch("app.routers.alerts.get_db_connection", side_effect=DatabaseException("query failed")):
+            response = client.get("/api/alerts/history/ERR001")
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "데이터베이스 처리 중 오류가 발생했습니다"}
+
+    def test_pool_exhausted_returns_json_503(self):
+        """Given: 커넥션 풀 고갈 / Then: 503 JSON detail"""
+        with patch("app.routers.alerts.get_db_connection", side_effect=PoolExhaustedException("timeout")):
+            response = client.get("/api/alerts/history/ERR001")
+
+        assert response.status_code == 503
+        assert "detail" in response.json()
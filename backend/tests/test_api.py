@@ -41,6 +41,82 @@ class TestHealthCheck:
         assert "health" in data
 
 
+class TestNoCacheHeader:
+    """X-No-Cache 헤더 처리 테스트"""
+
+    def test_no_cache_header_clears_backend_cache(self):
+        """Given: 캐시 항목 / When: X-No-Cache: true 요청 / Then: 캐시 비워짐"""
+        from app.utils.cache import get_cache
+
+        cache = get_cache()
+        cache.set("no_cache_test", 1)
+
+        client.get("/api/health")
+        assert cache.get("no_cache_test") == 1
+
+        client.get("/api/health", headers={"X-No-Cache": "true"})
+        assert cache.get("no_cache_test") is None
+
+
+class TestHttpMiddlewareLogging:
+    """http_middleware 응답 로그 테스트 (5xx/느린 요청만 기록)"""
+
+    def test_server_error_is_logged_after_send(self):
+        """Given: 500 응답 / Then: 백그라운드 작업으로 log_response 1회"""
+        import sqlite3
+        from unittest.mock import patch
+
+        import app.main as main_module
+
+        with patch.object(main_module, "log_response") as mock_log, \
+                patch("app.routers.alerts.get_db_connection", side_effect=sqlite3.OperationalError("disk I/O error")):
+            response = client.get("/api/alerts/history/ERR001")
+
+        assert response.status_code == 500
+        mock_log.assert_called_once()
+        assert mock_log.call_args.kwargs["status_code"] == 500
+
+    def test_fast_client_error_is_not_logged(self):
+        """Given: 빠른 404 응답 / Then: 로그 없음"""
+        from unittest.mock import patch
+
+        import app.main as main_module
+
+        with patch.object(main_module, "log_response") as mock_log:
+            response = client.get("/api/etfs/999999")
+
+        assert response.status_code == 404
+        mock_log.assert_not_called()
+
+
+class TestSuppressPollingAccessLog:
+    """uvicorn access 로그 폴링 경로 필터 테스트"""
+
+    @staticmethod
+    def _record(full_path):
+        import logging
+
+        return logging.LogRecord(
+            "uvicorn.access", logging.INFO, __file__, 0,
+            '%s - "%s %s HTTP/%s" %d', ("127.0.0.1:1", "GET", full_path, "1.1", 200), None,
+        )
+
+    def test_polling_paths_are_suppressed(self):
+        """Given: collect-progress 폴링 (쿼리 포함) / Then: 로그 제외"""
+        from app.main import SuppressPollingAccessLog
+
+        log_filter = SuppressPollingAccessLog()
+        assert log_filter.filter(self._record("/api/data/collect-progress")) is False
+        assert log_filter.filter(self._record("/api/scanner/collect-progress?t=1")) is False
+
+    def test_other_paths_are_logged(self):
+        """Given: 일반 API 경로 / Then: 로그 유지"""
+        from app.main import SuppressPollingAccessLog
+
+        log_filter = SuppressPollingAccessLog()
+        assert log_filter.filter(self._record("/api/etfs/487240/prices?days=7")) is True
+
+
 class TestETFEndpoints:
     """ETF endpoints tests"""
 
@@ -81,6 +157,44 @@ class TestETFEndpoints:
         assert "not found" in data["detail"].lower()
 
 
+class TestGetEtfOr404:
+    """get_etf_or_404 의존성 캐시 테스트"""
+
+    def test_etf_info_is_cached_per_ticker(self):
+        """Given: 같은 종목 2회 조회 / Then: DB 조회(get_etf_info)는 1회"""
+        from unittest.mock import MagicMock
+
+        from app.dependencies import get_etf_or_404
+        from app.models import ETF
+
+        collector = MagicMock()
+        collector.get_etf_info.return_value = ETF(ticker="487240", name="KODEX", type="ETF")
+
+        first = get_etf_or_404("487240", collector=collector)
+        second = get_etf_or_404("487240", collector=collector)
+
+        assert first == second
+        assert collector.get_etf_info.call_count == 1
+
+    def test_missing_etf_is_not_cached(self):
+        """Given: 없는 종목 / Then: 매번 404, 다음 조회도 DB 확인"""
+        from unittest.mock import MagicMock
+
+        from fastapi import HTTPException
+
+        from app.dependencies import get_etf_or_404
+
+        collector = MagicMock()
+        collector.get_etf_info.return_value = None
+
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc_info:
+                get_etf_or_404("999999", collector=collector)
+            assert exc_info.value.status_code == 404
+
+        assert collector.get_etf_info.call_count == 2
+
+
 class TestPriceEndpoints:
     """Price data endpoints tests"""
 
@@ -183,6 +297,90 @@ class TestCollectEndpoint:
             assert data["collected"] >= 0
 
 
+class TestDataStatsEndpoint:
+    """GET /api/data/stats tests"""
+
+    def test_stats_counts_match_tables(self):
+        """Given: 현재 DB / When: 통계 조회 / Then: 테이블별 COUNT와 일치"""
+        from app.database import get_db_connection
+        from app.utils.cache import get_cache
+
+        get_cache().clear()
+        response = client.get("/api/data/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        with get_db_connection() as conn:
+            for table in ("etfs", "prices", "news", "trading_flow"):
+                assert data[table] == conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        assert "last_collection" in data
+        assert "database_size_mb" in data
+
+    def test_stats_count_sql_approximates_only_large_postgres_tables(self):
+        """Given: 테이블/DB 종류 / Then: PostgreSQL 대용량 테이블만 reltuples 근사 + COUNT 대체"""
+        from app.routers.data import _stats_count_sql
+
+        assert _stats_count_sql("prices", use_postgres=False) == "(SELECT COUNT(*) FROM prices)"
+        assert _stats_count_sql("etfs", use_postgres=True) == "(SELECT COUNT(*) FROM etfs)"
+        approx = _stats_count_sql("prices", use_postgres=True)
+        assert "reltuples" in approx
+        assert approx.endswith("(SELECT COUNT(*) FROM prices))")
+
+    def test_sqlite_file_size_stat_is_cached(self):
+        """Given: 파일 크기 2회 조회 / Then: stat 1회, cache.clear() 후 다시 stat"""
+        import os
+        from unittest.mock import patch
+        from app.routers.data import _get_sqlite_file_size
+        from app.utils.cache import get_cache
+
+        with patch("app.routers.data.os.stat", wraps=os.stat) as mock_stat:
+            first = _get_sqlite_file_size()
+            assert _get_sqlite_file_size() == first
+            assert mock_stat.call_count == 1
+
+            get_cache().clear()
+            _get_sqlite_file_size()
+            assert mock_stat.call_count == 2
+
+    def test_stats_cache_invalidated_on_write(self):
+        """Given: 캐시된 통계 / When: 데이터 요약 캐시 무효화 / Then: 다음 조회는 DB 재집계"""
+        from unittest.mock import patch
+        from app.utils.cache import get_cache, invalidate_data_summary_cache
+
+        get_cache().clear()
+        first = client.get("/api/data/stats").json()
+
+        with patch("app.routers.data.get_db_connection", side_effect=AssertionError("DB hit")):
+            assert client.get("/api/data/stats").json() == first
+
+        invalidate_data_summary_cache()
+        with patch("app.routers.data.get_db_connection", side_effect=RuntimeError("DB hit")):
+            assert client.get("/api/data/stats").status_code == 500
+
+
+class TestSchedulerStatusETag:
+    """GET /api/data/scheduler-status ETag 테스트"""
+
+    def test_unchanged_status_returns_304(self):
+        """Given: ETag 받은 스케줄러 상태 / When: If-None-Match로 재조회 / Then: 304"""
+        first = client.get("/api/data/scheduler-status")
+        etag = first.headers["ETag"]
+
+        second = client.get("/api/data/scheduler-status", headers={"If-None-Match": etag})
+
+        assert "scheduler" in first.json()
+        assert second.status_code == 304
+        assert second.content == b""
+
+    def test_stale_etag_returns_body(self):
+        """Given: 현재 상태와 다른 ETag / When: If-None-Match로 조회 / Then: 200, 새 ETag와 본문"""
+        response = client.get("/api/data/scheduler-status", headers={"If-None-Match": 'W/"stale"'})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != 'W/"stale"'
+        assert "scheduler" in response.json()
+
+
 class TestErrorHandling:
     """API error handling tests"""
 
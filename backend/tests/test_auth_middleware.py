@@ -146,3 +146,11 @@ class TestAuthMiddleware:
         with patch("app.middleware.auth.Config.API_KEY", None):
             assert APIKeyAuth.verify_api_key("any-key") is False
             assert APIKeyAuth.verify_api_key(None) is False
+
+    def test_verify_api_key_non_ascii(self):
+        """비ASCII API Key도 예외 없이 비교 (bytes 상수 시간 비교)"""
+        from app.middleware.auth import APIKeyAuth
+
+        with patch("app.middleware.auth.Config.API_KEY", "키-123"):
+            assert APIKeyAuth.verify_api_key("키-123") is True
+            assert APIKeyAuth.verify_api_key("키-124") is False
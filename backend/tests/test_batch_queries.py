@@ -137,6 +137,18 @@ class TestBatchQueries:
                 assert batch_first.date == single_first.date
                 assert batch_first.close_price == single_first.close_price
 
+    def test_recent_price_summary_matches_batch(self, collector, test_tickers, date_range):
+        """Given: 같은 기간 / When: 집계 조회 / Then: 배치 조회의 건수·최신일과 동일"""
+        start_date, end_date = date_range
+
+        summary = collector.get_recent_price_summary(start_date)
+        batch_result = collector.get_price_data_batch(test_tickers, start_date, end_date)
+
+        for ticker in test_tickers:
+            prices = batch_result[ticker]
+            expected = (len(prices), prices[0].date) if prices else (0, None)
+            assert summary.get(ticker, (0, None)) == expected
+
 
 class TestQueryLimits:
     """쿼리 결과 크기 제한 테스트"""
@@ -193,6 +205,14 @@ class TestConnectionPool:
         conn2 = pool.get_connection()
         assert conn2 is not None
 
+    def test_connection_pool_is_singleton(self):
+        """get_connection_pool/get_ro_connection_pool이 같은 인스턴스를 반환하는지 테스트"""
+        from app.database import get_connection_pool, get_ro_connection_pool
+
+        assert get_connection_pool() is get_connection_pool()
+        assert get_ro_connection_pool() is get_ro_connection_pool()
+        assert get_ro_connection_pool() is not get_connection_pool()
+
     def test_connection_pool_multiple_connections(self):
         """Connection Pool 복수 연결 테스트"""
         from app.database import get_connection_pool
@@ -210,6 +230,132 @@ class TestConnectionPool:
         for conn in connections:
             pool.return_connection(conn)
 
+    def test_connection_pool_waits_for_returned_connection(self):
+        """풀이 가득 찼을 때 반환된 연결을 대기 중인 요청이 받아가는지 테스트"""
+        import threading
+        from app.database import ConnectionPool, USE_POSTGRES
+
+        if USE_POSTGRES:
+            pytest.skip("SQLite 풀 전용 테스트")
+
+        # Given: 최대 1개 연결만 허용하는 풀에서 연결을 점유
+        pool = ConnectionPool(max_connections=1)
+        conn = pool.get_connection()
+        received = []
+
+        # When: 다른 스레드가 대기하는 동안 연결 반환
+        waiter = threading.Thread(target=lambda: received.append(pool.get_connection()))
+        waiter.start()
+        pool.return_connection(conn)
+        waiter.join(timeout=5)
+
+        # Then: 대기하던 스레드가 같은 연결을 재사용
+        assert received == [conn]
+        assert pool.current_connections == 1
+        pool.return_connection(conn)
+        pool.close_all()
+
+    def test_connection_pool_raises_when_exhausted(self, monkeypatch):
+        """대기 단계를 모두 소진하면 PoolExhaustedException(TimeoutError 호환)이 발생하는지 테스트"""
+        from app import database
+
+        if database.USE_POSTGRES:
+            pytest.skip("SQLite 풀 전용 테스트")
+
+        # Given: 연결 1개를 점유한 풀과 짧은 대기 단계
+        monkeypatch.setattr(database, "_POOL_WAIT_STEPS", (0.01, 0.01))
+        pool = database.ConnectionPool(max_connections=1)
+        conn = pool.get_connection()
+
+        # When / Then
+        with pytest.raises(database.PoolExhaustedException) as exc_info:
+            pool.get_connection()
+        assert isinstance(exc_info.value, TimeoutError)
+        pool.return_connection(conn)
+        pool.close_all()
+
+    def test_connection_pool_applies_sqlite_pragmas(self):
+        """새 SQLite 연결에 WAL 등 PRAGMA가 적용되는지 테스트"""
+        from app.database import ConnectionPool, USE_POSTGRES
+
+        if USE_POSTGRES:
+            pytest.skip("SQLite 풀 전용 테스트")
+
+        pool = ConnectionPool(max_connections=1)
+        conn = pool.get_connection()
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+        finally:
+            pool.return_connection(conn)
+            pool.close_all()
+
+    def test_connection_pool_runs_optimize_periodically(self, monkeypatch):
+        """쓰기 풀이 N번 반환마다, 그리고 close_all 시 PRAGMA optimize를 실행하는지 테스트"""
+        from app import database
+
+        if database.USE_POSTGRES:
+            pytest.skip("SQLite 풀 전용 테스트")
+
+        # Given: 2번 반환마다 optimize 하도록 설정
+        monkeypatch.setattr(database, "_SQLITE_OPTIMIZE_EVERY", 2)
+        pool = database.ConnectionPool(max_connections=1)
+        conn = pool.get_connection()
+        statements = []
+        conn.set_trace_callback(statements.append)
+
+        # When: 같은 연결을 네 번 반환한 뒤 풀 종료
+        for _ in range(4):
+            pool.return_connection(conn)
+            conn = pool.get_connection()
+        pool.return_connection(conn)
+        optimized_before_close = statements.count("PRAGMA optimize")
+        pool.close_all()
+
+        # Then: 5번 반환 중 2회 + 종료 시 1회
+        assert optimized_before_close == 2
+        assert statements.count("PRAGMA optimize") == 3
+
+    def test_pg_connect_kwargs_enable_keepalive_and_timeout(self, monkeypatch):
+        """PostgreSQL 풀 연결 옵션에 keepalive와 statement_timeout이 포함되는지 테스트"""
+        from app.database import _pg_connect_kwargs
+
+        monkeypatch.setenv("DB_STATEMENT_TIMEOUT_MS", "15000")
+
+        kwargs = _pg_connect_kwargs()
+
+        assert kwargs["keepalives"] == 1
+        assert kwargs["options"] == "-c statement_timeout=15000"
+
+    def test_ro_db_connection_reads_but_rejects_writes(self):
+        """읽기 전용 연결은 조회는 되고 쓰기는 거부되는지 테스트"""
+        import sqlite3
+        from app.database import get_ro_db_connection, USE_POSTGRES
+
+        if USE_POSTGRES:
+            pytest.skip("SQLite 읽기 전용 풀 전용 테스트")
+
+        with get_ro_db_connection() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM etfs").fetchone()[0]
+            assert count >= 0
+
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM etfs WHERE ticker = 'NOPE'")
+
+    def test_get_db_connection_readonly_uses_query_only_pool(self):
+        """get_db_connection(readonly=True)가 읽기 전용 풀의 연결을 주는지 테스트"""
+        from app.database import get_db_connection, USE_POSTGRES
+
+        if USE_POSTGRES:
+            pytest.skip("SQLite 읽기 전용 풀 전용 테스트")
+
+        with get_db_connection(readonly=True) as conn:
+            assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+        with get_db_connection() as conn:
+            assert conn.execute("PRAGMA query_only").fetchone()[0] == 0
+
     def test_get_db_connection_context_manager(self):
         """get_db_connection context manager 테스트"""
         from app.database import get_db_connection
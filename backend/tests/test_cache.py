@@ -0,0 +1,156 @@
+"""
+MemoryCache 단위 테스트
+
+항목별 TTL 만료, 최대 크기 도달 시 LFU eviction, aget_or_set single-flight 동작을 검증합니다.
+"""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.utils.cache import MemoryCache
+
+
+class TestMemoryCacheEviction:
+    """MemoryCache eviction 테스트"""
+
+    def test_evicts_least_frequently_used(self):
+        # Given: 가득 찬 캐시에서 a만 반복 조회됨
+        cache = MemoryCache(default_ttl_seconds=60, max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.get("a")
+
+        # When: 새 항목 추가
+        cache.set("c", 3)
+
+        # Then: 조회 횟수가 적은 b가 제거됨
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_expired_entries_are_evicted_first(self):
+        # Given: 자주 조회되지만 TTL이 짧은 항목
+        cache = MemoryCache(default_ttl_seconds=60, max_size=2)
+        with patch("app.utils.cache.time.monotonic", return_value=1000.0):
+            cache.set("short", 1, ttl_seconds=1)
+            cache.set("long", 2)
+            cache.get("short")
+
+        # When: 만료 이후 새 항목 추가
+        with patch("app.utils.cache.time.monotonic", return_value=1010.0):
+            cache.set("new", 3)
+
+            # Then: 만료 항목만 정리되고 LFU eviction은 일어나지 않음
+            assert cache.get("long") == 2
+            assert cache.get("new") == 3
+        assert cache.get_stats()["evictions"] == 0
+
+    def test_overwrite_does_not_evict(self):
+        cache = MemoryCache(default_ttl_seconds=60, max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.set("a", 10)
+
+        assert cache.get("a") == 10
+        assert cache.get("b") == 2
+
+    def test_hit_does_not_extend_ttl(self):
+        cache = MemoryCache(default_ttl_seconds=60)
+        with patch("app.utils.cache.time.monotonic", return_value=0.0):
+            cache.set("a", 1, ttl_seconds=10)
+        with patch("app.utils.cache.time.monotonic", return_value=9.0):
+            assert cache.get("a") == 1
+        with patch("app.utils.cache.time.monotonic", return_value=11.0):
+            assert cache.get("a") is None
+
+
+class TestMemoryCacheSingleFlight:
+    """aget_or_set single-flight 테스트"""
+
+    async def test_concurrent_misses_run_loader_once(self):
+        # Given: 비어 있는 캐시와 느린 로더
+        cache = MemoryCache(default_ttl_seconds=60)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"value": 1}
+
+        # When: 같은 키로 동시에 10회 조회
+        results = await asyncio.gather(*(cache.aget_or_set("k", loader) for _ in range(10)))
+
+        # Then: 로더는 1회만 실행되고 모두 같은 값을 받음, 로딩 락은 정리됨
+        assert len(calls) == 1
+        assert all(r == {"value": 1} for r in results)
+        assert cache._inflight == {}
+        assert cache._loading_keys == {}
+
+    async def test_loader_error_is_not_cached(self):
+        # Given: 실패하는 로더
+        cache = MemoryCache(default_ttl_seconds=60)
+
+        async def failing():
+            raise RuntimeError("db down")
+
+        async def ok():
+            return 2
+
+        # When/Then: 예외는 그대로 전파되고 다음 조회에서 다시 로딩
+        with pytest.raises(RuntimeError):
+            await cache.aget_or_set("k", failing)
+        assert await cache.aget_or_set("k", ok) == 2
+
+    async def test_invalidation_during_load_is_not_cached(self):
+        # Given: 로딩 도중 무효화가 일어나는 로더
+        cache = MemoryCache(default_ttl_seconds=60)
+
+        async def stale_loader():
+            cache.delete("k")
+            return "stale"
+
+        # When: 조회
+        result = await cache.aget_or_set("k", stale_loader)
+
+        # Then: 결과는 반환되지만 무효화 이전 데이터는 캐시에 남지 않음
+        assert result == "stale"
+        assert cache.get("k") is None
+
+    async def test_unrelated_invalidation_keeps_loaded_value(self):
+        # Given: 로딩 도중 다른 키만 무효화하는 로더
+        cache = MemoryCache(default_ttl_seconds=60)
+        cache.set("alert_rules:A:1", 1)
+
+        async def loader():
+            cache.invalidate_pattern("alert_rules:A:")
+            cache.delete("other")
+            return "fresh"
+
+        # When: 조회
+        await cache.aget_or_set("status", loader)
+
+        # Then: 이 키의 결과는 그대로 캐시됨
+        assert cache.get("status") == "fresh"
+
+    async def test_waiters_share_result_of_invalidated_load(self):
+        # Given: 로딩 도중 자기 키가 무효화되는 느린 로더
+        cache = MemoryCache(default_ttl_seconds=60)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            cache.delete("k")
+            return len(calls)
+
+        # When: 같은 키로 동시에 5회 조회
+        results = await asyncio.gather(*(cache.aget_or_set("k", loader) for _ in range(5)))
+
+        # Then: 대기 요청은 로더를 다시 실행하지 않고 선행 결과를 받으며, 결과는 저장되지 않음
+        assert calls == [1]
+        assert results == [1] * 5
+        assert cache.get("k") is None
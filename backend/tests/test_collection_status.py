@@ -0,0 +1,177 @@
+"""
+collection_status 수집 상태 UPSERT/조회 단위 테스트
+
+init_db()로 초기화된 SQLite DB에서 update_collection_status()의
+INSERT ... ON CONFLICT 동작을 검증합니다.
+"""
+import pytest
+
+from app.database import (
+    defer_collection_status_updates,
+    init_db,
+    get_db_connection,
+    get_collection_status,
+    get_collection_status_many,
+    update_collection_status,
+    update_collection_status_many,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_db():
+    """각 테스트마다 DB를 초기화하고 대상 종목의 수집 상태를 비운다."""
+    init_db()
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT ticker FROM etfs ORDER BY ticker LIMIT 2")
+        tickers = [row[0] for row in cursor.fetchall()]
+        cursor.executemany(
+            "DELETE FROM collection_status WHERE ticker = ?",
+            [(t,) for t in tickers],
+        )
+        conn.commit()
+    yield tickers
+
+
+class TestUpdateCollectionStatus:
+    """update_collection_status UPSERT 테스트"""
+
+    def test_insert_new_row(self, fresh_db):
+        ticker = fresh_db[0]
+
+        update_collection_status(ticker, price_date="2025-01-02", success=True)
+
+        status = get_collection_status(ticker)
+        assert status["last_price_date"] == "2025-01-02"
+        assert status["last_trading_flow_date"] is None
+        assert status["last_news_collected_at"] is None
+        assert status["last_successful_collection"] is not None
+        assert status["consecutive_failures"] == 0
+
+    def test_update_keeps_unspecified_dates(self, fresh_db):
+        ticker = fresh_db[0]
+        update_collection_status(ticker, price_date="2025-01-02", success=True)
+
+        update_collection_status(ticker, trading_flow_date="2025-01-03", news_collected=True)
+
+        status = get_collection_status(ticker)
+        assert status["last_price_date"] == "2025-01-02"
+        assert status["last_trading_flow_date"] == "2025-01-03"
+        assert status["last_news_collected_at"] is not None
+
+    def test_failures_increment_and_reset(self, fresh_db):
+        ticker = fresh_db[0]
+        update_collection_status(ticker, price_date="2025-01-02", success=True)
+        last_success = get_collection_status(ticker)["last_successful_collection"]
+
+        update_collection_status(ticker, success=False)
+        update_collection_status(ticker, success=False)
+
+        status = get_collection_status(ticker)
+        assert status["consecutive_failures"] == 2
+        assert status["last_successful_collection"] == last_success
+        assert status["last_price_date"] == "2025-01-02"
+
+        update_collection_status(ticker, success=True)
+        assert get_collection_status(ticker)["consecutive_failures"] == 0
+
+    def test_first_failure_inserts_with_one_failure(self, fresh_db):
+        ticker = fresh_db[0]
+
+        update_collection_status(ticker, success=False)
+
+        status = get_collection_status(ticker)
+        assert status["consecutive_failures"] == 1
+        assert status["last_successful_collection"] is None
+
+
+class TestUpdateCollectionStatusMany:
+    """update_collection_status_many 배치 UPSERT 테스트"""
+
+    def test_batch_upsert(self, fresh_db):
+        first, second = fresh_db
+
+        update_collection_status_many([
+            (first, "2025-01-02", None, False, True),
+            (second, None, "2025-01-03", True, False),
+        ])
+
+        assert get_collection_status(first)["last_price_date"] == "2025-01-02"
+        status = get_collection_status(second)
+        assert status["last_trading_flow_date"] == "2025-01-03"
+        assert status["consecutive_failures"] == 1
+
+    def test_batch_shares_given_timestamp(self, fresh_db):
+        first, second = fresh_db
+        now = "2025-01-02T09:00:00"
+
+        update_collection_status_many([
+            (first, "2025-01-02", None, False, True),
+            (second, "2025-01-02", None, False, True),
+        ], now=now)
+
+        for ticker in fresh_db:
+            status = get_collection_status(ticker)
+            assert status["last_collection_attempt"] == now
+            assert status["updated_at"] == now
+
+    def test_empty_batch_is_noop(self):
+        update_collection_status_many([])
+
+
+class TestGetCollectionStatusMany:
+    """get_collection_status_many 테스트"""
+
+    def test_returns_only_tickers_with_history(self, fresh_db):
+        # Given: 첫 종목만 수집 이력이 있음
+        first, second = fresh_db
+        update_collection_status(first, price_date="2025-01-02")
+
+        # When
+        statuses = get_collection_status_many([first, second])
+
+        # Then: 단건 조회와 같은 dict, 이력 없는 종목은 키 없음
+        assert statuses == {first: get_collection_status(first)}
+
+    def test_empty_tickers(self):
+        assert get_collection_status_many([]) == {}
+
+
+class TestDeferCollectionStatusUpdates:
+    """defer_collection_status_updates write-behind 테스트"""
+
+    def test_writes_are_flushed_at_block_exit(self, fresh_db):
+        first, second = fresh_db
+
+        # When: 블록 안에서 두 종목 상태 기록 (같은 종목 실패 두 번 포함)
+        with defer_collection_status_updates():
+            update_collection_status(first, price_date="2025-01-02")
+            update_collection_status(second, success=False)
+            update_collection_status(second, success=False)
+
+            # Then: 블록이 끝나기 전에는 DB에 반영되지 않음
+            assert get_collection_status(first) is None
+
+        # Then: 블록 종료 후 순서대로 반영
+        assert get_collection_status(first)["last_price_date"] == "2025-01-02"
+        assert get_collection_status(second)["consecutive_failures"] == 2
+
+    def test_flushes_even_when_block_raises(self, fresh_db):
+        ticker = fresh_db[0]
+
+        with pytest.raises(RuntimeError):
+            with defer_collection_status_updates():
+                update_collection_status(ticker, price_date="2025-01-02")
+                raise RuntimeError("수집 중단")
+
+        assert get_collection_status(ticker)["last_price_date"] == "2025-01-02"
+
+    def test_nested_block_flushes_once_at_outer_exit(self, fresh_db):
+        ticker = fresh_db[0]
+
+        with defer_collection_status_updates():
+            with defer_collection_status_updates():
+                update_collection_status(ticker, price_date="2025-01-02")
+            assert get_collection_status(ticker) is None
+
+        assert get_collection_status(ticker)["last_price_date"] == "2025-01-02"
@@ -0,0 +1,259 @@
+"""
+init_db() 스키마/마이그레이션 단위 테스트
+
+기존 DB에 누락된 컬럼을 추가하는 _add_missing_columns() 동작과
+init_db()가 만드는 인덱스의 쿼리 플랜을 SQLite로 검증합니다.
+"""
+import sqlite3
+
+import pytest
+from unittest.mock import MagicMock
+
+from app import database
+from app.database import _add_missing_columns, _get_existing_columns
+
+
+@pytest.fixture
+def legacy_conn():
+    """quantity 등 신규 컬럼이 없는 구버전 etfs 테이블"""
+    if database.USE_POSTGRES:
+        pytest.skip("SQLite 전용 테스트")
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE etfs (ticker TEXT PRIMARY KEY, name TEXT NOT NULL)")
+    yield conn
+    conn.close()
+
+
+class TestAddMissingColumns:
+    """_add_missing_columns 테스트"""
+
+    def test_adds_only_missing_columns(self, legacy_conn):
+        cursor = legacy_conn.cursor()
+
+        _add_missing_columns(cursor, legacy_conn, "etfs", [
+            ("name", "TEXT"),
+            ("quantity", "INTEGER"),
+        ])
+
+        assert _get_existing_columns(cursor, "etfs") == {"ticker", "name", "quantity"}
+
+    def test_idempotent_without_alter(self, legacy_conn):
+        cursor = legacy_conn.cursor()
+        columns = [("quantity", "INTEGER")]
+        _add_missing_columns(cursor, legacy_conn, "etfs", columns)
+
+        # 두 번째 실행은 ALTER TABLE 없이 끝나야 한다
+        statements = []
+        legacy_conn.set_trace_callback(statements.append)
+        _add_missing_columns(cursor, legacy_conn, "etfs", columns)
+        legacy_conn.set_trace_callback(None)
+
+        assert not any("ALTER TABLE" in sql for sql in statements)
+
+
+class TestCoveringIndexes:
+    """prices/trading_flow 커버링 인덱스 및 부분 인덱스 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def _init(self):
+        if database.USE_POSTGRES:
+            pytest.skip("SQLite 전용 테스트")
+        database.init_db()
+
+    def _plan(self, sql, params):
+        with database.get_db_connection() as conn:
+            rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        return " ".join(row[3] for row in rows)
+
+    def test_prices_range_query_uses_covering_index(self):
+        plan = self._plan(
+            "SELECT date, close_price, daily_change_pct FROM prices "
+            "WHERE ticker = ? AND date >= ? ORDER BY date DESC",
+            ("487240", "2025-01-01"),
+        )
+        assert "COVERING INDEX idx_prices_cover" in plan
+
+    def test_trading_flow_range_query_uses_covering_index(self):
+        plan = self._plan(
+            "SELECT date, individual_net, institutional_net, foreign_net FROM trading_flow "
+            "WHERE ticker = ? AND date BETWEEN ? AND ? ORDER BY date DESC",
+            ("487240", "2025-01-01", "2025-12-31"),
+        )
+        assert "COVERING INDEX idx_trading_flow_cover" in plan
+
+    def test_active_catalog_index_is_partial(self):
+        with database.get_db_connection() as conn:
+            indexes = dict(conn.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'stock_catalog'"
+            ).fetchall())
+        assert "idx_stock_catalog_active_tickers" not in indexes
+        assert "WHERE is_active = 1" in indexes["idx_stock_catalog_active"]
+
+    def test_failed_status_scan_uses_partial_index(self):
+        plan = self._plan(
+            "SELECT ticker FROM collection_status WHERE consecutive_failures > 0", ()
+        )
+        assert "COVERING INDEX idx_collection_status_failures" in plan
+
+    def test_collection_status_has_no_unused_date_index(self):
+        with database.get_db_connection() as conn:
+            indexes = {
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'collection_status'"
+                )
+            }
+        assert "idx_collection_status_last_dates" not in indexes
+
+    def test_active_alert_rules_query_needs_no_sort(self):
+        plan = self._plan(
+            "SELECT * FROM alert_rules WHERE ticker = ? AND is_active = 1 ORDER BY created_at DESC",
+            ("487240",),
+        )
+        assert "idx_alert_rules_ticker_active_created" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_alert_history_delete_by_rule_uses_index(self):
+        plan = self._plan("SELECT id FROM alert_history WHERE rule_id = ?", (1,))
+        assert "idx_alert_history_rule_id" in plan
+
+
+class TestSeedEtfs:
+    """init_db() 종목 시드 INSERT 테스트"""
+
+    def test_seeds_all_configured_stocks_in_chunks(self, tmp_path, monkeypatch):
+        if database.USE_POSTGRES:
+            pytest.skip("SQLite 전용 테스트")
+        # Given: 빈 임시 DB와 설정 종목 수보다 작은 청크 크기
+        monkeypatch.setattr(database, "DB_PATH", tmp_path / "seed.db")
+        monkeypatch.setattr(database, "_SEED_ROWS_PER_INSERT", 4)
+        expected = set(database.Config.get_stock_config())
+
+        # When: 두 번 초기화 (두 번째는 OR IGNORE로 중복 무시)
+        database.init_db()
+        database.init_db()
+
+        # Then
+        conn = sqlite3.connect(tmp_path / "seed.db")
+        try:
+            tickers = {row[0] for row in conn.execute("SELECT ticker FROM etfs")}
+        finally:
+            conn.close()
+        assert tickers == expected
+
+    def test_schema_runs_in_single_transaction(self, tmp_path, monkeypatch):
+        if database.USE_POSTGRES:
+            pytest.skip("SQLite 전용 테스트")
+        # Given: init_db가 여는 연결의 SQL을 기록
+        monkeypatch.setattr(database, "DB_PATH", tmp_path / "txn.db")
+        statements = []
+        real_connect = sqlite3.connect
+
+        def tracing_connect(*args, **kwargs):
+            conn = real_connect(*args, **kwargs)
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        monkeypatch.setattr(database.sqlite3, "connect", tracing_connect)
+
+        # When
+        database.init_db()
+
+        # Then: 첫 CREATE TABLE 전에 BEGIN, COMMIT은 마지막 한 번뿐
+        begin = statements.index("BEGIN IMMEDIATE")
+        first_ddl = next(i for i, sql in enumerate(statements) if "CREATE TABLE" in sql)
+        assert begin < first_ddl
+        assert statements.count("COMMIT") == 1
+
+
+class TestWithoutRowid:
+    """ticker PK 테이블 WITHOUT ROWID 테스트"""
+
+    def test_new_db_uses_without_rowid_for_ticker_tables(self, tmp_path, monkeypatch):
+        if database.USE_POSTGRES:
+            pytest.skip("SQLite 전용 테스트")
+        monkeypatch.setattr(database, "DB_PATH", tmp_path / "fresh.db")
+
+        database.init_db()
+
+        conn = sqlite3.connect(tmp_path / "fresh.db")
+        try:
+            schema = dict(conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'table'"))
+            etf_rows = conn.execute("SELECT COUNT(*) FROM etfs").fetchone()[0]
+        finally:
+            conn.close()
+        for table in ("etfs", "stock_catalog", "collection_status"):
+            assert schema[table].rstrip().endswith("WITHOUT ROWID")
+        assert "WITHOUT ROWID" not in schema["prices"]
+        assert etf_rows > 0
+
+
+class TestSchemaVersion:
+    """PRAGMA user_version / schema_version 테이블 기반 마이그레이션 게이트 테스트"""
+
+    def test_postgres_version_is_read_from_table(self, monkeypatch):
+        monkeypatch.setattr(database, "USE_POSTGRES", True)
+        cursor = MagicMock()
+
+        # 테이블이 없으면(기존 배포) 0 → 마이그레이션 1회 수행
+        cursor.fetchone.side_effect = [(None,)]
+        assert database._get_schema_version(cursor) == 0
+
+        # 기록된 버전이 있으면 그 값을 사용
+        cursor.fetchone.side_effect = [("schema_version",), (database._SCHEMA_VERSION,)]
+        assert database._get_schema_version(cursor) == database._SCHEMA_VERSION
+
+        # 기록은 한 행 UPSERT
+        database._set_schema_version(cursor, database._SCHEMA_VERSION)
+        sql, params = cursor.execute.call_args.args
+        assert "ON CONFLICT (id) DO UPDATE" in sql
+        assert params == (database._SCHEMA_VERSION,)
+
+    def test_second_init_skips_column_checks(self, tmp_path, monkeypatch):
+        if database.USE_POSTGRES:
+            pytest.skip("SQLite 전용 테스트")
+        monkeypatch.setattr(database, "DB_PATH", tmp_path / "version.db")
+        statements = []
+        real_connect = sqlite3.connect
+
+        def tracing_connect(*args, **kwargs):
+            conn = real_connect(*args, **kwargs)
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        # Given: 첫 초기화로 스키마 버전 기록
+        database.init_db()
+        conn = real_connect(tmp_path / "version.db")
+        try:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == database._SCHEMA_VERSION
+        finally:
+            conn.close()
+
+        # When: 두 번째 초기화
+        monkeypatch.setattr(database.sqlite3, "connect", tracing_connect)
+        database.init_db()
+
+        # Then: 컬럼 조회(PRAGMA table_info) 없이 끝남
+        assert not any("PRAGMA table_info" in sql for sql in statements)
+
+    def test_legacy_db_is_migrated_once(self, tmp_path, monkeypatch):
+        if database.USE_POSTGRES:
+            pytest.skip("SQLite 전용 테스트")
+        # Given: quantity 컬럼이 없는 구버전 etfs 테이블 (user_version = 0)
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE etfs (ticker TEXT PRIMARY KEY, name TEXT NOT NULL, type TEXT NOT NULL, "
+            "theme TEXT, purchase_date DATE)"
+        )
+        conn.close()
+        monkeypatch.setattr(database, "DB_PATH", db_path)
+
+        # When
+        database.init_db()
+
+        # Then
+        conn = sqlite3.connect(db_path)
+        try:
+            assert "quantity" in _get_existing_columns(conn.cursor(), "etfs")
+        finally:
+            conn.close()
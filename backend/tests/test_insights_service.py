@@ -118,3 +118,15 @@ class TestInsightsService:
         risk_texts = " ".join(risks)
         if metrics.volatility and metrics.volatility > 30:
             assert "변동성" in risk_texts or len(risks) > 0
+
+
+class TestReturnsBreakdown:
+    """ETFMetrics.returns 모델 테스트"""
+
+    def test_json_keys_stay_period_labels(self):
+        """Given: "1w"/"1m"/"ytd" dict로 생성 / Then: 필드 접근 가능, JSON 키는 그대로"""
+        metrics = ETFMetrics(ticker="487240", returns={"1w": 1.5, "1m": None, "ytd": 7.0})
+
+        assert metrics.returns.one_w == 1.5
+        assert metrics.returns.one_m is None
+        assert metrics.model_dump(by_alias=True)["returns"] == {"1w": 1.5, "1m": None, "ytd": 7.0}
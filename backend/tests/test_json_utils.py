@@ -0,0 +1,45 @@
+"""
+JSON 유틸리티 테스트
+
+orjson 사용 여부와 관계없이 json_utils.dumps/loads가 같은 결과를 내는지 검증합니다.
+"""
+
+import json
+
+import pytest
+from unittest.mock import patch
+from app.utils import json_utils
+
+
+class TestJsonUtils:
+    """json_utils 테스트"""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_roundtrip_keeps_korean(self, use_orjson):
+        """한글 키워드가 이스케이프 없이 직렬화되고 그대로 복원되는지"""
+        keywords = ["AI", "전력", "데이터센터"]
+        backend = json_utils.orjson if use_orjson else None
+        if use_orjson and backend is None:
+            pytest.skip("orjson 미설치")
+
+        with patch.object(json_utils, "orjson", backend):
+            encoded = json_utils.dumps(keywords)
+            assert isinstance(encoded, str)
+            assert "전력" in encoded
+            assert json_utils.loads(encoded) == keywords
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_default_and_non_str_keys(self, use_orjson):
+        """default 변환 함수와 int 키가 두 구현에서 같은 결과인지 (로그 렌더러 용도)"""
+        backend = json_utils.orjson if use_orjson else None
+        if use_orjson and backend is None:
+            pytest.skip("orjson 미설치")
+
+        with patch.object(json_utils, "orjson", backend):
+            encoded = json_utils.dumps({"error": ValueError("x"), 1: "a"}, default=repr)
+            assert json_utils.loads(encoded) == {"error": "ValueError('x')", "1": "a"}
+
+    def test_invalid_json_raises_stdlib_error(self):
+        """orjson 사용 시에도 json.JSONDecodeError로 잡을 수 있는지"""
+        with pytest.raises(json.JSONDecodeError):
+            json_utils.loads("not json")
@@ -102,6 +102,17 @@ class TestRateLimitConfig:
         assert RateLimitConfig.READ_ONLY == "200/minute"
         assert RateLimitConfig.DANGEROUS == "5/minute"
 
+    def test_client_ip_key_matches_slowapi(self):
+        """Rate Limit 키가 slowapi get_remote_address와 같은 값인지 확인"""
+        from slowapi.util import get_remote_address
+        from starlette.requests import Request
+
+        from app.middleware.rate_limit import get_client_ip
+
+        for client in [("10.0.0.7", 5123), None]:
+            request = Request({"type": "http", "headers": [], "client": client})
+            assert get_client_ip(request) == get_remote_address(request)
+
 
 @pytest.mark.slow
 class TestRateLimitRecovery:
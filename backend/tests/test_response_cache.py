@@ -0,0 +1,164 @@
+"""
+GET 응답 캐시 미들웨어 테스트
+"""
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+
+from app.middleware import response_cache
+from app.middleware.response_cache import response_cache_middleware
+from app.utils.cache import MemoryCache
+from app.utils.http_cache import etag_json_response
+
+
+@pytest.fixture
+def cache():
+    """테스트마다 독립된 캐시 인스턴스"""
+    instance = MemoryCache(default_ttl_seconds=30, max_size=100)
+    with patch.object(response_cache, "get_cache", return_value=instance):
+        yield instance
+
+
+@pytest.fixture
+def app_and_calls():
+    """핸들러 호출 횟수를 기록하는 최소 앱"""
+    calls = {"prices": 0, "progress": 0, "fail": 0}
+    state = {"fail": False}
+    app = FastAPI()
+    app.middleware("http")(response_cache_middleware)
+
+    @app.get("/api/etfs/{ticker}/prices")
+    def prices(ticker: str, days: int = 7):
+        calls["prices"] += 1
+        if state["fail"]:
+            raise HTTPException(status_code=503, detail="upstream down")
+        return {"ticker": ticker, "days": days, "call": calls["prices"]}
+
+    @app.get("/api/data/scheduler-status")
+    def scheduler_status(request: Request):
+        return etag_json_response(request, b'{"scheduler": {}}')
+
+    @app.get("/api/data/collect-progress")
+    def progress():
+        calls["progress"] += 1
+        return {"call": calls["progress"]}
+
+    return app, calls, state
+
+
+class TestResponseCacheMiddleware:
+    """응답 캐시 동작 테스트"""
+
+    def test_second_get_is_served_from_cache(self, cache, app_and_calls):
+        """Given: 같은 GET 요청 2회 / Then: 핸들러는 1회만 실행, 바디 동일"""
+        app, calls, _ = app_and_calls
+        client = TestClient(app)
+
+        first = client.get("/api/etfs/487240/prices?days=7")
+        second = client.get("/api/etfs/487240/prices?days=7")
+
+        assert calls["prices"] == 1
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.json() == first.json()
+
+    def test_cached_etag_response_returns_304(self, cache, app_and_calls):
+        """Given: ETag가 붙은 캐시 응답 / When: 같은 If-None-Match로 재요청 / Then: HIT에서 본문 없이 304"""
+        app, _, _ = app_and_calls
+        client = TestClient(app)
+
+        etag = client.get("/api/data/scheduler-status").headers["ETag"]
+        response = client.get("/api/data/scheduler-status", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["X-Cache"] == "HIT"
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    def test_query_and_api_key_are_part_of_key(self, cache, app_and_calls):
+        """Given: 쿼리 또는 X-API-Key가 다른 요청 / Then: 응답을 공유하지 않음"""
+        app, calls, _ = app_and_calls
+        client = TestClient(app)
+
+        client.get("/api/etfs/487240/prices?days=7")
+        client.get("/api/etfs/487240/prices?days=30")
+        client.get("/api/etfs/487240/prices?days=7", headers={"X-API-Key": "secret"})
+
+        assert calls["prices"] == 3
+
+    def test_router_invalidation_pattern_clears_response(self, cache, app_and_calls):
+        """Given: 캐시된 가격 응답 / When: invalidate_pattern("prices:487240") / Then: 다시 핸들러 실행"""
+        app, calls, _ = app_and_calls
+        client = TestClient(app)
+
+        client.get("/api/etfs/487240/prices")
+        cache.invalidate_pattern("prices:487240")
+        client.get("/api/etfs/487240/prices")
+
+        assert calls["prices"] == 2
+
+    def test_excluded_polling_path_is_not_cached(self, cache, app_and_calls):
+        """Given: collect-progress 폴링 / Then: 매번 핸들러 실행"""
+        app, calls, _ = app_and_calls
+        client = TestClient(app)
+
+        client.get("/api/data/collect-progress")
+        client.get("/api/data/collect-progress")
+
+        assert calls["progress"] == 2
+        assert len(cache._cache) == 0
+
+    def test_stale_response_served_on_server_error(self, cache, app_and_calls):
+        """Given: TTL이 지난 캐시 응답 / When: 핸들러가 5xx / Then: 마지막 정상 응답 반환"""
+        app, calls, state = app_and_calls
+        client = TestClient(app)
+
+        first = client.get("/api/etfs/487240/prices")
+        key = next(iter(cache._cache))
+        cache._cache[key]["value"]["fresh_until"] = 0
+        state["fail"] = True
+        stale = client.get("/api/etfs/487240/prices")
+
+        assert calls["prices"] == 2
+        assert stale.status_code == 200
+        assert stale.headers["X-Cache"] == "STALE"
+        assert stale.json() == first.json()
+
+    def test_error_response_is_not_cached(self, cache, app_and_calls):
+        """Given: 캐시 없이 5xx 응답 / Then: 저장하지 않고 그대로 반환"""
+        app, calls, state = app_and_calls
+        state["fail"] = True
+        client = TestClient(app)
+
+        response = client.get("/api/etfs/487240/prices")
+
+        assert response.status_code == 503
+        assert len(cache._cache) == 0
+
+    def test_gzip_and_identity_are_cached_separately(self, cache):
+        """Given: GZip이 캐시 안쪽 / Then: Accept-Encoding별로 따로 저장, 압축 바디 재사용"""
+        from fastapi.middleware.gzip import GZipMiddleware
+
+        calls = {"n": 0}
+        app = FastAPI()
+        app.add_middleware(GZipMiddleware, minimum_size=100)
+        app.middleware("http")(response_cache_middleware)
+
+        @app.get("/api/etfs/")
+        def etfs():
+            calls["n"] += 1
+            return [{"ticker": f"{i:06d}", "name": "KODEX"} for i in range(50)]
+
+        client = TestClient(app)
+        gz = client.get("/api/etfs/", headers={"Accept-Encoding": "gzip"})
+        plain = client.get("/api/etfs/", headers={"Accept-Encoding": "identity"})
+        gz_hit = client.get("/api/etfs/", headers={"Accept-Encoding": "gzip"})
+
+        assert calls["n"] == 2
+        assert gz.headers["Content-Encoding"] == "gzip"
+        assert "Content-Encoding" not in plain.headers
+        assert gz_hit.headers["X-Cache"] == "HIT"
+        assert gz_hit.headers["Content-Encoding"] == "gzip"
+        assert gz_hit.json() == plain.json()
@@ -0,0 +1,60 @@
+"""
+Tests for scanner search pagination (GET /api/scanner).
+
+전체 건수(total)를 페이지 조회와 같은 쿼리(COUNT(*) OVER())에서 계산하는지 검증
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.database import init_db, get_db_connection
+
+client = TestClient(app)
+
+SEARCH_NAME = "페이징테스트"
+TICKERS = [f"PG{i:04d}" for i in range(5)]
+
+
+@pytest.fixture(autouse=True)
+def setup_catalog():
+    init_db()
+    with get_db_connection() as conn:
+        conn.executemany(
+            """INSERT OR REPLACE INTO stock_catalog
+               (ticker, name, type, market, is_active, weekly_return, catalog_updated_at)
+               VALUES (?, ?, 'ETF', 'ETF', 1, ?, CURRENT_TIMESTAMP)""",
+            [(t, f"{SEARCH_NAME} {t}", float(i)) for i, t in enumerate(TICKERS)],
+        )
+        conn.commit()
+    yield
+    with get_db_connection() as conn:
+        conn.executemany("DELETE FROM stock_catalog WHERE ticker = ?", [(t,) for t in TICKERS])
+        conn.commit()
+
+
+class TestScannerPagination:
+    """검색 결과 페이징 테스트"""
+
+    def test_total_counts_all_matches(self):
+        """Given: 5건 매칭 / When: page_size=2 / Then: 2건 반환, total=5"""
+        response = client.get("/api/scanner", params={"q": SEARCH_NAME, "page_size": 2})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        assert [item["ticker"] for item in data["items"]] == ["PG0004", "PG0003"]
+
+    def test_page_beyond_results_keeps_total(self):
+        """Given: 5건 매칭 / When: 범위 밖 페이지 / Then: 빈 items, total=5"""
+        response = client.get("/api/scanner", params={"q": SEARCH_NAME, "page_size": 2, "page": 4})
+
+        data = response.json()
+        assert data["items"] == []
+        assert data["total"] == 5
+
+    def test_no_match_returns_zero_total(self):
+        """Given: 매칭 없음 / Then: total=0"""
+        response = client.get("/api/scanner", params={"q": "존재하지않는종목명"})
+
+        assert response.json() == {"items": [], "total": 0, "page": 1, "page_size": 20}
@@ -309,6 +309,41 @@ class TestSettingsIntegration:
         assert delete_response.status_code == 200
 
 
+class TestApiKeysFileCache:
+    """api-keys.json 파싱 캐시 테스트"""
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        """Given: 변경 없는 api-keys.json / When: 두 번 로드 / Then: JSON 파싱은 1회, 복사본 반환"""
+        import json
+        from app.routers import settings as settings_router
+
+        keys_path = tmp_path / "api-keys.json"
+        keys_path.write_text(json.dumps({"NAVER_CLIENT_ID": "a"}), encoding="utf-8")
+
+        with patch.object(settings_router, "_get_api_keys_path", return_value=str(keys_path)), \
+                patch.object(settings_router, "_api_keys_cache", None), \
+                patch.object(settings_router.json, "load", wraps=json.load) as mock_load:
+            first = settings_router._load_api_keys()
+            first["NAVER_CLIENT_ID"] = "mutated"
+            second = settings_router._load_api_keys()
+
+        assert mock_load.call_count == 1
+        assert second == {"NAVER_CLIENT_ID": "a"}
+
+    def test_save_invalidates_cache(self, tmp_path):
+        """Given: 캐시된 키 / When: _save_api_keys / Then: 다음 로드는 새 내용"""
+        from app.routers import settings as settings_router
+
+        keys_path = tmp_path / "api-keys.json"
+
+        with patch.object(settings_router, "_get_api_keys_path", return_value=str(keys_path)), \
+                patch.object(settings_router, "_api_keys_cache", None):
+            settings_router._save_api_keys({"NAVER_CLIENT_ID": "a"})
+            assert settings_router._load_api_keys() == {"NAVER_CLIENT_ID": "a"}
+            settings_router._save_api_keys({"NAVER_CLIENT_ID": "b"})
+            assert settings_router._load_api_keys() == {"NAVER_CLIENT_ID": "b"}
+
+
 class TestErrorHandling:
     """Tests for error handling"""
 
@@ -4,6 +4,7 @@ Tests for stocks_manager utility
 Tests for stocks.json file management, validation, and database synchronization.
 """
 
+import os
 import pytest
 import json
 import tempfile
@@ -63,6 +64,96 @@ class TestLoadStocks:
         assert stocks["TEST01"]["name"] == "테스트 ETF"
         assert stocks["TEST01"]["type"] == "ETF"
 
+    def test_load_stocks_returns_writable_copy(self, temp_stocks_file):
+        """Test mutating load_stocks() result does not touch the read-only Config cache"""
+        # Given
+        stocks = stocks_manager.load_stocks()
+
+        # When: 복사본에서 종목 삭제
+        del stocks["TEST01"]
+
+        # Then: Config 캐시는 그대로이며 직접 쓰기는 거부됨
+        config = Config.get_stock_config()
+        assert "TEST01" in config
+        with pytest.raises(TypeError):
+            config["TEST02"] = {}
+
+    def test_stock_entries_are_read_only(self, temp_stocks_file):
+        """Test get_stock_info() entries cannot be mutated in place"""
+        info = Config.get_stock_info("TEST01")
+
+        with pytest.raises(TypeError):
+            info["name"] = "변경"
+        with pytest.raises(AttributeError):
+            info["relevance_keywords"].append("추가")
+
+        # load_stocks() 복사본은 수정 가능하며 캐시에 영향 없음
+        stocks = stocks_manager.load_stocks()
+        stocks["TEST01"]["relevance_keywords"].append("추가")
+        assert Config.get_stock_info("TEST01")["relevance_keywords"] == ("테스트", "ETF")
+
+
+class TestReloadStockConfig:
+    """Tests for Config.reload_stock_config() mtime check"""
+
+    def test_reload_skips_parse_when_file_unchanged(self, temp_stocks_file):
+        """Test reload returns cached config without json.load if file is unchanged"""
+        # Given: 캐시가 채워진 상태
+        first = Config.get_stock_config()
+
+        # When: 파일 변경 없이 reload
+        with patch('app.config.json.load') as mock_load:
+            reloaded = Config.reload_stock_config()
+
+        # Then: 재파싱 없이 같은 캐시 반환
+        mock_load.assert_not_called()
+        assert reloaded is first
+
+    def test_reload_parses_when_file_changed(self, temp_stocks_file):
+        """Test reload picks up changes written to stocks.json"""
+        # Given: 캐시가 채워진 상태
+        Config.get_stock_config()
+
+        # When: 파일 내용 변경 후 reload
+        with open(temp_stocks_file, 'w', encoding='utf-8') as f:
+            json.dump({"TEST02": {"name": "변경됨", "type": "STOCK"}}, f, ensure_ascii=False)
+        reloaded = Config.reload_stock_config()
+
+        # Then: 새 내용 반영
+        assert "TEST02" in reloaded
+        assert "TEST01" not in reloaded
+
+    def test_reload_parses_after_same_size_save(self, temp_stocks_file):
+        """Test reload picks up save_stocks() even if mtime/size are unchanged"""
+        # Given: 두 종목이 캐시된 상태
+        stocks_manager.save_stocks({"TEST01": {"name": "A"}, "TEST02": {"name": "B"}})
+        Config.reload_stock_config()
+        stat = Path(temp_stocks_file).stat()
+
+        # When: 순서만 바꿔 저장 (크기 동일) 후 mtime을 그대로 되돌림
+        stocks_manager.save_stocks({"TEST02": {"name": "B"}, "TEST01": {"name": "A"}})
+        os.utime(temp_stocks_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        reloaded = Config.reload_stock_config()
+
+        # Then: 새 순서 반영
+        assert list(reloaded) == ["TEST02", "TEST01"]
+
+    def test_accessor_caches_follow_reload(self, temp_stocks_file):
+        """Test get_all_tickers/get_stock_info reflect a reloaded stocks.json"""
+        # Given: 접근자 캐시가 채워진 상태
+        assert Config.get_all_tickers() == ["TEST01"]
+        assert Config.get_stock_info("TEST01")["name"] == "테스트 ETF"
+
+        # When: 파일 내용 변경 후 reload
+        with open(temp_stocks_file, 'w', encoding='utf-8') as f:
+            json.dump({"TEST02": {"name": "변경됨", "type": "STOCK"}}, f, ensure_ascii=False)
+        Config.reload_stock_config()
+
+        # Then: 캐시된 접근자도 새 내용 반영
+        assert Config.get_all_tickers() == ["TEST02"]
+        assert Config.get_stock_info("TEST01") is None
+        assert Config.get_stock_info("TEST02")["name"] == "변경됨"
+
 
 class TestSaveStocks:
     """Tests for save_stocks() function"""
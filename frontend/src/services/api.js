@@ -57,6 +57,12 @@ api.interceptors.response.use(
         case 404:
           error.message = data.detail || ERROR_MESSAGES.NOT_FOUND
           break
+        case 422:
+          // Pydantic 검증 오류: detail이 [{ msg, loc, ... }] 배열
+          error.message = Array.isArray(data.detail)
+            ? data.detail.map((d) => d.msg).join(', ')
+            : data.detail || ERROR_MESSAGES.BAD_REQUEST
+          break
         case 500:
           error.message = data.detail || ERROR_MESSAGES.SERVER_ERROR
           break